@@ -1,17 +1,30 @@
 from abc import ABC, abstractmethod
-from langchain_openai import ChatOpenAI
 from langchain.prompts import ChatPromptTemplate
 import json
-from typing import Any, Dict
+import time
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, List, Tuple
+from config import OPENAI_MODEL
+from utils.llm_cache import LLMResponseCache, get_llm_cache
+from utils.llm_client import LLMBackend, ResilientLLMClient, get_llm_backend
+from utils.token_counter import compact_json, get_token_counter
+from utils.token_usage import record_usage
 
 class BaseAgent(ABC):
     """Base class for all documentation agents"""
     
-    def __init__(self, temperature: float = 0.5):
-        self.llm = ChatOpenAI(
-            model="gpt-4-turbo-preview",
-            temperature=temperature
-        )
+    # Inputs that may be compacted or truncated, in order, when a prompt exceeds the token budget
+    budget_fields: Tuple[str, ...] = ('content',)
+    
+    def __init__(self, temperature: float = 0.5, token_budget: int = None, timeout: float = None,
+                 backend: LLMBackend = None):
+        self.model = OPENAI_MODEL
+        self.temperature = temperature
+        self.token_budget = token_budget
+        self.token_counter = get_token_counter(self.model)
+        # Chat models and their HTTP connections are shared by every agent in the process
+        self.backend = backend or get_llm_backend()
+        self.llm = self.backend.chat_model(self.__class__.__name__, self.model, temperature, timeout)
+        self.client = ResilientLLMClient(self.llm, self.token_counter, timeout=timeout)
         self._setup_agent()
     
     @abstractmethod
@@ -39,20 +52,191 @@ class BaseAgent(ABC):
     def execute(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
         """Execute the agent with input data"""
         try:
-            # Format the prompt with input data
-            formatted_prompt = self.prompt.format(**input_data)
+            # Format the prompt with input data, within the token budget
+            formatted_prompt, tokens_in, truncated = self._format_prompt(input_data)
+            
+            # Serve repeated prompts from the response cache
+            cache_key = self._cache_key(formatted_prompt)
+            cached_response = self._get_cached_response(cache_key)
+            if cached_response is not None:
+                self._record_usage(tokens_in, cached_response, truncated, cached=True)
+                return self._parse_response(cached_response, input_data)
+            
+            # Get response from LLM
+            started = time.perf_counter()
+            response = self.client.invoke(formatted_prompt, tokens_in)
+            self._record_usage(tokens_in, response, truncated, latency=time.perf_counter() - started)
+            
+            # Parse response
+            return self._parse_and_cache(cache_key, response, input_data)
+            
+        except Exception as e:
+            return self._error_result(e)
+    
+    async def aexecute(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Execute the agent with input data without blocking the event loop"""
+        try:
+            # Format the prompt with input data, within the token budget
+            formatted_prompt, tokens_in, truncated = self._format_prompt(input_data)
+            
+            # Serve repeated prompts from the response cache
+            cache_key = self._cache_key(formatted_prompt)
+            cached_response = self._get_cached_response(cache_key)
+            if cached_response is not None:
+                self._record_usage(tokens_in, cached_response, truncated, cached=True)
+                return self._parse_response(cached_response, input_data)
             
             # Get response from LLM
-            response = self.llm.invoke(formatted_prompt)
+            started = time.perf_counter()
+            response = await self.client.ainvoke(formatted_prompt, tokens_in)
+            self._record_usage(tokens_in, response, truncated, latency=time.perf_counter() - started)
             
             # Parse response
-            return self._parse_response(response.content, input_data)
+            return self._parse_and_cache(cache_key, response, input_data)
+            
+        except Exception as e:
+            return self._error_result(e)
+    
+    def stream(self, input_data: Dict[str, Any]) -> Iterator[str]:
+        """
+        Yield the raw LLM response in chunks as it is generated
+        
+        A cached response is yielded whole. Parse the joined chunks with
+        _parse_response once the stream is exhausted; the response is cached
+        and its token usage recorded at that point.
+        """
+        formatted_prompt, tokens_in, truncated = self._format_prompt(input_data)
+        
+        cache_key = self._cache_key(formatted_prompt)
+        cached_response = self._get_cached_response(cache_key)
+        if cached_response is not None:
+            self._record_usage(tokens_in, cached_response, truncated, cached=True)
+            yield cached_response
+            return
+        
+        parts = []
+        started = time.perf_counter()
+        first_chunk = None
+        for chunk in self.client.stream(formatted_prompt, tokens_in):
+            if first_chunk is None:
+                first_chunk = time.perf_counter() - started
+            parts.append(chunk)
+            yield chunk
+        
+        response = ''.join(parts)
+        self._record_usage(tokens_in, response, truncated,
+                           latency=time.perf_counter() - started, first_chunk=first_chunk)
+        self._parse_and_cache(cache_key, response, input_data)
+    
+    async def astream(self, input_data: Dict[str, Any]) -> AsyncIterator[str]:
+        """Async version of stream"""
+        formatted_prompt, tokens_in, truncated = self._format_prompt(input_data)
+        
+        cache_key = self._cache_key(formatted_prompt)
+        cached_response = self._get_cached_response(cache_key)
+        if cached_response is not None:
+            self._record_usage(tokens_in, cached_response, truncated, cached=True)
+            yield cached_response
+            return
+        
+        parts = []
+        started = time.perf_counter()
+        first_chunk = None
+        async for chunk in self.client.astream(formatted_prompt, tokens_in):
+            if first_chunk is None:
+                first_chunk = time.perf_counter() - started
+            parts.append(chunk)
+            yield chunk
+        
+        response = ''.join(parts)
+        self._record_usage(tokens_in, response, truncated,
+                           latency=time.perf_counter() - started, first_chunk=first_chunk)
+        self._parse_and_cache(cache_key, response, input_data)
+    
+    async def aexecute_stream(self, input_data: Dict[str, Any], on_chunk: Callable[[str], None]) -> Dict[str, Any]:
+        """Execute the agent, passing each response chunk to on_chunk, and parse the complete response"""
+        try:
+            parts = []
+            async for chunk in self.astream(input_data):
+                parts.append(chunk)
+                on_chunk(chunk)
+            
+            return self._parse_response(''.join(parts), input_data)
             
         except Exception as e:
-            return {
-                "error": str(e),
-                "agent": self.__class__.__name__
-            }
+            return self._error_result(e)
+    
+    def _format_prompt(self, input_data: Dict[str, Any]) -> Tuple[str, int, List[str]]:
+        """
+        Format the prompt, shrinking budget_fields until it fits the token budget
+        
+        JSON inputs are first re-serialized without indentation; fields that
+        still do not fit are truncated.
+        
+        Returns:
+            The formatted prompt, its token count and the names of shrunk fields
+        """
+        formatted_prompt = self.prompt.format(**input_data)
+        tokens = self.token_counter.count(formatted_prompt)
+        shrunk = []
+        
+        for field in self.budget_fields:
+            if not self.token_budget or tokens <= self.token_budget:
+                break
+            
+            value = input_data.get(field)
+            if not isinstance(value, str) or not value:
+                continue
+            
+            compacted = compact_json(value)
+            excess = tokens - self.token_budget - (self.token_counter.count(value) - self.token_counter.count(compacted))
+            if excess > 0:
+                compacted = self.token_counter.truncate(compacted, self.token_counter.count(compacted) - excess)
+            
+            input_data = {**input_data, field: compacted}
+            formatted_prompt = self.prompt.format(**input_data)
+            tokens = self.token_counter.count(formatted_prompt)
+            shrunk.append(field)
+        
+        return formatted_prompt, tokens, shrunk
+    
+    def _record_usage(self, tokens_in: int, response: str, truncated: List[str], cached: bool = False,
+                      latency: float = None, first_chunk: float = None):
+        """Record the call's token usage and LLM latency on the active usage collector"""
+        record_usage(
+            self.__class__.__name__, tokens_in, self.token_counter.count(response),
+            cached=cached, budget=self.token_budget, truncated=truncated,
+            latency=round(latency, 4) if latency is not None else None,
+            first_chunk=round(first_chunk, 4) if first_chunk is not None else None
+        )
+    
+    def _cache_key(self, formatted_prompt: str) -> str:
+        """Build the response cache key for a formatted prompt"""
+        # Responses from other backends never mix with the model's real ones
+        model = self.model if self.backend.name == 'openai' else f"{self.backend.name}:{self.model}"
+        return LLMResponseCache.make_key(self.__class__.__name__, model, self.temperature, formatted_prompt)
+    
+    def _get_cached_response(self, cache_key: str):
+        """Return a cached LLM response, or None if caching is disabled or missed"""
+        cache = get_llm_cache()
+        return cache.get(cache_key) if cache else None
+    
+    def _parse_and_cache(self, cache_key: str, response: str, input_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Parse a fresh LLM response and cache it unless parsing reported an error"""
+        result = self._parse_response(response, input_data)
+        
+        cache = get_llm_cache()
+        if cache and not (isinstance(result, dict) and 'error' in result):
+            cache.set(cache_key, self.__class__.__name__, response)
+        
+        return result
+    
+    def _error_result(self, error: Exception) -> Dict[str, Any]:
+        """Build the result returned when the agent fails"""
+        return {
+            "error": str(error),
+            "agent": self.__class__.__name__
+        }
     
     def _parse_response(self, response: str, input_data: Dict[str, Any]) -> Dict[str, Any]:
         """Parse the LLM response. Override in subclasses if needed."""
@@ -1,12 +1,14 @@
 from .base_agent import BaseAgent
 import json
 from typing import Dict, Any
+from config import AGENT_TIMEOUTS, AGENT_TOKEN_BUDGETS
 
 class DocumentationAnalyzerAgent(BaseAgent):
     """Agent 1: Analyzes documentation for improvement opportunities"""
     
     def __init__(self):
-        super().__init__(temperature=0.3)
+        super().__init__(temperature=0.3, token_budget=AGENT_TOKEN_BUDGETS["analyzer"],
+                         timeout=AGENT_TIMEOUTS["analyzer"])
     
     def _get_system_prompt(self) -> str:
         return """You are an expert documentation analyst with deep knowledge of technical writing, Microsoft style guide, and user experience principles.
@@ -1,11 +1,15 @@
 from .base_agent import BaseAgent
 from typing import Dict, Any
+from config import AGENT_TIMEOUTS, AGENT_TOKEN_BUDGETS
 
 class DocumentationRewriterAgent(BaseAgent):
     """Agent 2: Rewrites documentation with improvements integrated"""
     
+    budget_fields = ('suggestions',)
+    
     def __init__(self):
-        super().__init__(temperature=0.7)
+        super().__init__(temperature=0.7, token_budget=AGENT_TOKEN_BUDGETS["rewriter"],
+                         timeout=AGENT_TIMEOUTS["rewriter"])
     
     def _get_system_prompt(self) -> str:
         return """You are an expert technical writer specializing in creating clear, engaging, and effective documentation.
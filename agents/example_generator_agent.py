@@ -1,12 +1,14 @@
 from .base_agent import BaseAgent
 import json
 from typing import Dict, Any
+from config import AGENT_TIMEOUTS, AGENT_TOKEN_BUDGETS
 
 class ExampleGeneratorAgent(BaseAgent):
     """Agent 5: Generates intelligent, contextual examples for documentation"""
     
     def __init__(self):
-        super().__init__(temperature=0.8)
+        super().__init__(temperature=0.8, token_budget=AGENT_TOKEN_BUDGETS["example_generator"],
+                         timeout=AGENT_TIMEOUTS["example_generator"])
     
     def _get_system_prompt(self) -> str:
         return """You are a technical writing expert who specializes in creating relevant, realistic examples that enhance understanding.
@@ -1,12 +1,14 @@
 from .base_agent import BaseAgent
 import json
 from typing import Dict, Any
+from config import AGENT_TIMEOUTS, AGENT_TOKEN_BUDGETS
 
 class LocalizationReadinessAgent(BaseAgent):
     """Agent 4: Detects localization issues and provides international-friendly suggestions"""
     
     def __init__(self):
-        super().__init__(temperature=0.4)
+        super().__init__(temperature=0.4, token_budget=AGENT_TOKEN_BUDGETS["localization"],
+                         timeout=AGENT_TIMEOUTS["localization"])
     
     def _get_system_prompt(self) -> str:
         return """You are a localization expert who specializes in identifying content that may be difficult to translate or culturally inappropriate for international audiences.
@@ -1,12 +1,14 @@
 from .base_agent import BaseAgent
 import json
 from typing import Dict, Any
+from config import AGENT_TIMEOUTS, AGENT_TOKEN_BUDGETS
 
 class PersonaFeedbackAgent(BaseAgent):
     """Agent 3: Provides persona-based feedback and adaptations"""
     
     def __init__(self):
-        super().__init__(temperature=0.6)
+        super().__init__(temperature=0.6, token_budget=AGENT_TOKEN_BUDGETS["persona"],
+                         timeout=AGENT_TIMEOUTS["persona"])
     
     def _get_system_prompt(self) -> str:
         return """You are a user experience expert who specializes in adapting content for different professional personas.
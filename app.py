@@ -1,14 +1,16 @@
 import streamlit as st
 import json
 import os
+import time
 from datetime import datetime
 import tempfile
 
 # Import our custom modules
-from utils.content_scraper import ContentScraper
-from orchestrator.agent_orchestrator import AgentOrchestrator
+from orchestrator.job_queue import JobQueue
+from orchestrator.job_worker import WorkerPool
 from utils.pdf_generator import PDFGenerator
-from config import PERSONAS
+from utils.result_cache import ResultCache
+from config import PERSONAS, JOB_POLL_SECONDS, JOB_WORKERS, LLM_BACKEND
 
 # Page configuration
 st.set_page_config(
@@ -425,7 +427,7 @@ def main():
         st.sidebar.info(f"**{persona}**: {persona_info['description']}")
     
     # Main content area
-    if not api_key:
+    if not api_key and LLM_BACKEND == 'openai':
         st.warning("⚠️ Please enter your OpenAI API key in the sidebar to continue.")
         st.info("You can get your API key from [OpenAI's website](https://platform.openai.com/api-keys)")
         return
@@ -470,9 +472,11 @@ def main():
             if st.button("📥 Download PDF Report"):
                 download_pdf()
     
-    # Processing
+    # Processing runs in background workers; a rerun or refresh reconnects to the running job
     if process_btn:
         process_documentation(url, persona)
+    elif active_job_id():
+        follow_job(active_job_id())
     
     # Display results
     if 'processing_results' in st.session_state and st.session_state.processing_results is not None:
@@ -481,63 +485,116 @@ def main():
         # Show a message if processing was just started
         st.info("⏳ Processing has started. Results will appear above once analysis is complete.")
 
+# Heavyweight objects are built once per server process and shared by every session
+
+@st.cache_resource(show_spinner=False)
+def load_worker_pool() -> WorkerPool:
+    """Background workers shared by every session, whatever its API key (none with JOB_WORKERS=0)"""
+    return WorkerPool(workers=JOB_WORKERS).start()
+
+@st.cache_resource(show_spinner=False)
+def load_job_queue() -> JobQueue:
+    """Shared connection to the job queue"""
+    return JobQueue()
+
+@st.cache_resource(show_spinner=False)
+def load_pdf_generator() -> PDFGenerator:
+    """Shared PDF generator; it keeps no state between reports"""
+    return PDFGenerator()
+
+@st.cache_resource(show_spinner=False)
+def load_result_cache() -> ResultCache:
+    """Results per (url, persona), shared across sessions until they expire"""
+    return ResultCache()
+
 def process_documentation(url: str, persona: str):
-    """Process documentation through all agents"""
+    """Submit documentation for processing by the background workers"""
+    
+    # Another session may have processed this page for this persona recently
+    cached_results = load_result_cache().get((url, persona))
+    if cached_results is not None:
+        st.session_state.processing_results = cached_results
+        st.rerun()
+    
+    api_key = os.environ.get("OPENAI_API_KEY", "")
+    pool = load_worker_pool().register_key(api_key)
+    job_id = load_job_queue().submit(url, persona, pool)
+    
+    # Remember the job in the URL so a page refresh reconnects to it
+    st.session_state.job_id = job_id
+    st.experimental_set_query_params(job=job_id)
+    
+    follow_job(job_id)
+
+def active_job_id():
+    """Return the job this session is waiting for, from the session or the page URL"""
+    if st.session_state.get('job_id'):
+        return st.session_state.job_id
+    
+    job_ids = st.experimental_get_query_params().get('job')
+    return job_ids[0] if job_ids else None
+
+def follow_job(job_id: str):
+    """Show the progress of a job until it finishes; interacting with the page leaves it running"""
+    job_queue = load_job_queue()
     
-    # Progress tracking
     progress_bar = st.progress(0)
     status_text = st.empty()
-    
-    try:
-        # Step 1: Scrape content
-        status_text.text("🔍 Scraping documentation content...")
-        progress_bar.progress(10)
-        
-        scraper = ContentScraper()
-        content_data = scraper.scrape_url(url)
-        
-        if 'error' in content_data:
-            st.error(f"❌ Failed to scrape content: {content_data['error']}")
+    preview = st.empty()
+    last_event = 0
+    
+    while True:
+        job = job_queue.get(job_id)
+        if job is None:
+            forget_job()
+            st.error("❌ This job no longer exists. Please run the analysis again.")
             return
         
-        # Step 2: Initialize orchestrator
-        status_text.text("🤖 Initializing AI agents...")
-        progress_bar.progress(20)
-        
-        orchestrator = AgentOrchestrator()
+        for event in job_queue.events(job_id, after=last_event):
+            last_event = event['seq']
+            status_text.text(event['message'])
+            progress_bar.progress(min(int(event['progress'] * 100), 100))
         
-        # Step 3: Process through agents
-        status_text.text("🧠 Processing with AI agents...")
-        progress_bar.progress(30)
+        if job['status'] == 'queued':
+            status_text.text("⏳ Waiting for a worker...")
+        if job['preview']:
+            preview.markdown(f"#### 📝 Improved Content (live)\n\n{job['preview']}")
         
-        # This will take a while, so we'll update progress as we go
-        results = orchestrator.process_documentation(content_data, persona)
-        
-        # Check if processing was successful
-        if not results or 'error' in results:
-            st.error(f"❌ Processing failed: {results.get('error', 'Unknown error')}")
+        if job['status'] == 'failed':
+            forget_job()
+            progress_bar.progress(0)
+            status_text.text("❌ Processing failed")
+            st.error(f"❌ {job['error']}")
             return
         
-        progress_bar.progress(100)
-        status_text.text("✅ Processing complete!")
-        
-        # Store results in session state
-        st.session_state.processing_results = results
+        if job['status'] == 'done':
+            break
         
-        # Show success message
-        st.markdown("""
-        <div class="status-success">
-            <strong>🎉 Success!</strong> Your documentation has been analyzed and improved by our AI agents.
-        </div>
-        """, unsafe_allow_html=True)
-        
-        # Auto-scroll to results (rerun to show results)
-        st.rerun()
-        
-    except Exception as e:
-        st.error(f"❌ Processing failed: {str(e)}")
-        status_text.text("❌ Processing failed")
-        progress_bar.progress(0)
+        time.sleep(JOB_POLL_SECONDS)
+    
+    forget_job()
+    progress_bar.progress(100)
+    status_text.text("✅ Processing complete!")
+    
+    # Store results in session state and share them with other sessions
+    results = job['result']
+    st.session_state.processing_results = results
+    load_result_cache().put((job['url'], job['persona']), results)
+    
+    # Show success message
+    st.markdown("""
+    <div class="status-success">
+        <strong>🎉 Success!</strong> Your documentation has been analyzed and improved by our AI agents.
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Auto-scroll to results (rerun to show results)
+    st.rerun()
+
+def forget_job():
+    """Stop following the current job"""
+    st.session_state.job_id = None
+    st.experimental_set_query_params()
 
 def display_results():
     """Display processing results in organized tabs"""
@@ -1064,7 +1121,10 @@ def display_readability_tab(results):
     # AI insights
     ai_insights = readability_data.get('ai_insights') or {}
     if ai_insights and not ai_insights.get('error'):
-        st.subheader("🧠 AI Readability Insights")
+        if ai_insights.get('source') == 'rules':
+            st.subheader("🧠 Readability Insights")
+        else:
+            st.subheader("🧠 AI Readability Insights")
         
         assessment = ai_insights.get('overall_assessment') or {}
         if assessment:
@@ -1128,7 +1188,7 @@ def download_pdf():
     
     try:
         # Generate PDF
-        pdf_generator = PDFGenerator()
+        pdf_generator = load_pdf_generator()
         
         with st.spinner("Generating PDF report..."):
             # Create temporary file
@@ -1165,5 +1225,8 @@ def download_pdf():
 if 'processing_results' not in st.session_state:
     st.session_state.processing_results = None
 
+if 'job_id' not in st.session_state:
+    st.session_state.job_id = None
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Batch runner for the AI Documentation Assistant
+
+Processes a list of URLs or a whole sitemap and streams one JSON record per
+document to a JSONL file. Re-running with the same output file resumes an
+interrupted run.
+
+Examples:
+    python batch.py --sitemap https://example.com/sitemap.xml --output audit.jsonl
+    python batch.py --urls-file urls.txt --persona Developer --workers 16
+    python batch.py https://example.com/docs/a https://example.com/docs/b
+    python batch.py --sitemap sitemap.xml --output audit2.jsonl --previous audit.jsonl
+    python batch.py --sitemap sitemap.xml --output metrics.jsonl --metrics-only
+    python batch.py --urls-file urls.txt --progress
+"""
+
+import argparse
+import sys
+
+from config import PERSONAS, BATCH_MAX_WORKERS
+
+
+def parse_args():
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description="Process many documentation pages in one run")
+    parser.add_argument('urls', nargs='*', help="Documentation URLs to process")
+    parser.add_argument('--urls-file', help="Text file with one URL per line")
+    parser.add_argument('--sitemap', help="Path or URL of a sitemap.xml")
+    parser.add_argument('--output', default='outputs/batch_results.jsonl', help="JSONL file for results")
+    parser.add_argument('--persona', default='Marketer', choices=list(PERSONAS.keys()), help="Target persona")
+    parser.add_argument('--previous', help="Results JSONL of an earlier run; unchanged pages reuse it")
+    parser.add_argument('--workers', type=int, default=BATCH_MAX_WORKERS, help="Documents processed at once")
+    parser.add_argument('--metrics-only', action='store_true',
+                        help="Only score readability on a process pool; no LLM calls")
+    parser.add_argument('--progress', action='store_true',
+                        help="Print the duration and token usage of every agent step as it finishes")
+    return parser.parse_args()
+
+
+def print_step(event):
+    """Print a finished agent step"""
+    if event['event'] != 'step_end':
+        return
+
+    cache = f", {event['cached_calls']} cached" if event['cached_calls'] else ""
+    reused = f", {event['reused_sections']}/{event['sections']} sections reused" if event['reused_sections'] else ""
+    print(f"   ⏱️ {event['url']} {event['step']}: {event['duration']:.1f}s, "
+          f"{event['tokens_in']}→{event['tokens_out']} tokens{cache}{reused}")
+
+
+def main():
+    """Main batch function"""
+    args = parse_args()
+
+    from utils.url_sources import load_url_list, load_sitemap
+
+    urls = list(args.urls)
+    if args.urls_file:
+        urls.extend(load_url_list(args.urls_file))
+    if args.sitemap:
+        urls.extend(load_sitemap(args.sitemap))
+
+    if not urls:
+        print("❌ No URLs given. Pass URLs, --urls-file or --sitemap.")
+        sys.exit(1)
+
+    from orchestrator.batch_processor import BatchProcessor
+
+    mode = " (readability metrics only)" if args.metrics_only else ""
+    print(f"🚀 Processing {len(urls)} URLs with {args.workers} workers{mode}")
+    print(f"Results: {args.output}")
+    print("=" * 40)
+
+    on_progress = print_step if args.progress else None
+    processor = BatchProcessor(max_workers=args.workers, metrics_only=args.metrics_only, on_progress=on_progress)
+    summary = processor.run(urls, args.output, args.persona, args.previous)
+
+    print("=" * 40)
+    print(f"✅ Processed: {summary['processed']}  🔁 Unchanged: {summary['unchanged']}  "
+          f"❌ Failed: {summary['failed']}  ⏭️ Skipped: {summary['skipped']}")
+
+    syllables = summary['syllable_cache']
+    print(f"📚 Syllable cache: {syllables['hit_rate']:.1%} hit rate over {syllables['hits'] + syllables['misses']} words")
+
+    if summary['failed']:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
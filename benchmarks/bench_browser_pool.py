@@ -0,0 +1,61 @@
+"""
+Playwright fallback benchmark against the local fixture server
+
+Compares launching a fresh Chromium per page, as the scraper used to, with
+the shared BrowserPool. Requires `python -m playwright install chromium`.
+
+Usage:
+    python -m benchmarks.bench_browser_pool --pages 50
+"""
+
+import argparse
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from playwright.sync_api import sync_playwright
+
+from benchmarks.fixture_server import FixtureServer
+from utils.browser_pool import BrowserPool
+
+
+def fetch_with_fresh_browser(url: str) -> str:
+    """Launch, load and close a browser for a single page"""
+    with sync_playwright() as p:
+        browser = p.chromium.launch(headless=True)
+        page = browser.new_page()
+        page.goto(url, wait_until='networkidle')
+        html_content = page.content()
+        browser.close()
+        return html_content
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--pages', type=int, default=50)
+    parser.add_argument('--pool-size', type=int, default=4)
+    args = parser.parse_args()
+
+    with FixtureServer() as server:
+        urls = [server.page_url(i) for i in range(args.pages)]
+
+        start = time.perf_counter()
+        for url in urls:
+            fetch_with_fresh_browser(url)
+        elapsed = time.perf_counter() - start
+        print(f"{'fresh browser per page':<30} {args.pages / elapsed:8.2f} pages/s  ({elapsed:.2f}s)")
+
+        pool = BrowserPool(size=args.pool_size)
+        try:
+            # Exclude the one-off browser launch from the steady-state number
+            pool.fetch_html(urls[0])
+            start = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=args.pool_size) as executor:
+                list(executor.map(pool.fetch_html, urls))
+            elapsed = time.perf_counter() - start
+            print(f"{'browser pool':<30} {args.pages / elapsed:8.2f} pages/s  ({elapsed:.2f}s)")
+        finally:
+            pool.close()
+
+
+if __name__ == "__main__":
+    main()
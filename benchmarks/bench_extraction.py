@@ -0,0 +1,56 @@
+"""
+HTML extraction throughput benchmark
+
+Runs the BeautifulSoup + html2text path and the single-pass lxml extractor
+over a corpus of saved HTML pages and reports pages/second and MB/second.
+
+Usage:
+    python -m benchmarks.bench_extraction
+    python -m benchmarks.bench_extraction --corpus path/to/saved/pages --repeat 5
+"""
+
+import argparse
+import os
+import time
+
+from benchmarks.corpus import CORPUS_DIR, ensure_corpus
+from utils.content_scraper import ContentScraper
+
+
+def bench_engine(engine: str, pages, repeat: int) -> float:
+    """Return seconds spent extracting every page repeat times"""
+    scraper = ContentScraper(engine=engine, use_http_cache=False)
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for url, html_content in pages:
+            scraper._parse_html(html_content, url)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--corpus', default=CORPUS_DIR, help="Directory of saved .html pages")
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    pages = []
+    for path in ensure_corpus(args.corpus):
+        with open(path, 'rb') as f:
+            pages.append((f"file://{os.path.abspath(path)}", f.read()))
+
+    total_mb = sum(len(html_content) for _, html_content in pages) * args.repeat / 1e6
+    total_pages = len(pages) * args.repeat
+    print(f"{len(pages)} pages ({total_mb / args.repeat:.2f} MB) x {args.repeat}")
+
+    timings = {}
+    for engine in ('bs4', 'lxml'):
+        elapsed = bench_engine(engine, pages, args.repeat)
+        timings[engine] = elapsed
+        print(f"{engine:<6} {total_pages / elapsed:8.2f} pages/s  {total_mb / elapsed:7.2f} MB/s  ({elapsed:.2f}s)")
+
+    print(f"speedup: {timings['bs4'] / timings['lxml']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,309 @@
+"""
+End-to-end pipeline benchmark against the saved corpus and the fake LLM
+
+Runs every stage of the pipeline over each corpus page, from a 200-word
+page to a 50,000-word manual: content extraction, readability metrics, the
+orchestrator one document at a time and with documents processed
+concurrently, final output assembly and PDF rendering. Each stage and page
+size runs in a fresh process, so the reported peak RSS is its own. Results
+are compared with a stored baseline and regressions beyond the tolerance
+fail the run, as do baseline measurements that could not be repeated: a
+skipped stage, or one run with a different number of documents.
+
+LLM calls go to the fake backend with the rate limiter, response cache and
+section reuse disabled; set LLM_BACKEND and the FAKE_LLM_* variables to
+change that. Baselines are machine-specific: save one on the machine that
+runs the comparisons.
+
+Usage:
+    python -m benchmarks.bench_pipeline
+    python -m benchmarks.bench_pipeline --stages extract readability --repeat 20
+    python -m benchmarks.bench_pipeline --save-baseline
+"""
+
+import os
+
+# Must be set before config is imported, here and in the spawned stage processes
+for name, value in {
+    'LLM_BACKEND': 'fake',
+    'FAKE_LLM_LATENCY_SECONDS': '0.05',
+    'FAKE_LLM_TOKENS_PER_SECOND': '5000',
+    'LLM_REQUESTS_PER_MINUTE': '0',
+    'LLM_TOKENS_PER_MINUTE': '0',
+    'LLM_CACHE_ENABLED': 'false',
+    'INCREMENTAL_ANALYSIS_ENABLED': 'false',
+}.items():
+    os.environ.setdefault(name, value)
+
+import argparse
+import asyncio
+import json
+import math
+import multiprocessing
+import platform
+import re
+import resource
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List
+
+from benchmarks.corpus import CORPUS_DIR, ensure_corpus
+
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), 'baseline.json')
+STAGES = ['extract', 'readability', 'orchestrator_serial', 'orchestrator_concurrent', 'final_output', 'pdf']
+
+# Latency changes below this many seconds are noise, whatever their ratio
+MIN_LATENCY_DELTA = 0.002
+
+
+def percentile(samples: List[float], fraction: float) -> float:
+    """Nearest-rank percentile"""
+    ordered = sorted(samples)
+    return ordered[max(math.ceil(fraction * len(ordered)) - 1, 0)]
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of this process in MB"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak / (1024 * 1024 if sys.platform == 'darwin' else 1024)
+
+
+def word_count(path: str) -> int:
+    match = re.search(r'(\d+)_words', os.path.basename(path))
+    return int(match.group(1)) if match else 0
+
+
+def load_page(path: str) -> Dict[str, Any]:
+    """Extract a saved page into the content_data the orchestrator takes"""
+    from utils.content_scraper import ContentScraper
+
+    with open(path, 'rb') as f:
+        html_content = f.read()
+    return ContentScraper(use_http_cache=False)._parse_html(html_content, f"file://{os.path.abspath(path)}")
+
+
+def run_stage(stage: str, path: str, repeat: int) -> Dict[str, Any]:
+    """
+    Run one stage on one page repeat times in this process
+
+    Returns the p50 and p95 seconds per document, documents per second and
+    the process's peak RSS. Setup, such as the orchestrator run whose
+    results the output stages render, is not timed.
+    """
+    latencies = []
+
+    if stage == 'extract':
+        from utils.content_scraper import ContentScraper
+
+        with open(path, 'rb') as f:
+            html_content = f.read()
+        scraper = ContentScraper(use_http_cache=False)
+        url = f"file://{os.path.abspath(path)}"
+        started = time.perf_counter()
+        for _ in range(repeat):
+            call_started = time.perf_counter()
+            scraper._parse_html(html_content, url)
+            latencies.append(time.perf_counter() - call_started)
+        elapsed = time.perf_counter() - started
+
+    elif stage == 'readability':
+        from utils.readability_scorer import ReadabilityScorer
+
+        text = load_page(path)['text']
+        scorer = ReadabilityScorer()
+        started = time.perf_counter()
+        for _ in range(repeat):
+            call_started = time.perf_counter()
+            scorer.score(text)
+            latencies.append(time.perf_counter() - call_started)
+        elapsed = time.perf_counter() - started
+
+    elif stage in ('orchestrator_serial', 'orchestrator_concurrent'):
+        from orchestrator.agent_orchestrator import AgentOrchestrator
+
+        content_data = load_page(path)
+        documents = [{**content_data, 'url': f"{content_data['url']}#{index}"} for index in range(repeat)]
+        orchestrator = AgentOrchestrator()
+        started = time.perf_counter()
+        if stage == 'orchestrator_serial':
+            all_results = [orchestrator.process_documentation(document, "Marketer") for document in documents]
+        else:
+            all_results = asyncio.run(orchestrator.aprocess_many(documents, "Marketer"))
+        elapsed = time.perf_counter() - started
+
+        for results in all_results:
+            if results.get('error'):
+                raise RuntimeError(f"Orchestrator failed: {results['error']}")
+            latencies.append(results['timings']['total'])
+
+    elif stage == 'final_output':
+        from orchestrator.agent_orchestrator import AgentOrchestrator
+
+        orchestrator = AgentOrchestrator()
+        results = orchestrator.process_documentation(load_page(path), "Marketer")
+        started = time.perf_counter()
+        for _ in range(repeat):
+            call_started = time.perf_counter()
+            orchestrator._prepare_final_output(results)
+            latencies.append(time.perf_counter() - call_started)
+        elapsed = time.perf_counter() - started
+
+    elif stage == 'pdf':
+        # Imports WeasyPrint, which needs the system Pango libraries
+        from orchestrator.agent_orchestrator import AgentOrchestrator
+        from utils.pdf_generator import PDFGenerator
+
+        results = AgentOrchestrator().process_documentation(load_page(path), "Marketer")
+        generator = PDFGenerator()
+        with tempfile.TemporaryDirectory() as output_dir:
+            started = time.perf_counter()
+            for index in range(repeat):
+                call_started = time.perf_counter()
+                generator.generate_pdf(results, os.path.join(output_dir, f"report_{index}.pdf"))
+                latencies.append(time.perf_counter() - call_started)
+            elapsed = time.perf_counter() - started
+
+    else:
+        raise ValueError(f"Unknown stage: {stage}")
+
+    # Per document processed; concurrent throughput still depends on how many run at once
+    return {
+        'docs': len(latencies),
+        'p50': round(percentile(latencies, 0.5), 5),
+        'p95': round(percentile(latencies, 0.95), 5),
+        'docs_per_sec': round(len(latencies) / elapsed, 3),
+        'peak_rss_mb': round(peak_rss_mb(), 1)
+    }
+
+
+def run_isolated(stage: str, path: str, repeat: int) -> Dict[str, Any]:
+    """Run a stage in a fresh spawned process"""
+    with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context('spawn')) as executor:
+        return executor.submit(run_stage, stage, path, repeat).result()
+
+
+def incomparable(results: Dict[str, Dict[str, Any]], baseline: Dict[str, Dict[str, Any]]) -> List[str]:
+    """Describe every baseline measurement that this run cannot be compared with"""
+    problems = []
+    for key, previous in baseline.items():
+        current = results.get(key)
+        if current is None:
+            problems.append(f"{key}: not measured (stage skipped)")
+        elif current['docs'] != previous['docs']:
+            problems.append(f"{key}: {current['docs']} documents, baseline has {previous['docs']} (use --repeat)")
+    return problems
+
+
+def compare(results: Dict[str, Dict[str, Any]], baseline: Dict[str, Dict[str, Any]],
+            tolerance: float) -> List[str]:
+    """Describe every measurement that got worse than the baseline by more than tolerance"""
+    regressions = []
+    for key, current in results.items():
+        previous = baseline.get(key)
+        if not previous or previous['docs'] != current['docs']:
+            continue
+
+        for metric in ('p50', 'p95'):
+            if (current[metric] > previous[metric] * (1 + tolerance)
+                    and current[metric] - previous[metric] > MIN_LATENCY_DELTA):
+                regressions.append(f"{key} {metric}: {previous[metric]:.4f}s -> {current[metric]:.4f}s")
+        if (current['docs_per_sec'] < previous['docs_per_sec'] / (1 + tolerance)
+                and 1 / current['docs_per_sec'] - 1 / previous['docs_per_sec'] > MIN_LATENCY_DELTA):
+            regressions.append(
+                f"{key} docs/s: {previous['docs_per_sec']:.2f} -> {current['docs_per_sec']:.2f}"
+            )
+        if current['peak_rss_mb'] > previous['peak_rss_mb'] * (1 + tolerance):
+            regressions.append(
+                f"{key} peak RSS: {previous['peak_rss_mb']:.1f} MB -> {current['peak_rss_mb']:.1f} MB"
+            )
+    return regressions
+
+
+def environment() -> Dict[str, Any]:
+    """Settings the numbers depend on, saved with the baseline"""
+    from config import SCRAPER_ENGINE
+
+    return {
+        'python': platform.python_version(),
+        'scraper_engine': SCRAPER_ENGINE,
+        'platform': platform.platform(),
+        'cpus': os.cpu_count(),
+        **{name: os.environ.get(name) for name in (
+            'LLM_BACKEND', 'FAKE_LLM_LATENCY_SECONDS', 'FAKE_LLM_TOKENS_PER_SECOND', 'FAKE_LLM_OUTPUT_TOKENS'
+        )}
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--corpus', default=CORPUS_DIR, help="Directory of saved .html pages")
+    parser.add_argument('--stages', nargs='+', choices=STAGES, default=STAGES)
+    parser.add_argument('--repeat', type=int, default=5, help="Documents per stage and page size")
+    parser.add_argument('--baseline', default=BASELINE_PATH, help="Baseline JSON file")
+    parser.add_argument('--save-baseline', action='store_true', help="Store these results as the baseline")
+    parser.add_argument('--tolerance', type=float, default=0.25, help="Allowed relative slowdown")
+    args = parser.parse_args()
+
+    pages = sorted(ensure_corpus(args.corpus), key=word_count)
+    print(f"{len(pages)} pages, {args.repeat} documents each, LLM backend {os.environ['LLM_BACKEND']}")
+    print(f"{'stage':<26} {'words':>7} {'p50 ms':>10} {'p95 ms':>10} {'docs/s':>10} {'peak RSS MB':>12}")
+
+    results = {}
+    skipped = []
+    for stage in args.stages:
+        for path in pages:
+            words = word_count(path)
+            try:
+                measured = run_isolated(stage, path, args.repeat)
+            except (ImportError, OSError) as e:
+                print(f"{stage:<26} {words:>7} skipped: {e.__class__.__name__}: {e}")
+                skipped.append(stage)
+                break
+
+            results[f"{stage}/{words}"] = measured
+            print(f"{stage:<26} {words:>7} {measured['p50'] * 1000:>10.2f} {measured['p95'] * 1000:>10.2f} "
+                  f"{measured['docs_per_sec']:>10.2f} {measured['peak_rss_mb']:>12.1f}")
+
+    if args.save_baseline:
+        if skipped:
+            print(f"❌ Not saving a baseline without stages {', '.join(skipped)}; "
+                  f"install their dependencies or leave them out with --stages")
+            sys.exit(1)
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump({'environment': environment(), 'results': results}, f, indent=2, sort_keys=True)
+            f.write('\n')
+        print(f"Baseline saved to {args.baseline}")
+        return
+
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}; run with --save-baseline to create one")
+        return
+
+    with open(args.baseline, encoding='utf-8') as f:
+        baseline = json.load(f)
+    if baseline.get('environment') != environment():
+        print("⚠️ Baseline was recorded with different settings or on another machine")
+
+    # Stages left out with --stages are not compared; selected stages that were skipped fail
+    selected = {key: value for key, value in baseline['results'].items()
+                if key.split('/')[0] in args.stages}
+    problems = incomparable(results, selected)
+    regressions = compare(results, selected, args.tolerance)
+    if regressions:
+        print(f"❌ {len(regressions)} regressions beyond {args.tolerance:.0%}:")
+        for regression in regressions:
+            print(f"  {regression}")
+    if problems:
+        print(f"⚠️ {len(problems)} baseline measurements could not be compared:")
+        for problem in problems:
+            print(f"  {problem}")
+    if regressions or problems:
+        sys.exit(1)
+    print(f"✅ No regressions beyond {args.tolerance:.0%}")
+
+
+if __name__ == "__main__":
+    main()
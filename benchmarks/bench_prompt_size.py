@@ -0,0 +1,89 @@
+"""
+Prompt size benchmark for inter-agent payloads
+
+Builds the rewriter and readability prompts for documents of several sizes,
+once with the old pretty-printed JSON payloads and once with the compact
+payloads, and reports characters and tokens for each.
+
+Usage:
+    python -m benchmarks.bench_prompt_size
+"""
+
+import argparse
+import json
+import random
+
+from benchmarks.corpus import CORPUS_SIZES
+from benchmarks.fixture_server import WORDS, generate_page
+from config import OPENAI_MODEL
+from utils.fast_extractor import FastContentExtractor
+from utils.payloads import analysis_for_rewriter, compact_dumps, paragraphs_for_interpretation
+from utils.readability_scorer import ReadabilityScorer
+from utils.token_counter import get_token_counter
+
+
+def sample_analysis(sections: int, seed: int) -> dict:
+    """Analyzer output shaped like a merge of per-section results, repeats included"""
+    rng = random.Random(seed)
+
+    def phrase(words: int = 8) -> str:
+        return ' '.join(rng.choice(WORDS) for _ in range(words)).capitalize()
+
+    def items(count: int) -> list:
+        # Sections often report the same issue; keep some repeats
+        pool = [phrase() for _ in range(max(count // 2, 1))]
+        return [rng.choice(pool) for _ in range(count)]
+
+    per_section = 3
+    return {
+        'overall_score': 6.4,
+        'readability': {'score': 6.0, 'issues': items(sections * per_section), 'suggestions': items(sections * per_section)},
+        'structure': {'score': 7.0, 'issues': items(sections * 2), 'suggestions': items(sections * 2)},
+        'completeness': {'score': 5.5, 'missing_elements': items(sections * 2), 'suggestions': items(sections * 2)},
+        'style_guide_adherence': {'score': 6.0, 'violations': items(sections * 2), 'improvements': items(sections * 2)},
+        'marketing_perspective': {'score': 5.0, 'value_clarity': items(sections), 'call_to_action': items(sections)},
+        'priority_fixes': items(sections * 3),
+        'detailed_suggestions': [
+            {
+                'section': phrase(3),
+                'issue': phrase(),
+                'suggestion': phrase(16),
+                'priority': rng.choice(['high', 'medium', 'low'])
+            }
+            for _ in range(sections * per_section)
+        ],
+        'sections_processed': sections
+    }
+
+
+def measure(counter, label: str, old: str, new: str):
+    """Print size before and after for one payload"""
+    old_tokens, new_tokens = counter.count(old), counter.count(new)
+    print(f"  {label:<22} {len(old):>8} -> {len(new):>7} chars   "
+          f"{old_tokens:>7} -> {new_tokens:>6} tokens  (-{1 - new_tokens / max(old_tokens, 1):.0%})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='*', default=CORPUS_SIZES, help="Document sizes in words")
+    args = parser.parse_args()
+
+    counter = get_token_counter(OPENAI_MODEL)
+    extractor = FastContentExtractor()
+    scorer = ReadabilityScorer()
+
+    for index, words in enumerate(args.sizes):
+        sections = max(words // 400, 1)
+        content = extractor.extract(generate_page(index, words, sections), f"page-{index}")['markdown']
+        scores = scorer.score(content)
+        analysis = sample_analysis(sections, index)
+
+        print(f"{words} words, {sections} sections, {len(scores['paragraph_analysis'])} scored paragraphs")
+        measure(counter, "rewriter suggestions", json.dumps(analysis, indent=2), analysis_for_rewriter(analysis))
+        measure(counter, "readability metrics", json.dumps(scores['metrics'], indent=2), compact_dumps(scores['metrics']))
+        measure(counter, "paragraph scores", json.dumps(scores['paragraph_analysis'], indent=2),
+                paragraphs_for_interpretation(scores['paragraph_analysis']))
+
+
+if __name__ == "__main__":
+    main()
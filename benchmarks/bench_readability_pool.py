@@ -0,0 +1,58 @@
+"""
+Metrics-only readability throughput benchmark
+
+Scores a synthetic corpus in-process and on the readability process pool at
+increasing worker counts, and reports documents/second for each.
+
+Usage:
+    python -m benchmarks.bench_readability_pool --docs 400 --words 3000
+"""
+
+import argparse
+import os
+import time
+
+from benchmarks.fixture_server import generate_page
+from utils.fast_extractor import FastContentExtractor
+from utils.readability_pool import ReadabilityPool
+from utils.readability_scorer import ReadabilityScorer
+
+
+def report(label: str, docs: int, elapsed: float):
+    """Print documents/second for one benchmark case"""
+    print(f"{label:<28} {docs / elapsed:8.1f} docs/s  ({elapsed:.2f}s)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--docs', type=int, default=400)
+    parser.add_argument('--words', type=int, default=3000, help="Words per document")
+    parser.add_argument('--chunk-size', type=int, default=8)
+    args = parser.parse_args()
+
+    extractor = FastContentExtractor()
+    contents = [
+        extractor.extract(generate_page(i, args.words, max(args.words // 400, 1)), f"page-{i}")['text']
+        for i in range(args.docs)
+    ]
+    print(f"{args.docs} documents of ~{args.words} words, {os.cpu_count()} CPUs")
+
+    scorer = ReadabilityScorer()
+    start = time.perf_counter()
+    for content in contents:
+        scorer.score(content)
+    report("in-process", args.docs, time.perf_counter() - start)
+
+    workers = 1
+    while workers <= (os.cpu_count() or 1):
+        with ReadabilityPool(max_workers=workers, chunk_size=args.chunk_size) as pool:
+            # Start the workers before timing
+            pool.score_many(contents[:workers])
+            start = time.perf_counter()
+            pool.score_many(contents)
+            report(f"pool, {workers} workers", args.docs, time.perf_counter() - start)
+        workers *= 2
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""
+Scraper throughput benchmark against the local fixture server
+
+Compares one-off requests.get calls with the pooled keep-alive session and
+the async fetcher, both for raw fetching and for full scrape + extraction,
+and measures revisits answered with 304 Not Modified from the HTTP cache.
+
+Usage:
+    python -m benchmarks.bench_scraper --pages 200 --concurrency 16
+"""
+
+import argparse
+import asyncio
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from benchmarks.fixture_server import FixtureServer
+from config import SCRAPER_USER_AGENT
+from utils.content_scraper import ContentScraper
+from utils.http_cache import HTTPCache
+
+
+def report(label: str, pages: int, elapsed: float):
+    """Print pages/second for one benchmark case"""
+    print(f"{label:<40} {pages / elapsed:8.1f} pages/s  ({elapsed:.2f}s)")
+
+
+def new_scraper(concurrency):
+    """Build a scraper; the HTTP cache is off unless a case measures it"""
+    return ContentScraper(max_connections_per_host=concurrency, use_http_cache=False)
+
+
+def bench_requests_get(urls, concurrency):
+    """Fetch with a fresh connection per page, as the scraper used to"""
+    headers = {'User-Agent': SCRAPER_USER_AGENT}
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        list(executor.map(lambda url: requests.get(url, headers=headers, timeout=10).content, urls))
+
+
+def bench_session(urls, concurrency):
+    """Fetch through the scraper's pooled session"""
+    scraper = new_scraper(concurrency)
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        list(executor.map(lambda url: scraper._get(url).content, urls))
+
+
+def bench_async_fetch(urls, concurrency):
+    """Fetch through the async fetcher"""
+    async def run():
+        scraper = new_scraper(concurrency)
+        fetcher = scraper._get_async_fetcher()
+        await asyncio.gather(*[fetcher.fetch(url) for url in urls])
+        await scraper.aclose()
+
+    asyncio.run(run())
+
+
+def bench_scrape_sync(urls, concurrency):
+    """Full scrape and extraction through scrape_url"""
+    scraper = new_scraper(concurrency)
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        list(executor.map(scraper.scrape_url, urls))
+
+
+def bench_scrape_async(urls, concurrency):
+    """Full scrape and extraction through ascrape_url"""
+    async def run():
+        scraper = new_scraper(concurrency)
+        await asyncio.gather(*[scraper.ascrape_url(url) for url in urls])
+        await scraper.aclose()
+
+    asyncio.run(run())
+
+
+def bench_scrape_revisit(urls, concurrency):
+    """Second visit of every page, revalidated against the HTTP cache"""
+    with tempfile.TemporaryDirectory() as cache_dir:
+        scraper = new_scraper(concurrency)
+        scraper.http_cache = HTTPCache(cache_dir)
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            list(executor.map(scraper.scrape_url, urls))
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            list(executor.map(scraper.scrape_url, urls))
+        return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--pages', type=int, default=200)
+    parser.add_argument('--concurrency', type=int, default=8)
+    parser.add_argument('--words', type=int, default=800, help="Words per fixture page")
+    args = parser.parse_args()
+
+    cases = [
+        ("fetch: requests.get per page", bench_requests_get),
+        ("fetch: pooled session", bench_session),
+        ("fetch: async fetcher", bench_async_fetch),
+        ("scrape: scrape_url (threads)", bench_scrape_sync),
+        ("scrape: ascrape_url", bench_scrape_async),
+        ("scrape: revisit with 304s", bench_scrape_revisit),
+    ]
+
+    with FixtureServer(word_count=args.words) as server:
+        urls = [server.page_url(i) for i in range(args.pages)]
+        print(f"{args.pages} pages, concurrency {args.concurrency}, server {server.base_url}")
+        for label, bench in cases:
+            start = time.perf_counter()
+            elapsed = bench(urls, args.concurrency)
+            report(label, args.pages, elapsed or time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    main()
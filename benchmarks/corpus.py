@@ -0,0 +1,36 @@
+"""
+Saved HTML corpus used by the extraction and pipeline benchmarks
+"""
+
+import os
+from typing import List
+
+from benchmarks.fixture_server import generate_page
+
+CORPUS_DIR = os.path.join(os.path.dirname(__file__), 'fixtures')
+
+# From a short how-to page to a full reference manual
+CORPUS_SIZES = [200, 1000, 5000, 20000, 50000]
+
+
+def ensure_corpus(directory: str = CORPUS_DIR, sizes: List[int] = None) -> List[str]:
+    """
+    Return the HTML files in directory, generating the synthetic corpus if it is empty
+
+    Point directory at a folder of real saved pages to benchmark against them.
+    """
+    os.makedirs(directory, exist_ok=True)
+    existing = sorted(
+        os.path.join(directory, name) for name in os.listdir(directory) if name.endswith('.html')
+    )
+    if existing:
+        return existing
+
+    paths = []
+    for index, word_count in enumerate(sizes or CORPUS_SIZES):
+        path = os.path.join(directory, f"page_{word_count:05d}_words.html")
+        sections = max(word_count // 400, 1)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(generate_page(index, word_count, sections))
+        paths.append(path)
+    return paths
@@ -0,0 +1,118 @@
+"""
+Local HTTP server serving synthetic documentation pages for benchmarks
+"""
+
+import random
+import socket
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+WORDS = (
+    "configure deploy the service using a simple command line tool that manages "
+    "authentication tokens and environment variables for every project your team "
+    "creates while keeping credentials secure and auditable across regions"
+).split()
+
+
+def generate_page(page_id: int, word_count: int = 800, sections: int = 5) -> str:
+    """Generate a deterministic documentation-like HTML page"""
+    rng = random.Random(page_id)
+    words_per_section = max(word_count // sections, 1)
+
+    body = []
+    for section in range(sections):
+        body.append(f"<h2>Section {section + 1}: {' '.join(rng.sample(WORDS, 3)).title()}</h2>")
+        remaining = words_per_section
+        while remaining > 0:
+            length = min(remaining, rng.randint(30, 80))
+            sentences = []
+            for _ in range(max(length // 12, 1)):
+                sentence = ' '.join(rng.choice(WORDS) for _ in range(12))
+                sentences.append(sentence.capitalize() + '.')
+            body.append(f"<p>{' '.join(sentences)}</p>")
+            remaining -= length
+        body.append(
+            "<ul>"
+            + ''.join(f"<li>Set <code>{rng.choice(WORDS)}</code> to <strong>{rng.choice(WORDS)}</strong></li>"
+                      for _ in range(3))
+            + "</ul>"
+        )
+        body.append(f'<p>See <a href="/page/{section}">the {rng.choice(WORDS)} guide</a> for details.</p>')
+        body.append(f"<pre><code>docs-cli deploy --project demo-{page_id} --region eu</code></pre>")
+
+    return f"""<!DOCTYPE html>
+<html>
+<head><title>Fixture Page {page_id}</title><style>body {{ font-family: sans-serif; }}</style></head>
+<body>
+<header><a href="/">Home</a></header>
+<nav><ul><li><a href="/page/1">Page 1</a></li><li><a href="/page/2">Page 2</a></li></ul></nav>
+<main><h1>Fixture Page {page_id}</h1>
+{''.join(body)}
+</main>
+<footer>Copyright</footer>
+<script>console.log("analytics");</script>
+</body>
+</html>"""
+
+
+class FixtureRequestHandler(BaseHTTPRequestHandler):
+    """Serves /page/<id> as generated HTML over keep-alive connections, with ETags"""
+
+    protocol_version = "HTTP/1.1"
+    word_count = 800
+
+    def setup(self):
+        super().setup()
+        # Headers and body are written separately; avoid Nagle stalls on keep-alive
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def do_GET(self):
+        parts = self.path.strip('/').split('/')
+        if len(parts) != 2 or parts[0] != 'page' or not parts[1].isdigit():
+            self.send_error(404)
+            return
+
+        etag = f'"page-{parts[1]}-{self.word_count}"'
+        if self.headers.get('If-None-Match') == etag:
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+
+        body = generate_page(int(parts[1]), self.word_count).encode('utf-8')
+        self.send_response(200)
+        self.send_header('ETag', etag)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class FixtureServer:
+    """Runs the fixture HTTP server in a background thread"""
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 0, word_count: int = 800):
+        handler = type('Handler', (FixtureRequestHandler,), {'word_count': word_count})
+        self.server = ThreadingHTTPServer((host, port), handler)
+        self.server.daemon_threads = True
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def page_url(self, page_id: int) -> str:
+        return f"{self.base_url}/page/{page_id}"
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.server.shutdown()
+        self.server.server_close()
@@ -7,6 +7,86 @@ load_dotenv()
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 OPENAI_MODEL = "gpt-4-turbo-preview"
 
+# LLM response cache (keyed on agent, model, temperature and prompt)
+LLM_CACHE_ENABLED = os.getenv("LLM_CACHE_ENABLED", "true").lower() == "true"
+LLM_CACHE_PATH = os.getenv("LLM_CACHE_PATH", ".cache/llm_responses.sqlite3")
+LLM_CACHE_TTL_SECONDS = int(os.getenv("LLM_CACHE_TTL_SECONDS", str(7 * 24 * 3600)))
+LLM_CACHE_MAX_ENTRIES = int(os.getenv("LLM_CACHE_MAX_ENTRIES", "10000"))
+
+# Chat model backend: "openai", or "fake" for an offline stand-in that returns canned, schema-valid
+# responses after a simulated delay (for benchmarks and tests; no API key or network needed)
+LLM_BACKEND = os.getenv("LLM_BACKEND", "openai")
+FAKE_LLM_LATENCY_SECONDS = float(os.getenv("FAKE_LLM_LATENCY_SECONDS", "0.5"))  # Time to first token
+FAKE_LLM_TOKENS_PER_SECOND = float(os.getenv("FAKE_LLM_TOKENS_PER_SECOND", "100"))  # 0 = instant generation
+FAKE_LLM_OUTPUT_TOKENS = int(os.getenv("FAKE_LLM_OUTPUT_TOKENS", "400"))  # Approximate size of JSON responses
+
+# LLM client resilience: retries with exponential backoff, and a shared rate limit (0 disables a limit)
+LLM_MAX_RETRIES = int(os.getenv("LLM_MAX_RETRIES", "5"))
+LLM_BACKOFF_BASE_SECONDS = float(os.getenv("LLM_BACKOFF_BASE_SECONDS", "1"))
+LLM_BACKOFF_MAX_SECONDS = float(os.getenv("LLM_BACKOFF_MAX_SECONDS", "60"))
+LLM_REQUESTS_PER_MINUTE = int(os.getenv("LLM_REQUESTS_PER_MINUTE", "500"))
+LLM_TOKENS_PER_MINUTE = int(os.getenv("LLM_TOKENS_PER_MINUTE", "300000"))
+# Send a duplicate request when a call runs past this latency percentile of the agent (0 disables)
+LLM_HEDGE_PERCENTILE = float(os.getenv("LLM_HEDGE_PERCENTILE", "0"))
+
+# Results the Streamlit app shares across sessions, per (url, persona)
+APP_RESULT_CACHE_TTL_SECONDS = int(os.getenv("APP_RESULT_CACHE_TTL_SECONDS", "3600"))
+APP_RESULT_CACHE_MAX_ENTRIES = int(os.getenv("APP_RESULT_CACHE_MAX_ENTRIES", "100"))
+
+# Maximum number of agent calls the orchestrator keeps in flight
+ORCHESTRATOR_MAX_CONCURRENCY = int(os.getenv("ORCHESTRATOR_MAX_CONCURRENCY", "16"))
+
+# Background jobs for the Streamlit app: a SQLite queue shared by local worker processes
+JOB_QUEUE_PATH = os.getenv("JOB_QUEUE_PATH", ".cache/jobs.sqlite3")
+JOB_WORKERS = int(os.getenv("JOB_WORKERS", "2"))  # Workers the app starts itself (0 = run worker.py separately)
+JOB_POLL_SECONDS = float(os.getenv("JOB_POLL_SECONDS", "0.5"))
+JOB_STALE_SECONDS = float(os.getenv("JOB_STALE_SECONDS", "900"))  # Running jobs silent this long are requeued
+JOB_RETENTION_SECONDS = float(os.getenv("JOB_RETENTION_SECONDS", str(24 * 3600)))  # Finished jobs are then deleted
+
+# Stage timing and LLM call metrics exporters ("" disables; "{pid}" in a path becomes the process id)
+METRICS_JSONL_PATH = os.getenv("METRICS_JSONL_PATH", "")
+METRICS_PROMETHEUS_PATH = os.getenv("METRICS_PROMETHEUS_PATH", "")
+
+# Number of documents a batch run scrapes and processes at once
+BATCH_MAX_WORKERS = int(os.getenv("BATCH_MAX_WORKERS", "8"))
+
+# Content scraping
+SCRAPER_USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+SCRAPER_TIMEOUT = float(os.getenv("SCRAPER_TIMEOUT", "10"))
+SCRAPER_POOL_SIZE = int(os.getenv("SCRAPER_POOL_SIZE", "20"))
+SCRAPER_MAX_CONNECTIONS_PER_HOST = int(os.getenv("SCRAPER_MAX_CONNECTIONS_PER_HOST", "4"))
+SCRAPER_POLITENESS_DELAY = float(os.getenv("SCRAPER_POLITENESS_DELAY", "0"))
+# "bs4" (BeautifulSoup + html2text) or "lxml" (single pass, faster); lxml markdown is not wrapped at
+# 78 columns and does not escape markdown characters the way html2text does, so text and hashes differ
+SCRAPER_ENGINE = os.getenv("SCRAPER_ENGINE", "bs4")
+HTTP_CACHE_ENABLED = os.getenv("HTTP_CACHE_ENABLED", "true").lower() == "true"
+HTTP_CACHE_DIR = os.getenv("HTTP_CACHE_DIR", ".cache/http")
+
+# Playwright fallback for JavaScript-heavy pages
+PLAYWRIGHT_POOL_SIZE = int(os.getenv("PLAYWRIGHT_POOL_SIZE", "4"))
+PLAYWRIGHT_WAIT_UNTIL = os.getenv("PLAYWRIGHT_WAIT_UNTIL", "domcontentloaded")
+# Optional selector to wait for after load, e.g. 'main, article'; pages without it wait the full selector timeout
+PLAYWRIGHT_WAIT_FOR_SELECTOR = os.getenv("PLAYWRIGHT_WAIT_FOR_SELECTOR", "")
+PLAYWRIGHT_SELECTOR_TIMEOUT_MS = int(os.getenv("PLAYWRIGHT_SELECTOR_TIMEOUT_MS", "5000"))
+PLAYWRIGHT_BLOCKED_RESOURCES = ["image", "font", "media"]
+PLAYWRIGHT_TIMEOUT_MS = int(os.getenv("PLAYWRIGHT_TIMEOUT_MS", "30000"))
+
+# Long pages are split along their headings and processed section by section
+CHUNKING_THRESHOLD_WORDS = int(os.getenv("CHUNKING_THRESHOLD_WORDS", "3000"))
+CHUNK_MAX_WORDS = int(os.getenv("CHUNK_MAX_WORDS", "1500"))
+
+# Incremental re-analysis: long pages with a URL reuse stored results of their unchanged sections
+INCREMENTAL_ANALYSIS_ENABLED = os.getenv("INCREMENTAL_ANALYSIS_ENABLED", "true").lower() == "true"
+SECTION_STORE_PATH = os.getenv("SECTION_STORE_PATH", ".cache/section_results.sqlite3")
+
+# Per-word syllable counts reused across documents; the path warm-starts new processes ("" disables it)
+SYLLABLE_CACHE_MAX_ENTRIES = int(os.getenv("SYLLABLE_CACHE_MAX_ENTRIES", "200000"))
+SYLLABLE_CACHE_PATH = os.getenv("SYLLABLE_CACHE_PATH", ".cache/syllables.json")
+
+# Process pool for metrics-only readability scoring (0 workers = one per CPU core)
+READABILITY_POOL_WORKERS = int(os.getenv("READABILITY_POOL_WORKERS", "0"))
+READABILITY_POOL_CHUNK_SIZE = int(os.getenv("READABILITY_POOL_CHUNK_SIZE", "8"))
+
 # Temperature settings for different agents
 AGENT_TEMPERATURES = {
     "analyzer": 0.3,
@@ -17,6 +97,26 @@ AGENT_TEMPERATURES = {
     "readability": 0.2
 }
 
+# Maximum prompt tokens per agent call; larger inputs are compacted, then truncated
+AGENT_TOKEN_BUDGETS = {
+    "analyzer": 16000,
+    "rewriter": 16000,
+    "persona": 12000,
+    "localization": 12000,
+    "example_generator": 12000,
+    "readability": 6000
+}
+
+# Seconds an agent waits for the LLM (between chunks when streaming) before retrying
+AGENT_TIMEOUTS = {
+    "analyzer": 90,
+    "rewriter": 180,
+    "persona": 60,
+    "localization": 60,
+    "example_generator": 90,
+    "readability": 45
+}
+
 # Persona configurations
 PERSONAS = {
     "Marketer": {
@@ -47,9 +147,23 @@ READABILITY_THRESHOLDS = {
         "green": 8,
         "yellow": 12,
         "red": float('inf')
+    },
+    "avg_sentence_length": {
+        "green": 15,
+        "yellow": 20,
+        "red": float('inf')
+    },
+    "avg_syllables_per_word": {
+        "green": 1.5,
+        "yellow": 1.7,
+        "red": float('inf')
     }
 }
 
+# When the readability agent asks the LLM to interpret its metrics:
+# "always", "on_red" (only when some paragraph is red) or "never" (rule-based insights only)
+READABILITY_LLM_MODE = os.getenv("READABILITY_LLM_MODE", "on_red")
+
 # Microsoft Style Guide principles
 STYLE_GUIDE_PRINCIPLES = [
     "Use active voice",
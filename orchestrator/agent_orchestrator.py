@@ -1,5 +1,9 @@
-from typing import Dict, Any, List
-import json
+from typing import Callable, Dict, Any, List
+import asyncio
+import queue
+import threading
+import time
+from collections import deque
 from datetime import datetime
 
 # Import agents directly to avoid circular imports
@@ -9,12 +13,47 @@ from agents.persona_feedback_agent import PersonaFeedbackAgent
 from agents.localization_agent import LocalizationReadinessAgent
 from agents.example_generator_agent import ExampleGeneratorAgent
 from agents.readability_visualizer import ReadabilityVisualizerAgent
-from config import PERSONAS
+from orchestrator.result_merger import merge_json_results, merge_rewrite_results
+from orchestrator.section_store import SectionResultStore
+from utils.content_chunker import ContentChunker
+from utils.instrumentation import get_metrics_exporter
+from utils.payloads import analysis_for_rewriter
+from utils.token_usage import collect_usage
+from config import (
+    PERSONAS, ORCHESTRATOR_MAX_CONCURRENCY, CHUNKING_THRESHOLD_WORDS,
+    INCREMENTAL_ANALYSIS_ENABLED
+)
+
+# The orchestrator log keeps only the most recent entries; each run has its own full log
+EXECUTION_LOG_MAX_ENTRIES = 1000
+# Seconds the calling thread waits for stream chunks before checking whether the run finished
+STREAM_POLL_SECONDS = 0.05
+
+# Receives progress events; see AgentOrchestrator.subscribe for their fields
+ProgressCallback = Callable[[Dict[str, Any]], None]
+
 
 class AgentOrchestrator:
-    """Orchestrates the execution of all documentation improvement agents"""
+    """
+    Orchestrates the execution of all documentation improvement agents
+
+    An orchestrator is meant to be long-lived (see get_orchestrator): agents,
+    their shared chat models and pooled connections are built once, and
+    synchronous calls run on one background event loop so async connections
+    are reused across runs.
+    """
     
-    def __init__(self):
+    def __init__(self, max_concurrency: int = ORCHESTRATOR_MAX_CONCURRENCY,
+                 chunking_threshold: int = CHUNKING_THRESHOLD_WORDS,
+                 section_store: SectionResultStore = None):
+        self.max_concurrency = max_concurrency
+        self.chunking_threshold = chunking_threshold
+        self.chunker = ContentChunker()
+        
+        # Incremental re-analysis reuses stored results for unchanged sections
+        if section_store is None and INCREMENTAL_ANALYSIS_ENABLED:
+            section_store = SectionResultStore()
+        self.section_store = section_store
         self.agents = {
             'analyzer': DocumentationAnalyzerAgent(),
             'rewriter': DocumentationRewriterAgent(),
@@ -24,26 +63,163 @@ class AgentOrchestrator:
             'readability': ReadabilityVisualizerAgent()
         }
         
-        self.execution_log = []
+        self.execution_log = deque(maxlen=EXECUTION_LOG_MAX_ENTRIES)
+        
+        self._loop = None
+        self._loop_lock = threading.Lock()
+        self._subscribers: List[ProgressCallback] = []
+        self._subscribers_lock = threading.Lock()
     
-    def process_documentation(self, content_data: Dict[str, Any], persona: str = "Marketer") -> Dict[str, Any]:
+    def process_documentation(self, content_data: Dict[str, Any], persona: str = "Marketer",
+                              on_stream: Callable[[str, int, str], None] = None,
+                              on_progress: ProgressCallback = None) -> Dict[str, Any]:
         """
-        Process documentation through all agents in the correct sequence
+        Process documentation through all agents, running independent agents concurrently
+        
+        Synchronous wrapper around aprocess_documentation for callers without
+        an event loop, such as the Streamlit app. The run happens on the
+        orchestrator's event loop; callbacks are delivered on the calling
+        thread.
         
         Args:
             content_data: Dictionary containing title, content, url, etc.
             persona: Target persona for analysis
+            on_stream: Optional callback receiving output chunks of streaming steps
+            on_progress: Optional callback receiving the progress events of this run
             
         Returns:
             Dictionary with all agent results
         """
+        callbacks = {'on_stream': on_stream, 'on_progress': on_progress}
+        if not any(callbacks.values()):
+            return self._submit(self.aprocess_documentation(content_data, persona)).result()
+        
+        calls = queue.Queue()
+        relays = {
+            name: (lambda *args, callback=callback: calls.put((callback, args))) if callback else None
+            for name, callback in callbacks.items()
+        }
+        future = self._submit(self.aprocess_documentation(content_data, persona, **relays))
+        while True:
+            try:
+                callback, args = calls.get(timeout=STREAM_POLL_SECONDS)
+            except queue.Empty:
+                if future.done():
+                    return future.result()
+                continue
+            callback(*args)
+    
+    def _submit(self, coro):
+        """Schedule a coroutine on the orchestrator's event loop, starting the loop on first use"""
+        with self._loop_lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                threading.Thread(target=self._loop.run_forever, name='orchestrator-loop', daemon=True).start()
+        return asyncio.run_coroutine_threadsafe(coro, self._loop)
+    
+    async def aprocess_many(self, documents: List[Dict[str, Any]], persona: str = "Marketer",
+                            max_concurrency: int = None) -> List[Dict[str, Any]]:
+        """
+        Process several documents on one event loop
+        
+        Args:
+            documents: List of content_data dictionaries
+            persona: Target persona for analysis
+            max_concurrency: Maximum agent calls in flight across all documents
+            
+        Returns:
+            List of results in the same order as documents
+        """
+        semaphore = asyncio.Semaphore(max_concurrency or self.max_concurrency)
+        return await asyncio.gather(*[
+            self.aprocess_documentation(content_data, persona, semaphore)
+            for content_data in documents
+        ])
+    
+    async def aprocess_documentation(self, content_data: Dict[str, Any], persona: str = "Marketer",
+                                     semaphore: asyncio.Semaphore = None,
+                                     on_stream: Callable[[str, int, str], None] = None,
+                                     on_progress: ProgressCallback = None) -> Dict[str, Any]:
+        """
+        Process documentation through all agents, running independent agents concurrently
+        
+        Args:
+            content_data: Dictionary containing title, content, url, etc.
+            persona: Target persona for analysis
+            semaphore: Limits agent calls in flight; share one across documents
+                to bound total concurrency
+            on_stream: Optional callback called as on_stream(step_name, section_index, chunk)
+                with the output of streaming steps (the rewrite) as it is generated.
+                Sections stream concurrently; reused sections arrive as one chunk.
+            on_progress: Optional callback receiving the progress events of this run
+                as they happen; subscribers registered with subscribe() get them too
+            
+        Returns:
+            Dictionary with all agent results, the token usage and LLM latency of
+            every agent call, and timings: total seconds, the scraper's fetch and
+            parse seconds, and seconds per stage (each agent step and final_output)
+        """
+        url = (content_data or {}).get('url')
+        started = time.perf_counter()
+        self._publish(on_progress, self._progress_event('run_start', url, persona))
+        
+        with collect_usage() as usage:
+            results = await self._process_documentation(content_data, persona, semaphore, on_stream, on_progress)
+        
+        results['token_usage'] = usage.summary()
+        results['timings']['total'] = round(time.perf_counter() - started, 4)
+        results['timings']['scrape'] = (content_data or {}).get('timings', {})
+        
+        exporter = get_metrics_exporter()
+        if exporter.enabled:
+            await asyncio.to_thread(exporter.export, results)
+        
+        self._publish(on_progress, self._progress_event(
+            'run_end', url, persona,
+            duration=results['timings']['total'],
+            tokens_in=results['token_usage']['tokens_in'],
+            tokens_out=results['token_usage']['tokens_out'],
+            error=results.get('error')
+        ))
+        return results
+    
+    def subscribe(self, callback: ProgressCallback) -> Callable[[], None]:
+        """
+        Receive the progress events of every run; returns a function that unsubscribes
+        
+        Events are dictionaries with 'event', 'url', 'persona' and 'timestamp':
+        - run_start / run_end: a document; run_end adds duration (seconds),
+          tokens_in, tokens_out and error
+        - step_start / step_end: an agent step, with step, agent, message,
+          completed_steps and total_steps; step_end adds duration, tokens_in,
+          tokens_out, calls, cached_calls (LLM response cache hits), sections,
+          reused_sections (incremental store hits) and error
+        
+        Callbacks run on the event loop doing the work and must not block.
+        """
+        with self._subscribers_lock:
+            self._subscribers.append(callback)
+        
+        def unsubscribe():
+            with self._subscribers_lock:
+                if callback in self._subscribers:
+                    self._subscribers.remove(callback)
+        
+        return unsubscribe
+    
+    async def _process_documentation(self, content_data: Dict[str, Any], persona: str,
+                                     semaphore: asyncio.Semaphore = None,
+                                     on_stream: Callable[[str, int, str], None] = None,
+                                     on_progress: ProgressCallback = None) -> Dict[str, Any]:
+        """Run the agent graph and prepare the final output for one document"""
         results = {
             'input_data': content_data,
             'persona': persona,
             'timestamp': datetime.now().isoformat(),
             'agent_results': {},
             'execution_log': [],
-            'final_output': {}
+            'final_output': {},
+            'timings': {'stages': {}}
         }
         
         try:
@@ -51,83 +227,19 @@ class AgentOrchestrator:
             if not content_data or not content_data.get('text'):
                 results['error'] = "No content provided for analysis"
                 return results
-            # Step 1: Analyze documentation
-            self._log_step(results, "Starting documentation analysis...")
-            analyzer_input = {
-                'title': content_data.get('title', ''),
-                'content': content_data.get('text', '')
-            }
             
-            analysis_result = self.agents['analyzer'].execute(analyzer_input)
-            results['agent_results']['analysis'] = analysis_result
-            self._log_step(results, "✓ Documentation analysis completed")
-            
-            # Check if analysis failed
-            if 'error' in analysis_result:
-                results['error'] = f"Analysis failed: {analysis_result['error']}"
+            # Steps 1-6: Run the agent graph, independent agents concurrently
+            pipeline = self._build_pipeline(content_data, persona)
+            semaphore = semaphore or asyncio.Semaphore(self.max_concurrency)
+            if not await self._run_pipeline(pipeline, results, semaphore, on_stream, on_progress):
                 return results
             
-            # Step 2: Generate readability analysis
-            self._log_step(results, "Analyzing readability metrics...")
-            readability_input = {
-                'content': content_data.get('text', '')
-            }
-            
-            readability_result = self.agents['readability'].execute(readability_input)
-            results['agent_results']['readability'] = readability_result
-            self._log_step(results, "✓ Readability analysis completed")
-            
-            # Step 3: Rewrite documentation with improvements
-            self._log_step(results, "Rewriting documentation with improvements...")
-            rewriter_input = {
-                'title': content_data.get('title', ''),
-                'content': content_data.get('text', ''),
-                'suggestions': json.dumps(analysis_result, indent=2)
-            }
-            
-            rewrite_result = self.agents['rewriter'].execute(rewriter_input)
-            results['agent_results']['rewrite'] = rewrite_result
-            self._log_step(results, "✓ Documentation rewrite completed")
-            
-            # Step 4: Generate persona-specific feedback
-            self._log_step(results, f"Generating {persona}-specific feedback...")
-            persona_config = PERSONAS.get(persona, PERSONAS['Marketer'])
-            persona_input = {
-                'content': rewrite_result.get('rewritten_content', content_data.get('text', '')),
-                'persona': persona,
-                'persona_description': persona_config['description'],
-                'persona_priorities': ', '.join(persona_config['priorities'])
-            }
-            
-            persona_result = self.agents['persona'].execute(persona_input)
-            results['agent_results']['persona_feedback'] = persona_result
-            self._log_step(results, f"✓ {persona} persona analysis completed")
-            
-            # Step 5: Check localization readiness
-            self._log_step(results, "Analyzing localization readiness...")
-            localization_input = {
-                'content': rewrite_result.get('rewritten_content', content_data.get('text', ''))
-            }
-            
-            localization_result = self.agents['localization'].execute(localization_input)
-            results['agent_results']['localization'] = localization_result
-            self._log_step(results, "✓ Localization analysis completed")
-            
-            # Step 6: Generate intelligent examples
-            self._log_step(results, "Generating intelligent examples...")
-            example_input = {
-                'content': rewrite_result.get('rewritten_content', content_data.get('text', '')),
-                'title': content_data.get('title', '')
-            }
-            
-            example_result = self.agents['example_generator'].execute(example_input)
-            results['agent_results']['examples'] = example_result
-            self._log_step(results, "✓ Example generation completed")
-            
             # Step 7: Prepare final output
             self._log_step(results, "Preparing final output...")
+            started = time.perf_counter()
             try:
                 results['final_output'] = self._prepare_final_output(results)
+                results['timings']['stages']['final_output'] = round(time.perf_counter() - started, 4)
                 self._log_step(results, "✓ All processing completed successfully!")
             except Exception as e:
                 self._log_step(results, f"⚠️ Final output preparation had issues: {e}")
@@ -148,12 +260,476 @@ class AgentOrchestrator:
             results['error'] = error_msg
             return results
     
+    def _build_pipeline(self, content_data: Dict[str, Any], persona: str) -> List[Dict[str, Any]]:
+        """
+        Declare the agent dependency graph
+        
+        Steps are listed in their canonical order, which is the order used for
+        agent_results and execution_log regardless of completion order. Steps
+        with a merge function run per section on long content, reusing stored
+        results of unchanged sections when the page has a URL. A step with a
+        section_source runs over that step's sections, and a section_text
+        function gives the text later steps see for each of its sections.
+        Steps with a stream_field stream their agent output to the on_stream
+        callback.
+        """
+        title = content_data.get('title', '')
+        text = content_data.get('text', '')
+        persona_config = PERSONAS.get(persona, PERSONAS['Marketer'])
+        
+        def rewritten_content(outputs: Dict[str, Any]) -> str:
+            return outputs['rewrite'].get('rewritten_content', text)
+        
+        def rewritten_section(section: Dict[str, Any], result: Dict[str, Any]) -> str:
+            # Same fallback as merge_rewrite_results
+            if 'error' in result or not result.get('rewritten_content'):
+                return section['text']
+            return result['rewritten_content']
+        
+        return [
+            {
+                'name': 'analysis',
+                'agent': 'analyzer',
+                'depends_on': [],
+                'merge': merge_json_results,
+                'build_input': lambda outputs: {
+                    'title': title,
+                    'content': text
+                },
+                'start_message': "Starting documentation analysis...",
+                'end_message': "✓ Documentation analysis completed",
+                'abort_on_error': "Analysis failed"
+            },
+            {
+                'name': 'readability',
+                'agent': 'readability',
+                'depends_on': [],
+                'build_input': lambda outputs: {
+                    'content': text
+                },
+                'start_message': "Analyzing readability metrics...",
+                'end_message': "✓ Readability analysis completed"
+            },
+            {
+                'name': 'rewrite',
+                'agent': 'rewriter',
+                'depends_on': ['analysis'],
+                'merge': merge_rewrite_results,
+                'build_input': lambda outputs: {
+                    'title': title,
+                    'content': text,
+                    'suggestions': analysis_for_rewriter(outputs['analysis'])
+                },
+                # Each section is rewritten with the analysis of that same section
+                'section_input': lambda section_outputs, index: {
+                    'suggestions': analysis_for_rewriter(section_outputs['analysis'][index])
+                },
+                'section_source': 'analysis',
+                'section_text': rewritten_section,
+                'stream_field': 'rewritten_content',
+                'start_message': "Rewriting documentation with improvements...",
+                'end_message': "✓ Documentation rewrite completed"
+            },
+            {
+                'name': 'persona_feedback',
+                'agent': 'persona',
+                'depends_on': ['rewrite'],
+                'merge': merge_json_results,
+                # Per rewritten section, so unchanged sections reuse stored results
+                'section_source': 'rewrite',
+                'build_input': lambda outputs: {
+                    'content': rewritten_content(outputs),
+                    'persona': persona,
+                    'persona_description': persona_config['description'],
+                    'persona_priorities': ', '.join(persona_config['priorities'])
+                },
+                'start_message': f"Generating {persona}-specific feedback...",
+                'end_message': f"✓ {persona} persona analysis completed"
+            },
+            {
+                'name': 'localization',
+                'agent': 'localization',
+                'depends_on': ['rewrite'],
+                'merge': merge_json_results,
+                'section_source': 'rewrite',
+                'build_input': lambda outputs: {
+                    'content': rewritten_content(outputs)
+                },
+                'start_message': "Analyzing localization readiness...",
+                'end_message': "✓ Localization analysis completed"
+            },
+            {
+                'name': 'examples',
+                'agent': 'example_generator',
+                'depends_on': ['rewrite'],
+                'merge': merge_json_results,
+                'section_source': 'rewrite',
+                'build_input': lambda outputs: {
+                    'content': rewritten_content(outputs),
+                    'title': title
+                },
+                'start_message': "Generating intelligent examples...",
+                'end_message': "✓ Example generation completed"
+            }
+        ]
+    
+    async def _run_pipeline(self, pipeline: List[Dict[str, Any]], results: Dict[str, Any],
+                            semaphore: asyncio.Semaphore,
+                            on_stream: Callable[[str, int, str], None] = None,
+                            on_progress: ProgressCallback = None) -> bool:
+        """
+        Execute the agent graph, starting every step whose dependencies are met
+        
+        Returns False if a step marked abort_on_error failed and processing
+        should stop; exceptions raised by a step are re-raised once the steps
+        that completed before it have been recorded.
+        """
+        run_context = {
+            'url': results['input_data'].get('url'),
+            'persona': results['persona'],
+            'headings': results['input_data'].get('headings'),
+            'on_stream': on_stream,
+            'on_progress': on_progress,
+            'completed_steps': 0,
+            'total_steps': len(pipeline),
+            'sections': {},
+            'stage_timings': results['timings']['stages']
+        }
+        outputs = {}
+        section_outputs = {}
+        step_runs = {}
+        pending = {step['name']: step for step in pipeline}
+        running = {}
+        failure = None
+        
+        while pending or running:
+            for name, step in list(pending.items()):
+                if all(dep in outputs for dep in step['depends_on']):
+                    del pending[name]
+                    task = asyncio.create_task(
+                        self._run_step(step, dict(outputs), dict(section_outputs), semaphore, run_context)
+                    )
+                    running[task] = step
+            
+            if not running:
+                raise ValueError(f"Unresolvable agent dependencies: {', '.join(pending)}")
+            
+            done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                step = running.pop(task)
+                try:
+                    step_runs[step['name']] = task.result()
+                except Exception as e:
+                    failure = failure or e
+                    pending.clear()
+                    continue
+                
+                outputs[step['name']] = step_runs[step['name']]['result']
+                if step_runs[step['name']]['section_results']:
+                    section_outputs[step['name']] = step_runs[step['name']]['section_results']
+                
+                if step.get('abort_on_error') and 'error' in outputs[step['name']]:
+                    pending.clear()
+        
+        # Record results and log entries in canonical order
+        for step in pipeline:
+            name = step['name']
+            if name not in outputs:
+                break
+            
+            for entry in step_runs[name]['log_entries']:
+                self._append_log_entry(results, entry)
+            results['agent_results'][name] = outputs[name]
+            if step_runs[name]['section_stats']:
+                results.setdefault('incremental', {})[name] = step_runs[name]['section_stats']
+            
+            if step.get('abort_on_error') and 'error' in outputs[name]:
+                results['error'] = f"{step['abort_on_error']}: {outputs[name]['error']}"
+                return False
+        
+        if failure:
+            raise failure
+        
+        return True
+    
+    async def _run_step(self, step: Dict[str, Any], outputs: Dict[str, Any],
+                        section_outputs: Dict[str, List[Dict[str, Any]]],
+                        semaphore: asyncio.Semaphore, run_context: Dict[str, Any]) -> Dict[str, Any]:
+        """Run a single pipeline step, publishing its start and its end with timing and token usage"""
+        self._publish_step(run_context, 'step_start', step)
+        started = time.perf_counter()
+        step_run = None
+        error = None
+        
+        with collect_usage() as usage:
+            try:
+                step_run = await self._execute_step(step, outputs, section_outputs, semaphore, run_context)
+                error = step_run['result'].get('error')
+                return step_run
+            except Exception as e:
+                error = str(e)
+                raise
+            finally:
+                run_context['completed_steps'] += 1
+                fields = self._step_end_fields(started, usage.summary(), step_run, error)
+                run_context['stage_timings'][step['name']] = fields['duration']
+                self._publish_step(run_context, 'step_end', step, **fields)
+    
+    async def _execute_step(self, step: Dict[str, Any], outputs: Dict[str, Any],
+                            section_outputs: Dict[str, List[Dict[str, Any]]],
+                            semaphore: asyncio.Semaphore, run_context: Dict[str, Any]) -> Dict[str, Any]:
+        """Run a step's agent, returning its result, per-section results and log entries"""
+        step_run = {
+            'log_entries': [self._make_log_entry(step['start_message'])],
+            'section_results': None,
+            'section_stats': None
+        }
+        
+        step_input = step['build_input'](outputs)
+        agent = self.agents[step['agent']]
+        sections = self._split_step_content(step, step_input, run_context)
+        
+        if len(sections) > 1:
+            # Map the agent over sections in parallel, then reduce
+            section_inputs = [
+                self._build_section_input(step, step_input, section, index, section_outputs, len(sections))
+                for index, section in enumerate(sections)
+            ]
+            section_results, section_stats = await self._run_sections(
+                step, agent, section_inputs, semaphore, run_context
+            )
+            step_run['result'] = step['merge'](section_results, sections)
+            step_run['section_results'] = section_results
+            step_run['section_stats'] = section_stats
+            run_context['sections'][step['name']] = self._output_sections(step, sections, section_results)
+        else:
+            on_chunk = self._stream_callback(step, run_context, 0)
+            step_run['result'] = await self._call_agent(agent, step_input, semaphore, on_chunk)
+        
+        step_run['log_entries'].append(self._make_log_entry(step['end_message']))
+        return step_run
+    
+    def _build_section_input(self, step: Dict[str, Any], step_input: Dict[str, Any], section: Dict[str, Any],
+                             index: int, section_outputs: Dict[str, List[Dict[str, Any]]],
+                             section_count: int) -> Dict[str, Any]:
+        """Build the agent input for one section of a step"""
+        section_input = {**step_input, 'content': section['text']}
+        
+        # Pair with the same section of an earlier step when both were split alike
+        source = step.get('section_source')
+        if step.get('section_input') and len(section_outputs.get(source, [])) == section_count:
+            section_input.update(step['section_input'](section_outputs, index))
+        
+        return section_input
+    
+    async def _run_sections(self, step: Dict[str, Any], agent, section_inputs: List[Dict[str, Any]],
+                            semaphore: asyncio.Semaphore, run_context: Dict[str, Any]):
+        """Run an agent over sections, reusing stored results for unchanged sections"""
+        url = run_context['url']
+        persona = run_context['persona']
+        store = self.section_store if url else None
+        
+        section_hashes = [SectionResultStore.section_hash(section_input) for section_input in section_inputs]
+        previous = store.get_many(url, persona, step['name'], section_hashes) if store else {}
+        
+        async def run_section(section_input: Dict[str, Any], section_hash: str, index: int) -> Dict[str, Any]:
+            on_chunk = self._stream_callback(step, run_context, index)
+            if section_hash in previous:
+                if on_chunk:
+                    on_chunk(previous[section_hash].get(step['stream_field'], ''))
+                return previous[section_hash]
+            return await self._call_agent(agent, section_input, semaphore, on_chunk)
+        
+        section_results = await asyncio.gather(*[
+            run_section(section_input, section_hash, index)
+            for index, (section_input, section_hash) in enumerate(zip(section_inputs, section_hashes))
+        ])
+        
+        if store:
+            store.replace(url, persona, step['name'], {
+                section_hash: result
+                for section_hash, result in zip(section_hashes, section_results)
+                if 'error' not in result
+            })
+        
+        reused = sum(1 for section_hash in section_hashes if section_hash in previous)
+        return list(section_results), {
+            'sections': len(section_hashes),
+            'reused': reused,
+            'changed': len(section_hashes) - reused
+        }
+    
+    async def _call_agent(self, agent, agent_input: Dict[str, Any], semaphore: asyncio.Semaphore,
+                          on_chunk: Callable[[str], None] = None) -> Dict[str, Any]:
+        """Execute an agent while holding a concurrency slot, streaming its output to on_chunk if given"""
+        async with semaphore:
+            if on_chunk:
+                return await agent.aexecute_stream(agent_input, on_chunk)
+            return await agent.aexecute(agent_input)
+    
+    def _step_end_fields(self, started: float, usage: Dict[str, Any], step_run: Dict[str, Any],
+                         error: str) -> Dict[str, Any]:
+        """Timing, token usage and cache hits of a finished step"""
+        stats = step_run['section_stats'] if step_run else None
+        return {
+            'duration': round(time.perf_counter() - started, 4),
+            'tokens_in': usage['tokens_in'],
+            'tokens_out': usage['tokens_out'],
+            'calls': len(usage['calls']),
+            'cached_calls': sum(1 for call in usage['calls'] if call['cached']),
+            'sections': stats['sections'] if stats else 1,
+            'reused_sections': stats['reused'] if stats else 0,
+            'error': error
+        }
+    
+    def _publish_step(self, run_context: Dict[str, Any], kind: str, step: Dict[str, Any], **fields):
+        """Publish a step_start or step_end event"""
+        self._publish(run_context['on_progress'], self._progress_event(
+            kind, run_context['url'], run_context['persona'],
+            step=step['name'],
+            agent=step['agent'],
+            message=step['start_message'] if kind == 'step_start' else step['end_message'],
+            completed_steps=run_context['completed_steps'],
+            total_steps=run_context['total_steps'],
+            **fields
+        ))
+    
+    def _progress_event(self, kind: str, url: str, persona: str, **fields) -> Dict[str, Any]:
+        """Create a progress event"""
+        return {
+            'event': kind,
+            'url': url,
+            'persona': persona,
+            'timestamp': datetime.now().isoformat(),
+            **fields
+        }
+    
+    def _publish(self, on_progress: ProgressCallback, event: Dict[str, Any]):
+        """Send an event to the run's callback and to every subscriber"""
+        with self._subscribers_lock:
+            callbacks = list(self._subscribers)
+        if on_progress:
+            callbacks.insert(0, on_progress)
+        
+        for callback in callbacks:
+            try:
+                callback(event)
+            except Exception as e:
+                # A broken listener must not fail the document
+                print(f"⚠️ Progress callback failed: {e}")
+    
+    def _stream_callback(self, step: Dict[str, Any], run_context: Dict[str, Any], index: int):
+        """Return the chunk callback for one section of a streaming step, or None"""
+        on_stream = run_context['on_stream']
+        if not on_stream or not step.get('stream_field'):
+            return None
+        return lambda chunk: on_stream(step['name'], index, chunk)
+    
+    def _split_step_content(self, step: Dict[str, Any], step_input: Dict[str, Any],
+                            run_context: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Split a step's content into sections when it should run per section
+        
+        Content at or below the chunking threshold runs as a single call.
+        Longer content is split at headings; sections are grouped into calls
+        of at most CHUNK_MAX_WORDS, keeping the previous run's groups whose
+        sections are all unchanged so their stored results still match. A
+        step with a section_source runs over that step's sections instead.
+        """
+        if not step.get('merge'):
+            return []
+        
+        source = step.get('section_source')
+        if source:
+            return run_context['sections'].get(source, [])
+        
+        content = step_input.get('content', '')
+        if len(content.split()) <= self.chunking_threshold:
+            return []
+        
+        return self._group_sections(content, run_context)
+    
+    def _group_sections(self, content: str, run_context: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Group unpacked heading sections into calls, reusing the page's stored layout"""
+        sections = self.chunker.split(content, run_context['headings'], pack=False)
+        hashes = [SectionResultStore.content_hash(section['text']) for section in sections]
+        
+        url = run_context['url']
+        store = self.section_store if url else None
+        layout = store.get_layout(url, run_context['persona']) if store else []
+        # Try the largest stored groups first
+        layout = sorted(layout, key=len, reverse=True)
+        
+        groups = []
+        changed = []
+        index = 0
+        while index < len(sections):
+            match = next((group for group in layout if group and hashes[index:index + len(group)] == group), None)
+            if match:
+                groups.extend(self._pack_sections(changed))
+                changed = []
+                groups.append(self._make_group(sections[index:index + len(match)], match))
+                index += len(match)
+            else:
+                changed.append((sections[index], hashes[index]))
+                index += 1
+        groups.extend(self._pack_sections(changed))
+        
+        if store:
+            store.save_layout(url, run_context['persona'], [group['section_hashes'] for group in groups])
+        return groups
+    
+    def _pack_sections(self, sections: List[tuple]) -> List[Dict[str, Any]]:
+        """Pack neighbouring (section, hash) pairs into groups of at most max_words"""
+        groups = []
+        current = []
+        for section, section_hash in sections:
+            if current and sum(s['word_count'] for s, _ in current) + section['word_count'] > self.chunker.max_words:
+                groups.append(current)
+                current = []
+            current.append((section, section_hash))
+        if current:
+            groups.append(current)
+        
+        return [
+            self._make_group([section for section, _ in group], [section_hash for _, section_hash in group])
+            for group in groups
+        ]
+    
+    def _make_group(self, sections: List[Dict[str, Any]], section_hashes: List[str]) -> Dict[str, Any]:
+        """Join sections into one call, remembering which sections it covers"""
+        return {
+            'heading': sections[0]['heading'],
+            'text': '\n\n'.join(section['text'] for section in sections),
+            'word_count': sum(section['word_count'] for section in sections),
+            'section_hashes': section_hashes
+        }
+    
+    def _output_sections(self, step: Dict[str, Any], sections: List[Dict[str, Any]],
+                         section_results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Sections later steps run over: the step's own, with section_text applied"""
+        if not step.get('section_text'):
+            return sections
+        
+        output = []
+        for section, result in zip(sections, section_results):
+            text = step['section_text'](section, result)
+            output.append({**section, 'text': text, 'word_count': len(text.split())})
+        return output
+    
     def _log_step(self, results: Dict[str, Any], message: str):
         """Log a processing step"""
-        log_entry = {
+        self._append_log_entry(results, self._make_log_entry(message))
+    
+    def _make_log_entry(self, message: str) -> Dict[str, Any]:
+        """Create a timestamped log entry"""
+        return {
             'timestamp': datetime.now().isoformat(),
             'message': message
         }
+    
+    def _append_log_entry(self, results: Dict[str, Any], log_entry: Dict[str, Any]):
+        """Append a log entry to the run results and the orchestrator log"""
         results['execution_log'].append(log_entry)
         self.execution_log.append(log_entry)
     
@@ -326,4 +902,18 @@ class AgentOrchestrator:
             'readability_level': metrics.get('readability_level', 'Standard'),
             'text_standard': metrics.get('text_standard', 'Unknown'),
             'paragraph_distribution': readability.get('visualization_data', {}).get('color_distribution', {})
-        }
\ No newline at end of file
+        }
+
+
+_orchestrator = None
+_orchestrator_lock = threading.Lock()
+
+
+def get_orchestrator() -> AgentOrchestrator:
+    """Return the process-wide orchestrator, building its agents on first use"""
+    global _orchestrator
+
+    with _orchestrator_lock:
+        if _orchestrator is None:
+            _orchestrator = AgentOrchestrator()
+        return _orchestrator
@@ -0,0 +1,215 @@
+from typing import Dict, Any, List
+import asyncio
+import json
+import os
+from datetime import datetime
+
+from orchestrator.agent_orchestrator import AgentOrchestrator, ProgressCallback, get_orchestrator
+from utils.content_scraper import ContentScraper
+from utils.payloads import results_for_storage
+from utils.readability_engine import get_readability_engine
+from utils.readability_pool import ReadabilityPool
+from config import BATCH_MAX_WORKERS, ORCHESTRATOR_MAX_CONCURRENCY
+
+
+class BatchProcessor:
+    """
+    Processes many documentation URLs and streams results to a JSONL file
+
+    With metrics_only, pages skip the agents entirely: readability is scored
+    on a process pool and no LLM calls are made.
+    """
+
+    def __init__(self, orchestrator: AgentOrchestrator = None, scraper: ContentScraper = None,
+                 max_workers: int = BATCH_MAX_WORKERS, max_concurrency: int = ORCHESTRATOR_MAX_CONCURRENCY,
+                 metrics_only: bool = False, readability_pool: ReadabilityPool = None,
+                 on_progress: ProgressCallback = None):
+        self.metrics_only = metrics_only
+        self.on_progress = on_progress
+        self.orchestrator = None if metrics_only else orchestrator or get_orchestrator()
+        self.readability_pool = (readability_pool or ReadabilityPool()) if metrics_only else None
+        self.scraper = scraper or ContentScraper()
+        self.max_workers = max_workers
+        self.max_concurrency = max_concurrency
+
+    def run(self, urls: List[str], output_path: str, persona: str = "Marketer",
+            previous_output: str = None) -> Dict[str, Any]:
+        """Synchronous wrapper around arun"""
+        return asyncio.run(self.arun(urls, output_path, persona, previous_output))
+
+    async def arun(self, urls: List[str], output_path: str, persona: str = "Marketer",
+                   previous_output: str = None) -> Dict[str, Any]:
+        """
+        Scrape and process every URL with a bounded worker pool
+
+        One JSON record is appended to output_path as each document completes.
+        URLs that already have a successful record in output_path are skipped,
+        so an interrupted run resumes where it left off.
+
+        When previous_output names the results file of an earlier audit, pages
+        whose scraped content hash is unchanged reuse their previous record
+        instead of going through the agents again.
+
+        Args:
+            urls: Documentation URLs to process
+            output_path: JSONL file receiving one record per document
+            persona: Target persona for analysis
+            previous_output: Optional JSONL results file from an earlier run
+
+        Returns:
+            Summary with counts of processed, unchanged, failed and skipped URLs,
+            plus syllable cache statistics
+        """
+        completed = self._load_records(output_path)
+        previous = self._load_records(previous_output) if previous_output else {}
+        todo = [url for url in dict.fromkeys(urls) if url not in completed]
+
+        summary = {
+            'total': len(dict.fromkeys(urls)),
+            'skipped': len(dict.fromkeys(urls)) - len(todo),
+            'processed': 0,
+            'unchanged': 0,
+            'failed': 0,
+            'output_path': output_path
+        }
+
+        queue = asyncio.Queue()
+        for url in todo:
+            queue.put_nowait(url)
+
+        # One semaphore bounds LLM calls across all documents in flight
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        directory = os.path.dirname(output_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._terminate_partial_line(output_path)
+
+        with open(output_path, 'a', encoding='utf-8') as output_file:
+            workers = [
+                asyncio.create_task(self._worker(queue, output_file, persona, semaphore, summary, previous))
+                for _ in range(min(self.max_workers, len(todo)))
+            ]
+            try:
+                await asyncio.gather(*workers)
+            finally:
+                await self.scraper.aclose()
+                if self.readability_pool:
+                    self.readability_pool.close()
+
+        if self.readability_pool:
+            summary['syllable_cache'] = self.readability_pool.stats()
+        else:
+            summary['syllable_cache'] = get_readability_engine().cache.stats()
+
+        return summary
+
+    async def _worker(self, queue: asyncio.Queue, output_file, persona: str, semaphore: asyncio.Semaphore,
+                      summary: Dict[str, Any], previous: Dict[str, Dict[str, Any]]):
+        """Process URLs from the queue until it is empty"""
+        while True:
+            try:
+                url = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+
+            record = await self._process_url(url, persona, semaphore, previous.get(url))
+            self._write_record(output_file, record)
+
+            if record.get('unchanged'):
+                summary['unchanged'] += 1
+                print(f"⏭️ {url} (unchanged)")
+            elif record['status'] == 'ok':
+                summary['processed'] += 1
+                print(f"✓ {url}")
+            else:
+                summary['failed'] += 1
+                print(f"❌ {url}: {record['error']}")
+
+    async def _process_url(self, url: str, persona: str, semaphore: asyncio.Semaphore,
+                           previous_record: Dict[str, Any] = None) -> Dict[str, Any]:
+        """Scrape and process a single URL into an output record"""
+        record = {
+            'url': url,
+            'persona': persona,
+            'metrics_only': self.metrics_only,
+            'status': 'ok',
+            'completed_at': None,
+            'error': None,
+            'results': None
+        }
+
+        try:
+            content_data = await self.scraper.ascrape_url(url)
+
+            if 'error' in content_data:
+                record['status'] = 'error'
+                record['error'] = f"Failed to scrape content: {content_data['error']}"
+            elif self._is_unchanged(content_data, persona, previous_record):
+                record['results'] = previous_record['results']
+                record['unchanged'] = True
+            elif self.metrics_only:
+                readability = await self.readability_pool.ascore(content_data.get('text', ''))
+                record['results'] = results_for_storage({'input_data': content_data, 'readability': readability})
+            else:
+                results = await self.orchestrator.aprocess_documentation(
+                    content_data, persona, semaphore, on_progress=self.on_progress
+                )
+                record['results'] = results_for_storage(results)
+                if 'error' in results:
+                    record['status'] = 'error'
+                    record['error'] = results['error']
+
+        except Exception as e:
+            record['status'] = 'error'
+            record['error'] = str(e)
+
+        record['completed_at'] = datetime.now().isoformat()
+        return record
+
+    def _is_unchanged(self, content_data: Dict[str, Any], persona: str,
+                      previous_record: Dict[str, Any] = None) -> bool:
+        """Check whether a page's content matches a previous successful record"""
+        if not previous_record or previous_record.get('persona') != persona:
+            return False
+        if previous_record.get('metrics_only', False) != self.metrics_only:
+            return False
+
+        previous_input = (previous_record.get('results') or {}).get('input_data') or {}
+        content_hash = content_data.get('content_hash')
+        return bool(content_hash) and content_hash == previous_input.get('content_hash')
+
+    def _write_record(self, output_file, record: Dict[str, Any]):
+        """Append a record and flush it to disk so progress survives a crash"""
+        output_file.write(json.dumps(record, default=str) + '\n')
+        output_file.flush()
+        os.fsync(output_file.fileno())
+
+    def _terminate_partial_line(self, output_path: str):
+        """Make sure new records do not get appended to a partially written line"""
+        if not os.path.exists(output_path) or os.path.getsize(output_path) == 0:
+            return
+
+        with open(output_path, 'rb+') as f:
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) != b'\n':
+                f.write(b'\n')
+
+    def _load_records(self, output_path: str) -> Dict[str, Dict[str, Any]]:
+        """Return the latest successful record for each URL in a results file"""
+        records = {}
+
+        if not os.path.exists(output_path):
+            return records
+
+        with open(output_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # A crash can leave a partially written last line
+                    continue
+                if record.get('status') == 'ok':
+                    records[record.get('url')] = record
+
+        return records
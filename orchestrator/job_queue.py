@@ -0,0 +1,210 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from typing import Any, Dict, List, Optional
+
+from utils.payloads import results_for_storage
+from config import JOB_QUEUE_PATH, JOB_STALE_SECONDS, JOB_RETENTION_SECONDS
+
+# Jobs in these states still have a worker on them or waiting for one
+ACTIVE_STATUSES = ('queued', 'running')
+
+
+class JobQueue:
+    """
+    SQLite-backed queue of documentation processing jobs
+
+    The Streamlit app submits jobs and polls their progress events; worker
+    processes claim queued jobs and report back. Every process opens its own
+    connection to the same file, and claims happen in an immediate
+    transaction so two workers never take the same job. Jobs belong to a
+    pool, the fingerprint of the API key they run with; the key itself is
+    never stored (see WorkerPool.register_key). Finished and failed jobs are
+    deleted with their events retention_seconds after they finish.
+    """
+
+    def __init__(self, path: str = JOB_QUEUE_PATH, stale_seconds: float = JOB_STALE_SECONDS,
+                 retention_seconds: float = JOB_RETENTION_SECONDS):
+        self.path = path
+        self.stale_seconds = stale_seconds
+        self.retention_seconds = retention_seconds
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        # Autocommit mode; writes open their own transactions in _transaction
+        self._conn = sqlite3.connect(path, timeout=30, isolation_level=None, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS jobs (
+                id TEXT PRIMARY KEY,
+                pool TEXT NOT NULL,
+                url TEXT NOT NULL,
+                persona TEXT NOT NULL,
+                status TEXT NOT NULL,
+                progress REAL NOT NULL DEFAULT 0,
+                message TEXT NOT NULL DEFAULT '',
+                preview TEXT NOT NULL DEFAULT '',
+                result TEXT,
+                error TEXT,
+                worker TEXT,
+                created_at REAL NOT NULL,
+                started_at REAL,
+                updated_at REAL NOT NULL,
+                finished_at REAL
+            );
+            CREATE INDEX IF NOT EXISTS jobs_by_status_time ON jobs (status, created_at);
+            CREATE INDEX IF NOT EXISTS jobs_by_finish ON jobs (finished_at);
+            CREATE TABLE IF NOT EXISTS job_events (
+                seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                job_id TEXT NOT NULL,
+                timestamp REAL NOT NULL,
+                message TEXT NOT NULL,
+                progress REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS job_events_by_job ON job_events (job_id, seq);
+        """)
+        columns = {row['name'] for row in self._conn.execute("PRAGMA table_info(jobs)")}
+        if 'api_key' in columns:
+            # Queue files from when jobs carried their key: do not leave keys on disk
+            self._conn.execute("UPDATE jobs SET api_key = NULL WHERE api_key IS NOT NULL")
+
+    @contextmanager
+    def _transaction(self):
+        """Hold the write lock of the database for the duration of the block"""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield self._conn
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+
+    def submit(self, url: str, persona: str, pool: str) -> str:
+        """Queue a job and return its id; a matching job still queued or running is reused"""
+        now = time.time()
+
+        with self._transaction() as conn:
+            row = conn.execute(
+                f"SELECT id FROM jobs WHERE pool = ? AND url = ? AND persona = ? "
+                f"AND status IN ({','.join('?' for _ in ACTIVE_STATUSES)}) ORDER BY created_at LIMIT 1",
+                (pool, url, persona, *ACTIVE_STATUSES)
+            ).fetchone()
+            if row:
+                return row['id']
+
+            job_id = uuid.uuid4().hex
+            conn.execute(
+                "INSERT INTO jobs (id, pool, url, persona, status, message, created_at, updated_at) "
+                "VALUES (?, ?, ?, ?, 'queued', 'Waiting for a worker...', ?, ?)",
+                (job_id, pool, url, persona, now, now)
+            )
+            return job_id
+
+    def claim(self, worker: str, pools: List[str]) -> Optional[Dict[str, Any]]:
+        """
+        Take the oldest queued job of one of the pools, those the worker holds a key for
+
+        Jobs whose worker went silent are requeued first, and jobs finished
+        longer than retention_seconds ago are deleted along with their events.
+        """
+        now = time.time()
+
+        with self._transaction() as conn:
+            expired_before = now - self.retention_seconds
+            conn.execute(
+                "DELETE FROM job_events WHERE job_id IN (SELECT id FROM jobs WHERE finished_at < ?)",
+                (expired_before,)
+            )
+            conn.execute("DELETE FROM jobs WHERE finished_at < ?", (expired_before,))
+            conn.execute(
+                "UPDATE jobs SET status = 'queued', worker = NULL, updated_at = ? "
+                "WHERE status = 'running' AND updated_at < ?",
+                (now, now - self.stale_seconds)
+            )
+            if not pools:
+                return None
+            row = conn.execute(
+                f"SELECT * FROM jobs WHERE status = 'queued' AND pool IN ({','.join('?' for _ in pools)}) "
+                f"ORDER BY created_at LIMIT 1",
+                tuple(pools)
+            ).fetchone()
+            if row is None:
+                return None
+
+            conn.execute(
+                "UPDATE jobs SET status = 'running', worker = ?, started_at = ?, updated_at = ? WHERE id = ?",
+                (worker, now, now, row['id'])
+            )
+            return dict(row, status='running', worker=worker)
+
+    def report(self, job_id: str, message: str, progress: float):
+        """Record a progress event; it also serves as the worker's heartbeat"""
+        now = time.time()
+
+        with self._transaction() as conn:
+            conn.execute(
+                "INSERT INTO job_events (job_id, timestamp, message, progress) VALUES (?, ?, ?, ?)",
+                (job_id, now, message, progress)
+            )
+            conn.execute(
+                "UPDATE jobs SET message = ?, progress = ?, updated_at = ? WHERE id = ?",
+                (message, progress, now, job_id)
+            )
+
+    def set_preview(self, job_id: str, preview: str):
+        """Store the partial rewrite generated so far"""
+        with self._transaction() as conn:
+            conn.execute("UPDATE jobs SET preview = ?, updated_at = ? WHERE id = ?", (preview, time.time(), job_id))
+
+    def complete(self, job_id: str, worker: str, result: Dict[str, Any]) -> bool:
+        """
+        Mark a job done and store its results, without the raw page HTML and markdown
+
+        Returns False, storing nothing, when the worker no longer holds the
+        job: it went stale and was requeued or claimed by another worker.
+        """
+        return self._finish(job_id, worker, 'done', result=json.dumps(results_for_storage(result), default=str))
+
+    def fail(self, job_id: str, worker: str, error: str) -> bool:
+        """Mark a job failed; like complete, only while the worker still holds it"""
+        return self._finish(job_id, worker, 'failed', error=error)
+
+    def _finish(self, job_id: str, worker: str, status: str, result: str = None, error: str = None) -> bool:
+        now = time.time()
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                "UPDATE jobs SET status = ?, result = ?, error = ?, progress = 1, "
+                "updated_at = ?, finished_at = ? WHERE id = ? AND worker = ? AND status = 'running'",
+                (status, result, error, now, now, job_id, worker)
+            )
+            return cursor.rowcount == 1
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Return a job with its parsed results once done, or None if unknown"""
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        if row is None:
+            return None
+
+        job = dict(row)
+        job.pop('api_key', None)
+        job['result'] = json.loads(job['result']) if job['result'] else None
+        return job
+
+    def events(self, job_id: str, after: int = 0) -> List[Dict[str, Any]]:
+        """Return the progress events of a job with a sequence number above after"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT seq, timestamp, message, progress FROM job_events WHERE job_id = ? AND seq > ? ORDER BY seq",
+                (job_id, after)
+            ).fetchall()
+        return [dict(row) for row in rows]
@@ -0,0 +1,180 @@
+import atexit
+import hashlib
+import multiprocessing
+import os
+import socket
+import time
+import traceback
+from typing import Any, Dict, List, Mapping
+
+from orchestrator.agent_orchestrator import AgentOrchestrator, get_orchestrator
+from orchestrator.job_queue import JobQueue
+from utils.content_scraper import ContentScraper
+from utils.llm_client import share_rate_limit, use_api_key
+from config import JOB_POLL_SECONDS, JOB_QUEUE_PATH, JOB_WORKERS
+
+# Share of the progress bar covered by scraping; the agent steps fill the rest
+SCRAPE_PROGRESS = 0.1
+
+
+def job_pool(api_key: str = None) -> str:
+    """Name the pool of jobs for an API key by a fingerprint of the key"""
+    api_key = api_key if api_key is not None else os.getenv("OPENAI_API_KEY", "")
+    return hashlib.sha256(api_key.encode('utf-8')).hexdigest()[:16]
+
+
+class JobWorker:
+    """
+    Claims jobs from the queue and runs them through the scraper and the agents
+
+    api_keys maps job pools to their API keys; the worker only takes jobs of
+    pools it has a key for. Without it, the worker serves the pool of its own
+    OPENAI_API_KEY.
+    """
+
+    def __init__(self, job_queue: JobQueue = None, scraper: ContentScraper = None,
+                 orchestrator: AgentOrchestrator = None, poll_interval: float = JOB_POLL_SECONDS,
+                 api_keys: Mapping[str, str] = None):
+        self.job_queue = job_queue or JobQueue()
+        self.scraper = scraper or ContentScraper()
+        self.orchestrator = orchestrator or get_orchestrator()
+        self.poll_interval = poll_interval
+        self.api_keys = api_keys
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}"
+
+    def run_forever(self):
+        """Process jobs as they are queued"""
+        while True:
+            if not self.run_once():
+                time.sleep(self.poll_interval)
+
+    def run_once(self) -> bool:
+        """Process the next queued job, if any; returns whether there was one"""
+        pools = list(self.api_keys.keys()) if self.api_keys is not None else [job_pool()]
+        job = self.job_queue.claim(self.worker_id, pools)
+        if job is None:
+            return False
+
+        try:
+            self._process(job)
+        except Exception as e:
+            traceback.print_exc()
+            self.job_queue.fail(job['id'], self.worker_id, str(e))
+        return True
+
+    def _process(self, job: Dict[str, Any]):
+        job_id = job['id']
+
+        self.job_queue.report(job_id, "🔍 Scraping documentation content...", 0.0)
+        content_data = self.scraper.scrape_url(job['url'])
+        if 'error' in content_data:
+            self.job_queue.fail(job_id, self.worker_id, content_data['error'])
+            return
+
+        self.job_queue.report(job_id, "🧠 Processing with AI agents...", SCRAPE_PROGRESS)
+
+        def on_progress(event: Dict[str, Any]):
+            if event['event'] not in ('step_start', 'step_end'):
+                return
+            message = event['message']
+            if event['event'] == 'step_end':
+                message += f" ({event['duration']:.1f}s)"
+            progress = SCRAPE_PROGRESS + (1 - SCRAPE_PROGRESS) * event['completed_steps'] / event['total_steps']
+            self.job_queue.report(job_id, message, progress)
+
+        # Agent tasks inherit the key from this context, on the orchestrator's loop too
+        api_key = self.api_keys.get(job['pool']) if self.api_keys is not None else None
+        with use_api_key(api_key or None):
+            results = self.orchestrator.process_documentation(
+                content_data, job['persona'], on_stream=self._preview_writer(job_id), on_progress=on_progress
+            )
+
+        if not results or 'error' in results:
+            self.job_queue.fail(job_id, self.worker_id, f"Processing failed: {results.get('error', 'Unknown error')}")
+            return
+
+        if not self.job_queue.complete(job_id, self.worker_id, results):
+            print(f"⚠️ Job {job_id} was requeued while it ran; its results were discarded")
+
+    def _preview_writer(self, job_id: str):
+        """Build an on_stream callback that stores the partial rewrite at most once per poll interval"""
+        sections = {}
+        last_write = [0.0]
+
+        def on_stream(step_name: str, section_index: int, chunk: str):
+            sections[section_index] = sections.get(section_index, '') + chunk
+
+            now = time.monotonic()
+            if now - last_write[0] < self.poll_interval:
+                return
+            last_write[0] = now
+
+            self.job_queue.set_preview(job_id, '\n\n'.join(sections[index] for index in sorted(sections)))
+
+        return on_stream
+
+
+def run_worker(path: str = JOB_QUEUE_PATH, workers: int = 1, api_keys: Mapping[str, str] = None):
+    """Worker process entry point; each of the workers gets an equal share of the rate limits"""
+    share_rate_limit(workers)
+    JobWorker(JobQueue(path), api_keys=api_keys).run_forever()
+
+
+class WorkerPool:
+    """
+    A fixed number of local worker processes serving every registered API key
+
+    Keys reach the workers through a multiprocessing manager owned by the
+    pool, so they stay in memory and go away with the process that started
+    the pool; the queue only sees their fingerprints. Workers are spawned,
+    so they start from a clean interpreter and inherit the environment at
+    the time of start().
+    """
+
+    def __init__(self, workers: int = JOB_WORKERS, path: str = JOB_QUEUE_PATH):
+        self.workers = workers
+        self.path = path
+        self._processes: List[multiprocessing.Process] = []
+        self._manager = None
+        self._api_keys = None
+
+    def start(self):
+        """Start the key manager and the worker processes"""
+        context = multiprocessing.get_context('spawn')
+        if self.workers:
+            self._manager = context.Manager()
+            self._api_keys = self._manager.dict()
+        for index in range(self.workers):
+            process = context.Process(
+                target=run_worker, args=(self.path, self.workers, self._api_keys),
+                name=f"job-worker-{index}", daemon=True
+            )
+            process.start()
+            self._processes.append(process)
+        atexit.register(self.close)
+        return self
+
+    def register_key(self, api_key: str) -> str:
+        """Let the workers run jobs submitted with api_key, and return the pool to submit them to"""
+        pool = job_pool(api_key)
+        if self._api_keys is not None and self._api_keys.get(pool) != api_key:
+            self._api_keys[pool] = api_key
+        return pool
+
+    def join(self):
+        """Wait for the workers; they only exit when stopped"""
+        for process in self._processes:
+            process.join()
+
+    def close(self):
+        """Stop the worker processes; jobs they were running are requeued once stale"""
+        for process in self._processes:
+            if process.is_alive():
+                process.terminate()
+        for process in self._processes:
+            process.join()
+        self._processes = []
+        if self._manager is not None:
+            self._manager.shutdown()
+            self._manager = None
+            self._api_keys = None
@@ -0,0 +1,80 @@
+from typing import Any, Dict, List
+
+
+def merge_json_results(results: List[Dict[str, Any]], sections: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Merge per-section JSON results from one agent into a single result
+
+    Numeric fields (scores) are averaged weighted by section word count, lists
+    are concatenated in section order and other values keep the first
+    non-empty value. Sections that failed are left out of the merge.
+    """
+    successful = [
+        (result, section['word_count'])
+        for result, section in zip(results, sections)
+        if isinstance(result, dict) and 'error' not in result
+    ]
+
+    if not successful:
+        return results[0]
+
+    merged = _merge_values([result for result, _ in successful], [weight for _, weight in successful])
+    merged['sections_processed'] = len(successful)
+    return merged
+
+
+def merge_rewrite_results(results: List[Dict[str, Any]], sections: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Stitch per-section rewrites back together in document order
+
+    A section whose rewrite failed keeps its original text so the document
+    stays complete.
+    """
+    parts = []
+    applied = False
+
+    for result, section in zip(results, sections):
+        if 'error' in result or not result.get('rewritten_content'):
+            parts.append(section['text'])
+        else:
+            parts.append(result['rewritten_content'])
+            applied = True
+
+    if not applied:
+        return results[0]
+
+    rewritten_content = '\n\n'.join(parts)
+    return {
+        'rewritten_content': rewritten_content,
+        'word_count': len(rewritten_content.split()),
+        'improvement_applied': True,
+        'sections_processed': len(sections)
+    }
+
+
+def _merge_values(values: List[Any], weights: List[float]) -> Any:
+    """Recursively merge values of the same field from several results"""
+    if all(isinstance(value, dict) for value in values):
+        merged = {}
+        keys = []
+        for value in values:
+            keys.extend(key for key in value if key not in keys)
+
+        for key in keys:
+            present = [(value[key], weight) for value, weight in zip(values, weights) if key in value]
+            merged[key] = _merge_values([v for v, _ in present], [w for _, w in present])
+        return merged
+
+    if all(isinstance(value, list) for value in values):
+        return [item for value in values for item in value]
+
+    if all(isinstance(value, (int, float)) and not isinstance(value, bool) for value in values):
+        total_weight = sum(weights)
+        if not total_weight:
+            return sum(values) / len(values)
+        return round(sum(value * weight for value, weight in zip(values, weights)) / total_weight, 1)
+
+    for value in values:
+        if value:
+            return value
+    return values[0]
@@ -0,0 +1,119 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List
+
+from config import SECTION_STORE_PATH
+
+
+class SectionResultStore:
+    """
+    Persistent per-section agent results used for incremental re-analysis
+
+    Results are scoped by (url, persona, step) and keyed by a hash of the
+    section's full agent input, so an edited section misses while untouched
+    sections are reused. Saving a step's sections drops the ones that no
+    longer appear on the page.
+
+    The store also keeps each page's layout: how its heading sections,
+    identified by content hash, were grouped into agent calls. Reusing
+    groups whose sections are all unchanged keeps their boundaries, and so
+    their stored results, stable across edits elsewhere on the page.
+    """
+
+    def __init__(self, path: str = SECTION_STORE_PATH):
+        self.path = path
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS section_results (
+                url TEXT NOT NULL,
+                persona TEXT NOT NULL,
+                step TEXT NOT NULL,
+                section_hash TEXT NOT NULL,
+                result TEXT NOT NULL,
+                updated_at REAL NOT NULL,
+                PRIMARY KEY (url, persona, step, section_hash)
+            )
+        """)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS section_layouts (
+                url TEXT NOT NULL,
+                persona TEXT NOT NULL,
+                layout TEXT NOT NULL,
+                updated_at REAL NOT NULL,
+                PRIMARY KEY (url, persona)
+            )
+        """)
+        self._conn.commit()
+
+    @staticmethod
+    def section_hash(section_input: Dict[str, Any]) -> str:
+        """Hash a section's complete agent input"""
+        material = json.dumps(section_input, sort_keys=True, default=str)
+        return hashlib.sha256(material.encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def content_hash(text: str) -> str:
+        """Hash a section's text, to recognise it in a page's layout"""
+        return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+    def get_layout(self, url: str, persona: str) -> List[List[str]]:
+        """Return the section content hashes of each group of the page's last run"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT layout FROM section_layouts WHERE url = ? AND persona = ?", (url, persona)
+            ).fetchone()
+        return json.loads(row[0]) if row else []
+
+    def save_layout(self, url: str, persona: str, layout: List[List[str]]):
+        """Store the grouping of the page's sections used by this run"""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO section_layouts (url, persona, layout, updated_at) VALUES (?, ?, ?, ?)",
+                (url, persona, json.dumps(layout), time.time())
+            )
+            self._conn.commit()
+
+    def get_many(self, url: str, persona: str, step: str, hashes: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Return stored results for the given section hashes"""
+        if not hashes:
+            return {}
+
+        placeholders = ','.join('?' for _ in hashes)
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT section_hash, result FROM section_results "
+                f"WHERE url = ? AND persona = ? AND step = ? AND section_hash IN ({placeholders})",
+                (url, persona, step, *hashes)
+            ).fetchall()
+
+        return {section_hash: json.loads(result) for section_hash, result in rows}
+
+    def replace(self, url: str, persona: str, step: str, results: Dict[str, Dict[str, Any]]):
+        """Store the current sections of a step, dropping sections no longer on the page"""
+        now = time.time()
+
+        with self._lock:
+            self._conn.execute(
+                "DELETE FROM section_results WHERE url = ? AND persona = ? AND step = ?",
+                (url, persona, step)
+            )
+            self._conn.executemany(
+                "INSERT INTO section_results (url, persona, step, section_hash, result, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                [
+                    (url, persona, step, section_hash, json.dumps(result, default=str), now)
+                    for section_hash, result in results.items()
+                ]
+            )
+            self._conn.commit()
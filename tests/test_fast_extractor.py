@@ -0,0 +1,62 @@
+import pytest
+
+pytest.importorskip('lxml')
+pytest.importorskip('bs4')
+pytest.importorskip('html2text')
+
+from utils.content_scraper import ContentScraper
+from utils.fast_extractor import FastContentExtractor
+
+# UTF-8 page without a <meta charset>, as served by many documentation sites
+UNDECLARED_UTF8_PAGE = """<html><head><title>Café guide</title></head><body><main>
+<h1>Getting started ¶</h1>
+<p>Naïve résumé of the “quick start” — about 5 µs per call.</p>
+</main></body></html>""".encode('utf-8')
+
+TABLE_PAGE = b"""<html><body><main>
+<h2>Options</h2>
+<table>
+<tr><th>Name</th><th>Default</th></tr>
+<tr><td>timeout</td><td>10</td></tr>
+<tr><td>retries</td><td>5</td></tr>
+</table>
+</main></body></html>"""
+
+
+def scrape(html: bytes, engine: str) -> dict:
+    scraper = ContentScraper(use_http_cache=False, engine=engine)
+    return scraper._parse_html(html, 'https://docs.example.com/start')
+
+
+def test_undeclared_utf8_is_not_read_as_latin1():
+    extracted = FastContentExtractor().extract(UNDECLARED_UTF8_PAGE, 'https://docs.example.com/start')
+
+    assert extracted['title'] == 'Café guide'
+    assert extracted['headings'] == [{'level': 1, 'text': 'Getting started ¶'}]
+    assert 'Naïve résumé of the “quick start” — about 5 µs per call.' in extracted['markdown']
+
+
+def test_non_ascii_text_matches_bs4_engine():
+    fast = scrape(UNDECLARED_UTF8_PAGE, 'lxml')
+    baseline = scrape(UNDECLARED_UTF8_PAGE, 'bs4')
+
+    assert fast['title'] == baseline['title']
+    assert fast['headings'] == baseline['headings']
+    assert fast['text'].split() == baseline['text'].split()
+
+
+def test_str_input_is_accepted():
+    extracted = FastContentExtractor().extract(UNDECLARED_UTF8_PAGE.decode('utf-8'), 'https://docs.example.com/start')
+
+    assert extracted['headings'] == [{'level': 1, 'text': 'Getting started ¶'}]
+
+
+def test_table_header_row_is_underlined_like_html2text():
+    fast = scrape(TABLE_PAGE, 'lxml')
+    baseline = scrape(TABLE_PAGE, 'bs4')
+
+    def table_lines(text):
+        return [line.replace(' ', '') for line in text.split('\n') if '|' in line]
+
+    assert table_lines(fast['markdown']) == table_lines(baseline['markdown'])
+    assert table_lines(fast['markdown'])[1] == '---|---'
@@ -0,0 +1,45 @@
+from utils.url_sources import load_sitemap
+
+MEDIA_SITEMAP = """<?xml version="1.0" encoding="UTF-8"?>
+<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9"
+        xmlns:image="http://www.google.com/schemas/sitemap-image/1.1"
+        xmlns:video="http://www.google.com/schemas/sitemap-video/1.1">
+  <url>
+    <loc>https://docs.example.com/start</loc>
+    <image:image>
+      <image:loc>https://docs.example.com/img/diagram.png</image:loc>
+    </image:image>
+  </url>
+  <url>
+    <loc> https://docs.example.com/tutorial </loc>
+    <video:video>
+      <video:thumbnail_loc>https://docs.example.com/img/thumb.jpg</video:thumbnail_loc>
+      <video:content_loc>https://docs.example.com/media/tutorial.mp4</video:content_loc>
+      <video:player_loc>https://docs.example.com/player?id=1</video:player_loc>
+    </video:video>
+  </url>
+</urlset>
+"""
+
+
+def write(tmp_path, name, content):
+    path = tmp_path / name
+    path.write_text(content, encoding='utf-8')
+    return str(path)
+
+
+def test_image_and_video_locations_are_not_pages(tmp_path):
+    path = write(tmp_path, 'sitemap.xml', MEDIA_SITEMAP)
+
+    assert load_sitemap(path) == ['https://docs.example.com/start', 'https://docs.example.com/tutorial']
+
+
+def test_sitemap_index_is_followed(tmp_path):
+    child = write(tmp_path, 'pages.xml', MEDIA_SITEMAP)
+    index = write(tmp_path, 'index.xml', f"""<?xml version="1.0" encoding="UTF-8"?>
+<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+  <sitemap><loc>{child}</loc></sitemap>
+</sitemapindex>
+""")
+
+    assert load_sitemap(index) == ['https://docs.example.com/start', 'https://docs.example.com/tutorial']
@@ -0,0 +1,57 @@
+import asyncio
+import time
+from typing import Dict
+from urllib.parse import urlparse
+
+import httpx
+
+from config import (
+    SCRAPER_USER_AGENT, SCRAPER_TIMEOUT, SCRAPER_POOL_SIZE,
+    SCRAPER_MAX_CONNECTIONS_PER_HOST, SCRAPER_POLITENESS_DELAY
+)
+
+
+class AsyncPageFetcher:
+    """Keep-alive async HTTP fetcher with per-host connection limits and politeness delay"""
+
+    def __init__(self, max_connections: int = SCRAPER_POOL_SIZE,
+                 max_connections_per_host: int = SCRAPER_MAX_CONNECTIONS_PER_HOST,
+                 politeness_delay: float = SCRAPER_POLITENESS_DELAY, timeout: float = SCRAPER_TIMEOUT):
+        self.max_connections_per_host = max_connections_per_host
+        self.politeness_delay = politeness_delay
+        self.client = httpx.AsyncClient(
+            headers={'User-Agent': SCRAPER_USER_AGENT},
+            timeout=timeout,
+            follow_redirects=True,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections
+            )
+        )
+        self._host_slots: Dict[str, asyncio.Semaphore] = {}
+        self._next_request_time: Dict[str, float] = {}
+
+    async def fetch(self, url: str, headers: Dict[str, str] = None) -> httpx.Response:
+        """GET a URL, waiting for a free per-host slot and the politeness delay"""
+        host = urlparse(url).netloc
+        slot = self._host_slots.setdefault(host, asyncio.Semaphore(self.max_connections_per_host))
+
+        async with slot:
+            await self._wait_turn(host)
+            return await self.client.get(url, headers=headers)
+
+    async def _wait_turn(self, host: str):
+        """Space requests to the same host at least politeness_delay apart"""
+        if not self.politeness_delay:
+            return
+
+        now = time.monotonic()
+        scheduled = max(now, self._next_request_time.get(host, 0.0))
+        self._next_request_time[host] = scheduled + self.politeness_delay
+
+        if scheduled > now:
+            await asyncio.sleep(scheduled - now)
+
+    async def aclose(self):
+        """Close pooled connections"""
+        await self.client.aclose()
@@ -0,0 +1,152 @@
+import asyncio
+import atexit
+import threading
+from typing import List
+
+from playwright.async_api import async_playwright
+
+from config import (
+    PLAYWRIGHT_POOL_SIZE, PLAYWRIGHT_WAIT_UNTIL, PLAYWRIGHT_WAIT_FOR_SELECTOR, PLAYWRIGHT_SELECTOR_TIMEOUT_MS,
+    PLAYWRIGHT_BLOCKED_RESOURCES, PLAYWRIGHT_TIMEOUT_MS, SCRAPER_USER_AGENT
+)
+
+
+class BrowserPool:
+    """
+    Long-lived headless Chromium serving a bounded number of fetches at once
+
+    Playwright runs on a dedicated event loop thread, so the pool can be
+    shared by synchronous callers in any thread and by other event loops.
+    Every fetch gets a fresh browser context, so cookies and storage never
+    carry over between sites, and blocks heavy resources such as images,
+    fonts and media.
+    """
+
+    def __init__(self, size: int = PLAYWRIGHT_POOL_SIZE, wait_until: str = PLAYWRIGHT_WAIT_UNTIL,
+                 wait_for_selector: str = PLAYWRIGHT_WAIT_FOR_SELECTOR,
+                 blocked_resource_types: List[str] = None, timeout_ms: int = PLAYWRIGHT_TIMEOUT_MS):
+        self.size = size
+        self.wait_until = wait_until
+        self.wait_for_selector = wait_for_selector
+        self.blocked_resource_types = set(
+            PLAYWRIGHT_BLOCKED_RESOURCES if blocked_resource_types is None else blocked_resource_types
+        )
+        self.timeout_ms = timeout_ms
+
+        self._lock = threading.Lock()
+        self._loop = None
+        self._thread = None
+        self._playwright = None
+        self._browser = None
+        self._slots = None
+
+    def fetch_html(self, url: str) -> str:
+        """Load a URL in a pooled page and return the rendered HTML"""
+        loop = self._ensure_started()
+        return asyncio.run_coroutine_threadsafe(self._fetch(url), loop).result()
+
+    async def afetch_html(self, url: str) -> str:
+        """Async variant of fetch_html for callers on another event loop"""
+        loop = self._ensure_started()
+        future = asyncio.run_coroutine_threadsafe(self._fetch(url), loop)
+        return await asyncio.wrap_future(future)
+
+    def close(self):
+        """Close the browser and stop the pool's event loop"""
+        with self._lock:
+            if self._loop is None:
+                return
+
+            try:
+                asyncio.run_coroutine_threadsafe(self._stop(), self._loop).result(timeout=30)
+            finally:
+                self._loop.call_soon_threadsafe(self._loop.stop)
+                self._thread.join(timeout=30)
+                self._loop = None
+                self._thread = None
+
+    def _ensure_started(self) -> asyncio.AbstractEventLoop:
+        """Launch the browser and its pages on first use"""
+        with self._lock:
+            if self._loop is not None:
+                return self._loop
+
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(target=loop.run_forever, name="browser-pool", daemon=True)
+            thread.start()
+
+            try:
+                asyncio.run_coroutine_threadsafe(self._start(), loop).result()
+            except Exception:
+                # Shut down the playwright driver if the browser failed to launch
+                asyncio.run_coroutine_threadsafe(self._stop(), loop).result(timeout=30)
+                loop.call_soon_threadsafe(loop.stop)
+                thread.join(timeout=30)
+                raise
+
+            self._loop = loop
+            self._thread = thread
+            return loop
+
+    async def _start(self):
+        self._playwright = await async_playwright().start()
+        self._browser = await self._playwright.chromium.launch(headless=True)
+        self._slots = asyncio.Semaphore(self.size)
+
+    async def _stop(self):
+        if self._browser is not None:
+            await self._browser.close()
+            self._browser = None
+        if self._playwright is not None:
+            await self._playwright.stop()
+            self._playwright = None
+
+    async def _new_page(self):
+        """Create a page in a fresh context with resource blocking enabled; close its context when done"""
+        context = await self._browser.new_context(user_agent=SCRAPER_USER_AGENT)
+        try:
+            if self.blocked_resource_types:
+                await context.route("**/*", self._route)
+            page = await context.new_page()
+        except Exception:
+            await context.close()
+            raise
+        page.set_default_timeout(self.timeout_ms)
+        return page
+
+    async def _route(self, route):
+        """Abort requests for blocked resource types"""
+        if route.request.resource_type in self.blocked_resource_types:
+            await route.abort()
+        else:
+            await route.continue_()
+
+    async def _fetch(self, url: str) -> str:
+        async with self._slots:
+            page = await self._new_page()
+            try:
+                await page.goto(url, wait_until=self.wait_until)
+                if self.wait_for_selector:
+                    try:
+                        await page.wait_for_selector(self.wait_for_selector, timeout=PLAYWRIGHT_SELECTOR_TIMEOUT_MS)
+                    except Exception:
+                        # Render whatever is there if the selector never shows up
+                        pass
+                return await page.content()
+            finally:
+                await page.context.close()
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_browser_pool() -> BrowserPool:
+    """Return the process-wide browser pool"""
+    global _pool
+
+    with _pool_lock:
+        if _pool is None:
+            _pool = BrowserPool()
+            atexit.register(_pool.close)
+        return _pool
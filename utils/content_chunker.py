@@ -0,0 +1,96 @@
+import re
+from typing import Any, Dict, List
+
+from config import CHUNK_MAX_WORDS
+
+HEADING_PATTERN = re.compile(r'^\s{0,3}#{1,6}\s+(.+?)\s*#*\s*$')
+
+
+class ContentChunker:
+    """Splits documentation text into sections along its heading structure"""
+
+    def __init__(self, max_words: int = CHUNK_MAX_WORDS):
+        self.max_words = max_words
+
+    def split(self, text: str, headings: List[Dict[str, Any]] = None, pack: bool = True) -> List[Dict[str, Any]]:
+        """
+        Split text into chunks of whole sections of at most max_words
+
+        Args:
+            text: Markdown text, as produced by ContentScraper
+            headings: Optional headings from ContentScraper._extract_headings, used
+                to recognise heading lines that lost their markdown markers
+            pack: Merge small neighbouring sections into one chunk. Unpacked
+                chunks keep their boundaries when other sections are edited.
+
+        Returns:
+            List of chunks in document order, each with heading, text and word_count
+        """
+        sections = self._split_sections(text, headings or [])
+
+        chunks = []
+        for section in sections:
+            if section['word_count'] > self.max_words:
+                chunks.extend(self._split_long_section(section))
+            elif pack and chunks and chunks[-1]['word_count'] + section['word_count'] <= self.max_words:
+                # Pack small neighbouring sections together to avoid tiny LLM calls
+                chunks[-1]['text'] += '\n\n' + section['text']
+                chunks[-1]['word_count'] += section['word_count']
+            else:
+                chunks.append(dict(section))
+
+        return chunks
+
+    def _split_sections(self, text: str, headings: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Split text at every heading line"""
+        heading_texts = {heading.get('text', '').strip() for heading in headings if heading.get('text')}
+
+        sections = []
+        current_heading = ''
+        current_lines = []
+
+        for line in text.split('\n'):
+            match = HEADING_PATTERN.match(line)
+            is_heading = bool(match) or line.strip() in heading_texts
+
+            if is_heading and any(l.strip() for l in current_lines):
+                sections.append(self._make_section(current_heading, current_lines))
+                current_lines = []
+
+            if is_heading:
+                current_heading = match.group(1) if match else line.strip()
+            current_lines.append(line)
+
+        if any(l.strip() for l in current_lines):
+            sections.append(self._make_section(current_heading, current_lines))
+
+        return sections
+
+    def _split_long_section(self, section: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Split an oversized section at paragraph boundaries"""
+        chunks = []
+        current = []
+        current_words = 0
+
+        for paragraph in section['text'].split('\n\n'):
+            words = len(paragraph.split())
+            if current and current_words + words > self.max_words:
+                chunks.append({'heading': section['heading'], 'text': '\n\n'.join(current), 'word_count': current_words})
+                current = []
+                current_words = 0
+            current.append(paragraph)
+            current_words += words
+
+        if current:
+            chunks.append({'heading': section['heading'], 'text': '\n\n'.join(current), 'word_count': current_words})
+
+        return chunks
+
+    def _make_section(self, heading: str, lines: List[str]) -> Dict[str, Any]:
+        """Build a section dictionary from its lines"""
+        section_text = '\n'.join(lines).strip()
+        return {
+            'heading': heading,
+            'text': section_text,
+            'word_count': len(section_text.split())
+        }
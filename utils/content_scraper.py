@@ -1,15 +1,53 @@
 import requests
+from requests.adapters import HTTPAdapter
 from bs4 import BeautifulSoup
 import html2text
-from playwright.sync_api import sync_playwright
+import asyncio
+import hashlib
 import re
+import threading
+import time
+from contextlib import contextmanager
+from urllib.parse import urlparse
+from utils.async_fetcher import AsyncPageFetcher
+from utils.browser_pool import get_browser_pool
+from utils.http_cache import HTTPCache
+from utils.fast_extractor import FastContentExtractor
+from config import (
+    SCRAPER_USER_AGENT, SCRAPER_TIMEOUT, SCRAPER_POOL_SIZE,
+    SCRAPER_MAX_CONNECTIONS_PER_HOST, SCRAPER_POLITENESS_DELAY, HTTP_CACHE_ENABLED, SCRAPER_ENGINE
+)
 
 class ContentScraper:
-    def __init__(self):
-        self.h = html2text.HTML2Text()
-        self.h.ignore_links = False
-        self.h.ignore_images = False
+    def __init__(self, pool_size: int = SCRAPER_POOL_SIZE,
+                 max_connections_per_host: int = SCRAPER_MAX_CONNECTIONS_PER_HOST,
+                 politeness_delay: float = SCRAPER_POLITENESS_DELAY,
+                 use_http_cache: bool = HTTP_CACHE_ENABLED,
+                 engine: str = SCRAPER_ENGINE):
+        # 'lxml' extracts in one pass; 'bs4' is the BeautifulSoup + html2text path
+        self.engine = engine
+        self.fast_extractor = FastContentExtractor()
         
+        # Keep-alive session so pages on the same host reuse connections
+        self.session = requests.Session()
+        self.session.headers['User-Agent'] = SCRAPER_USER_AGENT
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        
+        self.pool_size = pool_size
+        self.max_connections_per_host = max_connections_per_host
+        self.politeness_delay = politeness_delay
+        self._host_lock = threading.Lock()
+        self._host_slots = {}
+        self._next_request_time = {}
+        
+        self._async_fetcher = None
+        self._async_fetcher_loop = None
+        
+        # Conditional-request cache so unchanged pages are answered with 304s
+        self.http_cache = HTTPCache() if use_http_cache else None
+    
     def scrape_url(self, url: str) -> dict:
         """Scrape content from URL using both requests and playwright as fallback"""
         try:
@@ -27,30 +65,148 @@ class ContentScraper:
             print(f"Playwright failed: {e}")
             return {"error": f"Failed to scrape content: {e}"}
     
+    async def ascrape_url(self, url: str) -> dict:
+        """Async variant of scrape_url using the pooled async fetcher"""
+        try:
+            content = await self._ascrape_with_fetcher(url)
+            if content and len(content.get('text', '')) > 100:
+                return content
+        except Exception as e:
+            print(f"Async fetch failed: {e}")
+        
+        try:
+            # Fallback to playwright for dynamic content
+            return await self._ascrape_with_playwright(url)
+        except Exception as e:
+            print(f"Playwright failed: {e}")
+            return {"error": f"Failed to scrape content: {e}"}
+    
     def _scrape_with_requests(self, url: str) -> dict:
-        """Scrape using requests and BeautifulSoup"""
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
+        """Scrape using the pooled requests session and BeautifulSoup"""
+        cached = self.http_cache.get(url) if self.http_cache else None
+        headers = self.http_cache.conditional_headers(cached) if self.http_cache else {}
         
-        response = requests.get(url, headers=headers, timeout=10)
+        started = time.perf_counter()
+        response = self._get(url, headers)
+        fetched = time.perf_counter()
+        if response.status_code == 304 and cached:
+            return self._not_modified_result(cached, started, fetched)
         response.raise_for_status()
         
-        soup = BeautifulSoup(response.content, 'html.parser')
+        result = self._parse_html(response.content, url)
+        parsed = time.perf_counter()
+        if self.http_cache:
+            self.http_cache.store(url, response.headers, result)
+        result['timings'] = self._timings(started, fetched, parsed)
+        return result
+    
+    async def _ascrape_with_fetcher(self, url: str) -> dict:
+        """Scrape using the async fetcher, parsing off the event loop"""
+        cached = self.http_cache.get(url) if self.http_cache else None
+        headers = self.http_cache.conditional_headers(cached) if self.http_cache else {}
+        
+        started = time.perf_counter()
+        response = await self._get_async_fetcher().fetch(url, headers)
+        fetched = time.perf_counter()
+        if response.status_code == 304 and cached:
+            return self._not_modified_result(cached, started, fetched)
+        response.raise_for_status()
+        
+        result = await asyncio.to_thread(self._parse_html, response.content, url)
+        parsed = time.perf_counter()
+        if self.http_cache:
+            await asyncio.to_thread(self.http_cache.store, url, response.headers, result)
+        result['timings'] = self._timings(started, fetched, parsed)
+        return result
+    
+    def _not_modified_result(self, cached: dict, started: float, fetched: float) -> dict:
+        """Return the cached scrape result for a 304 Not Modified response"""
+        result = dict(cached['result'])
+        result['not_modified'] = True
+        result['timings'] = self._timings(started, fetched, fetched)
+        return result
+    
+    def _timings(self, started: float, fetched: float, parsed: float) -> dict:
+        """Seconds spent fetching (including per-host waits) and parsing a page"""
+        return {'fetch': round(fetched - started, 4), 'parse': round(parsed - fetched, 4)}
+    
+    def _parse_html(self, html_content, url: str) -> dict:
+        """Parse raw HTML and extract its content with the configured engine"""
+        if self.engine == 'lxml':
+            return self._extract_content_fast(html_content, url)
+        
+        soup = BeautifulSoup(html_content, 'html.parser')
         return self._extract_content(soup, url)
     
+    def _get(self, url: str, headers: dict = None) -> requests.Response:
+        """GET through the pooled session, honouring per-host limits and politeness delay"""
+        host = urlparse(url).netloc
+        
+        with self._host_slot(host):
+            self._wait_turn(host)
+            return self.session.get(url, headers=headers, timeout=SCRAPER_TIMEOUT)
+    
+    @contextmanager
+    def _host_slot(self, host: str):
+        """Limit concurrent connections to a single host"""
+        with self._host_lock:
+            slot = self._host_slots.setdefault(host, threading.BoundedSemaphore(self.max_connections_per_host))
+        
+        with slot:
+            yield
+    
+    def _wait_turn(self, host: str):
+        """Space requests to the same host at least politeness_delay apart"""
+        if not self.politeness_delay:
+            return
+        
+        with self._host_lock:
+            now = time.monotonic()
+            scheduled = max(now, self._next_request_time.get(host, 0.0))
+            self._next_request_time[host] = scheduled + self.politeness_delay
+        
+        if scheduled > now:
+            time.sleep(scheduled - now)
+    
+    def _get_async_fetcher(self) -> AsyncPageFetcher:
+        """Return the async fetcher for the running event loop"""
+        loop = asyncio.get_running_loop()
+        
+        # httpx connections are bound to the loop that opened them
+        if self._async_fetcher is None or self._async_fetcher_loop is not loop:
+            self._async_fetcher = AsyncPageFetcher(
+                max_connections=self.pool_size,
+                max_connections_per_host=self.max_connections_per_host,
+                politeness_delay=self.politeness_delay
+            )
+            self._async_fetcher_loop = loop
+        
+        return self._async_fetcher
+    
+    async def aclose(self):
+        """Close the async fetcher's pooled connections"""
+        if self._async_fetcher is not None:
+            await self._async_fetcher.aclose()
+            self._async_fetcher = None
+            self._async_fetcher_loop = None
+    
     def _scrape_with_playwright(self, url: str) -> dict:
-        """Scrape using playwright for dynamic content"""
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=True)
-            page = browser.new_page()
-            page.goto(url, wait_until='networkidle')
-            
-            html_content = page.content()
-            browser.close()
-            
-            soup = BeautifulSoup(html_content, 'html.parser')
-            return self._extract_content(soup, url)
+        """Scrape using the shared playwright browser pool for dynamic content"""
+        started = time.perf_counter()
+        html_content = get_browser_pool().fetch_html(url)
+        fetched = time.perf_counter()
+        result = self._parse_html(html_content, url)
+        result['timings'] = self._timings(started, fetched, time.perf_counter())
+        return result
+    
+    async def _ascrape_with_playwright(self, url: str) -> dict:
+        """Async variant of _scrape_with_playwright"""
+        started = time.perf_counter()
+        html_content = await get_browser_pool().afetch_html(url)
+        fetched = time.perf_counter()
+        result = await asyncio.to_thread(self._parse_html, html_content, url)
+        result['timings'] = self._timings(started, fetched, time.perf_counter())
+        return result
     
     def _extract_content(self, soup: BeautifulSoup, url: str) -> dict:
         """Extract and clean content from BeautifulSoup object"""
@@ -67,7 +223,7 @@ class ContentScraper:
         
         # Convert to markdown
         html_content = str(main_content)
-        markdown_text = self.h.handle(html_content)
+        markdown_text = self._markdown_converter().handle(html_content)
         
         # Clean up markdown
         cleaned_text = self._clean_markdown(markdown_text)
@@ -79,9 +235,38 @@ class ContentScraper:
             "markdown": markdown_text,
             "text": cleaned_text,
             "word_count": len(cleaned_text.split()),
+            "content_hash": hashlib.sha256(cleaned_text.encode('utf-8')).hexdigest(),
             "headings": self._extract_headings(main_content)
         }
     
+    def _extract_content_fast(self, html_content, url: str) -> dict:
+        """Extract content in a single lxml traversal"""
+        extracted = self.fast_extractor.extract(html_content, url)
+        cleaned_text = self._clean_markdown(extracted['markdown'])
+        
+        return {
+            "title": extracted['title'],
+            "url": url,
+            "html": extracted['html'],
+            "markdown": extracted['markdown'],
+            "text": cleaned_text,
+            "word_count": len(cleaned_text.split()),
+            "content_hash": hashlib.sha256(cleaned_text.encode('utf-8')).hexdigest(),
+            "headings": extracted['headings']
+        }
+    
+    def _markdown_converter(self) -> html2text.HTML2Text:
+        """
+        Build an HTML-to-markdown converter for one document
+
+        HTML2Text keeps parser state between handle() calls, so converters
+        are not reused across documents or shared between threads.
+        """
+        converter = html2text.HTML2Text()
+        converter.ignore_links = False
+        converter.ignore_images = False
+        return converter
+    
     def _find_main_content(self, soup: BeautifulSoup):
         """Find the main content area of the page"""
         # Try common content containers
@@ -0,0 +1,245 @@
+import asyncio
+import hashlib
+import json
+import random
+import time
+from typing import Any, AsyncIterator, Dict, Iterator, List
+
+from langchain_core.messages import AIMessage, AIMessageChunk
+
+from config import FAKE_LLM_LATENCY_SECONDS, FAKE_LLM_OUTPUT_TOKENS, FAKE_LLM_TOKENS_PER_SECOND
+from utils.llm_client import LLMBackend, register_llm_backend
+from utils.token_counter import CHARS_PER_TOKEN
+
+# Tokens per streamed chunk, about what the OpenAI API sends
+CHUNK_TOKENS = 4
+
+WORDS = (
+    "documentation section example configuration request response reader setup step "
+    "value guide endpoint option clear concise feature workflow account result detail"
+).split()
+
+
+def _sentence(rng: random.Random, words: int = 8) -> str:
+    return ' '.join(rng.choice(WORDS) for _ in range(words)).capitalize() + '.'
+
+
+def _score(rng: random.Random) -> int:
+    return rng.randint(4, 9)
+
+
+def _analysis(rng: random.Random) -> Dict[str, Any]:
+    def area(issues_key: str, suggestions_key: str) -> Dict[str, Any]:
+        return {'score': _score(rng), issues_key: [_sentence(rng)], suggestions_key: [_sentence(rng)]}
+
+    return {
+        'overall_score': _score(rng),
+        'readability': area('issues', 'suggestions'),
+        'structure': area('issues', 'suggestions'),
+        'completeness': area('missing_elements', 'suggestions'),
+        'style_guide_adherence': area('violations', 'improvements'),
+        'marketing_perspective': area('value_clarity', 'call_to_action'),
+        'priority_fixes': [_sentence(rng) for _ in range(3)],
+        'detailed_suggestions': []
+    }
+
+
+def _analysis_item(rng: random.Random) -> Dict[str, Any]:
+    return {
+        'section': _sentence(rng, 3), 'issue': _sentence(rng), 'suggestion': _sentence(rng, 16),
+        'priority': rng.choice(['high', 'medium', 'low'])
+    }
+
+
+def _persona(rng: random.Random) -> Dict[str, Any]:
+    return {
+        'persona_alignment_score': _score(rng),
+        'persona_specific_issues': [_sentence(rng)],
+        'terminology_adjustments': [
+            {'current_term': rng.choice(WORDS), 'suggested_term': rng.choice(WORDS), 'reason': _sentence(rng)}
+        ],
+        'tone_adjustments': [_sentence(rng)],
+        'content_emphasis': [_sentence(rng)],
+        'missing_elements': [_sentence(rng)],
+        'sample_rewrites': [],
+        'call_to_action_suggestions': [_sentence(rng)]
+    }
+
+
+def _persona_item(rng: random.Random) -> Dict[str, Any]:
+    return {
+        'original_paragraph': _sentence(rng, 16), 'rewritten_paragraph': _sentence(rng, 16),
+        'explanation': _sentence(rng)
+    }
+
+
+def _localization(rng: random.Random) -> Dict[str, Any]:
+    return {
+        'localization_readiness_score': _score(rng),
+        'cultural_references': [{'phrase': _sentence(rng, 3), 'issue': _sentence(rng), 'suggestion': _sentence(rng)}],
+        'idioms_and_expressions': [{'idiom': _sentence(rng, 3), 'meaning': _sentence(rng), 'suggestion': _sentence(rng)}],
+        'formatting_issues': [
+            {'current_format': _sentence(rng, 3), 'issue': _sentence(rng), 'international_format': _sentence(rng, 3)}
+        ],
+        'assumptions': [{'assumption': _sentence(rng), 'issue': _sentence(rng), 'suggestion': _sentence(rng)}],
+        'legal_regulatory': [],
+        'hard_to_translate': [{'phrase': _sentence(rng, 3), 'why_difficult': _sentence(rng), 'alternative': _sentence(rng)}],
+        'recommended_changes': [],
+        'overall_recommendations': [_sentence(rng)]
+    }
+
+
+def _localization_item(rng: random.Random) -> Dict[str, Any]:
+    return {'original': _sentence(rng, 12), 'improved': _sentence(rng, 12), 'reason': _sentence(rng)}
+
+
+def _examples(rng: random.Random) -> Dict[str, Any]:
+    return {
+        'sections_needing_examples': [
+            {'section_title': _sentence(rng, 3), 'reason': _sentence(rng),
+             'complexity_level': rng.choice(['beginner', 'intermediate', 'advanced'])}
+        ],
+        'generated_examples': [],
+        'code_examples': [
+            {'section': _sentence(rng, 3), 'language': 'python', 'code': "client.run(config)",
+             'description': _sentence(rng), 'comments': _sentence(rng)}
+        ],
+        'scenario_examples': [
+            {'section': _sentence(rng, 3), 'scenario': _sentence(rng, 12),
+             'step_by_step': [_sentence(rng, 5) for _ in range(3)], 'outcome': _sentence(rng)}
+        ],
+        'integration_notes': [_sentence(rng)]
+    }
+
+
+def _examples_item(rng: random.Random) -> Dict[str, Any]:
+    return {
+        'section': _sentence(rng, 3), 'example_type': rng.choice(['code', 'scenario', 'use_case', 'walkthrough']),
+        'title': _sentence(rng, 4), 'content': _sentence(rng, 24), 'explanation': _sentence(rng),
+        'placement_suggestion': _sentence(rng, 6)
+    }
+
+
+def _readability(rng: random.Random) -> Dict[str, Any]:
+    return {
+        'overall_assessment': {
+            'reading_level': f"Grade {rng.randint(6, 14)}",
+            'accessibility': _sentence(rng),
+            'target_audience': _sentence(rng, 5)
+        },
+        'key_insights': [_sentence(rng)],
+        'problem_areas': [],
+        'recommendations': [_sentence(rng)],
+        'strengths': [_sentence(rng)]
+    }
+
+
+def _readability_item(rng: random.Random) -> Dict[str, Any]:
+    return {'issue': _sentence(rng), 'impact': _sentence(rng), 'solution': _sentence(rng, 12)}
+
+
+# Agent class name -> (response skeleton, list field grown to the target size, item builder)
+RESPONSES: Dict[str, tuple] = {
+    'DocumentationAnalyzerAgent': (_analysis, 'detailed_suggestions', _analysis_item),
+    'PersonaFeedbackAgent': (_persona, 'sample_rewrites', _persona_item),
+    'LocalizationReadinessAgent': (_localization, 'recommended_changes', _localization_item),
+    'ExampleGeneratorAgent': (_examples, 'generated_examples', _examples_item),
+    'ReadabilityVisualizerAgent': (_readability, 'problem_areas', _readability_item),
+}
+
+
+class FakeChatModel:
+    """
+    Offline stand-in for a chat model
+
+    JSON agents get a response matching their prompt's schema, grown to about
+    output_tokens tokens; the rewriter gets the original content back. The
+    response is seeded from the prompt, so the same prompt always gets the
+    same answer. Calls wait latency seconds before the first token and then
+    generate tokens_per_second tokens per second (0 for no delay).
+    """
+
+    def __init__(self, agent: str, latency: float = FAKE_LLM_LATENCY_SECONDS,
+                 tokens_per_second: float = FAKE_LLM_TOKENS_PER_SECOND,
+                 output_tokens: int = FAKE_LLM_OUTPUT_TOKENS):
+        self.agent = agent
+        self.latency = latency
+        self.tokens_per_second = tokens_per_second
+        self.output_tokens = output_tokens
+
+    def invoke(self, prompt: str) -> AIMessage:
+        content = self.respond(prompt)
+        time.sleep(self.latency + self._generation_seconds(content))
+        return AIMessage(content=content)
+
+    async def ainvoke(self, prompt: str) -> AIMessage:
+        content = self.respond(prompt)
+        await asyncio.sleep(self.latency + self._generation_seconds(content))
+        return AIMessage(content=content)
+
+    def stream(self, prompt: str) -> Iterator[AIMessageChunk]:
+        chunks = self._chunks(self.respond(prompt))
+        time.sleep(self.latency)
+        for chunk in chunks:
+            yield AIMessageChunk(content=chunk)
+            time.sleep(self._generation_seconds(chunk))
+
+    async def astream(self, prompt: str) -> AsyncIterator[AIMessageChunk]:
+        chunks = self._chunks(self.respond(prompt))
+        await asyncio.sleep(self.latency)
+        for chunk in chunks:
+            yield AIMessageChunk(content=chunk)
+            await asyncio.sleep(self._generation_seconds(chunk))
+
+    def respond(self, prompt: str) -> str:
+        """Return the response text for a prompt"""
+        rng = random.Random(hashlib.sha256(f"{self.agent}\n{prompt}".encode('utf-8')).digest())
+
+        if self.agent not in RESPONSES:
+            return self._echo_content(prompt)
+
+        skeleton, field, item = RESPONSES[self.agent]
+        response = skeleton(rng)
+        items: List[Dict[str, Any]] = response[field]
+        target_chars = self.output_tokens * CHARS_PER_TOKEN
+        while True:
+            text = json.dumps(response, indent=2)
+            if len(text) >= target_chars:
+                return text
+            items.append(item(rng))
+
+    def _echo_content(self, prompt: str) -> str:
+        """Answer free-text prompts, such as the rewriter's, with the content they carry"""
+        start = prompt.find("ORIGINAL CONTENT:\n")
+        end = prompt.find("\n\nIMPROVEMENT SUGGESTIONS:")
+        if start == -1 or end == -1:
+            return prompt[-self.output_tokens * CHARS_PER_TOKEN:]
+        return prompt[start + len("ORIGINAL CONTENT:\n"):end]
+
+    def _chunks(self, content: str) -> List[str]:
+        size = CHUNK_TOKENS * CHARS_PER_TOKEN
+        return [content[i:i + size] for i in range(0, len(content), size)]
+
+    def _generation_seconds(self, text: str) -> float:
+        if self.tokens_per_second <= 0:
+            return 0.0
+        return len(text) / CHARS_PER_TOKEN / self.tokens_per_second
+
+
+class FakeBackend(LLMBackend):
+    """Serves FakeChatModel instances; select with LLM_BACKEND=fake"""
+
+    name = 'fake'
+
+    def __init__(self, latency: float = FAKE_LLM_LATENCY_SECONDS,
+                 tokens_per_second: float = FAKE_LLM_TOKENS_PER_SECOND,
+                 output_tokens: int = FAKE_LLM_OUTPUT_TOKENS):
+        self.latency = latency
+        self.tokens_per_second = tokens_per_second
+        self.output_tokens = output_tokens
+
+    def chat_model(self, agent: str, model: str, temperature: float, timeout: float = None) -> FakeChatModel:
+        return FakeChatModel(agent, self.latency, self.tokens_per_second, self.output_tokens)
+
+
+register_llm_backend(FakeBackend())
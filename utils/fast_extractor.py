@@ -0,0 +1,196 @@
+import re
+from typing import Any, Dict, List
+
+import lxml.html
+from bs4.dammit import UnicodeDammit
+
+BOILERPLATE_TAGS = {'script', 'style', 'nav', 'footer', 'header', 'noscript', 'template'}
+BLOCK_TAGS = {'p', 'div', 'section', 'article', 'main', 'aside', 'figure', 'figcaption', 'dl', 'dt', 'dd', 'form'}
+HEADING_TAGS = {'h1': 1, 'h2': 2, 'h3': 3, 'h4': 4, 'h5': 5, 'h6': 6}
+
+# Same precedence as ContentScraper._find_main_content
+MAIN_CONTENT_XPATHS = [
+    '//main', '//article', '//*[@role="main"]',
+    '//*[contains(concat(" ", normalize-space(@class), " "), " content ")]',
+    '//*[contains(concat(" ", normalize-space(@class), " "), " main-content ")]',
+    '//*[contains(concat(" ", normalize-space(@class), " "), " article-content ")]',
+    '//*[contains(concat(" ", normalize-space(@class), " "), " documentation ")]',
+    '//*[contains(concat(" ", normalize-space(@class), " "), " docs-content ")]',
+    '//*[contains(concat(" ", normalize-space(@class), " "), " doc-content ")]',
+]
+
+WHITESPACE = re.compile(r'\s+')
+
+# Raw bytes are decoded up front, so the parser must not guess the encoding again
+UTF8_PARSER = lxml.html.HTMLParser(encoding='utf-8')
+
+
+class FastContentExtractor:
+    """
+    lxml-based content extractor
+
+    Finds the main content container, then emits markdown and collects
+    headings in a single traversal that skips boilerplate elements, instead
+    of decomposing tags, serialising and re-parsing with html2text.
+    """
+
+    def extract(self, html_content, url: str) -> Dict[str, Any]:
+        """
+        Extract title, main content markdown and headings from raw HTML
+
+        Returns the same fields as ContentScraper._extract_content except
+        text, word_count and content_hash, which the scraper derives from the
+        markdown. The html field is the main container as found in the page.
+        Raw bytes are decoded the way BeautifulSoup decodes them, so pages
+        without a declared charset are read as UTF-8 rather than Latin-1.
+        """
+        if isinstance(html_content, bytes):
+            html_content = UnicodeDammit(html_content, is_html=True).unicode_markup
+        root = lxml.html.document_fromstring(html_content.encode('utf-8'), parser=UTF8_PARSER)
+
+        title = root.find('.//title')
+        title_text = title.text_content().strip() if title is not None and title.text_content().strip() else "Untitled"
+
+        main_content = self._find_main_content(root)
+
+        out = []
+        headings = []
+        self._walk(main_content, out, headings, list_stack=[])
+        markdown_text = self._normalise_blank_lines(''.join(out))
+
+        return {
+            "title": title_text,
+            "url": url,
+            "html": lxml.html.tostring(main_content, encoding='unicode'),
+            "markdown": markdown_text,
+            "headings": headings
+        }
+
+    def _find_main_content(self, root):
+        """Find the main content area of the page"""
+        for xpath in MAIN_CONTENT_XPATHS:
+            matches = root.xpath(xpath)
+            for match in matches:
+                if not self._inside_boilerplate(match):
+                    return match
+
+        body = root.find('body')
+        return body if body is not None else root
+
+    def _inside_boilerplate(self, element) -> bool:
+        """Check whether an element sits inside a tag the extractor drops"""
+        for ancestor in element.iterancestors():
+            if ancestor.tag in BOILERPLATE_TAGS:
+                return True
+        return element.tag in BOILERPLATE_TAGS
+
+    def _walk(self, element, out: List[str], headings: List[Dict[str, Any]],
+              list_stack: List[Dict[str, Any]]):
+        """Emit markdown for an element and its children"""
+        tag = element.tag if isinstance(element.tag, str) else None
+
+        if tag is None or tag in BOILERPLATE_TAGS:
+            # Comments and dropped elements keep only their tail text
+            self._emit_text(element.tail, out)
+            return
+
+        if tag in HEADING_TAGS:
+            text = WHITESPACE.sub(' ', element.text_content()).strip()
+            if text:
+                headings.append({'level': HEADING_TAGS[tag], 'text': text})
+                out.append(f"\n\n{'#' * HEADING_TAGS[tag]} {text}\n\n")
+        elif tag == 'pre':
+            code = element.text_content().strip('\n')
+            out.append('\n\n' + '\n'.join('    ' + line for line in code.split('\n')) + '\n\n')
+        elif tag == 'br':
+            out.append('\n')
+        elif tag == 'hr':
+            out.append('\n\n* * *\n\n')
+        elif tag == 'img':
+            alt = element.get('alt', '')
+            src = element.get('src', '')
+            if src:
+                out.append(f"![{alt}]({src})")
+        elif tag in ('ul', 'ol'):
+            list_stack.append({'ordered': tag == 'ol', 'index': 0})
+            out.append('\n\n')
+            self._walk_children(element, out, headings, list_stack)
+            list_stack.pop()
+            out.append('\n\n')
+        elif tag == 'li':
+            depth = max(len(list_stack) - 1, 0)
+            marker = '  * '
+            if list_stack and list_stack[-1]['ordered']:
+                list_stack[-1]['index'] += 1
+                marker = f"  {list_stack[-1]['index']}. "
+            out.append('\n' + '  ' * depth + marker)
+            self._walk_children(element, out, headings, list_stack)
+        elif tag == 'tr':
+            cells = [
+                WHITESPACE.sub(' ', cell.text_content()).strip()
+                for cell in element if isinstance(cell.tag, str) and cell.tag in ('td', 'th')
+            ]
+            out.append('\n' + ' | '.join(cells))
+            # html2text underlines the first row of every table
+            table = next(element.iterancestors('table'), None)
+            if table is not None and next(table.iter('tr'), None) is element:
+                out.append('\n' + '|'.join(['---'] * len(cells)))
+        elif tag == 'table':
+            out.append('\n\n')
+            self._walk_children(element, out, headings, list_stack)
+            out.append('\n\n')
+        elif tag == 'blockquote':
+            inner = []
+            self._walk_children(element, inner, headings, list_stack)
+            quoted = self._normalise_blank_lines(''.join(inner))
+            out.append('\n\n' + '\n'.join('> ' + line for line in quoted.split('\n')) + '\n\n')
+        elif tag == 'a':
+            inner = []
+            self._walk_children(element, inner, headings, list_stack)
+            text = ''.join(inner).strip()
+            href = element.get('href')
+            out.append(f"[{text}]({href})" if href and text else text)
+        elif tag in ('strong', 'b'):
+            self._wrap(element, '**', out, headings, list_stack)
+        elif tag in ('em', 'i'):
+            self._wrap(element, '_', out, headings, list_stack)
+        elif tag == 'code':
+            out.append('`' + element.text_content() + '`')
+        elif tag in BLOCK_TAGS:
+            out.append('\n\n')
+            self._walk_children(element, out, headings, list_stack)
+            out.append('\n\n')
+        else:
+            self._walk_children(element, out, headings, list_stack)
+
+        self._emit_text(element.tail, out)
+
+    def _walk_children(self, element, out: List[str], headings: List[Dict[str, Any]],
+                       list_stack: List[Dict[str, Any]]):
+        self._emit_text(element.text, out)
+        for child in element:
+            self._walk(child, out, headings, list_stack)
+
+    def _wrap(self, element, marker: str, out: List[str], headings: List[Dict[str, Any]],
+              list_stack: List[Dict[str, Any]]):
+        inner = []
+        self._walk_children(element, inner, headings, list_stack)
+        text = ''.join(inner).strip()
+        if text:
+            out.append(f"{marker}{text}{marker}")
+
+    def _emit_text(self, text: str, out: List[str]):
+        if not text:
+            return
+        text = WHITESPACE.sub(' ', text)
+        if not out or out[-1][-1:].isspace():
+            text = text.lstrip()
+        if text:
+            out.append(text)
+
+    def _normalise_blank_lines(self, text: str) -> str:
+        """Strip trailing spaces and collapse runs of blank lines"""
+        lines = [line.rstrip() for line in text.split('\n')]
+        text = '\n'.join(lines)
+        text = re.sub(r'\n{3,}', '\n\n', text)
+        return text.strip() + '\n'
@@ -0,0 +1,76 @@
+import hashlib
+import json
+import os
+import tempfile
+import time
+from typing import Any, Dict, Optional
+
+from config import HTTP_CACHE_DIR
+
+
+class HTTPCache:
+    """
+    On-disk cache of scraped pages and their HTTP validators
+
+    Each URL stores its ETag/Last-Modified validators and the parsed scrape
+    result, so a 304 Not Modified response can be answered without
+    downloading or parsing the page again.
+    """
+
+    def __init__(self, cache_dir: str = HTTP_CACHE_DIR):
+        self.cache_dir = cache_dir
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def get(self, url: str) -> Optional[Dict[str, Any]]:
+        """Return the cached entry for a URL, or None"""
+        try:
+            with open(self._path(url, '.json'), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+
+    def conditional_headers(self, entry: Optional[Dict[str, Any]]) -> Dict[str, str]:
+        """Build If-None-Match/If-Modified-Since headers from a cached entry"""
+        headers = {}
+        if entry:
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def store(self, url: str, response_headers, result: Dict[str, Any]):
+        """Persist a response if it carries validators to revalidate it with later"""
+        etag = response_headers.get('ETag')
+        last_modified = response_headers.get('Last-Modified')
+        if not etag and not last_modified:
+            return
+
+        entry = {
+            'url': url,
+            'etag': etag,
+            'last_modified': last_modified,
+            'content_hash': result.get('content_hash'),
+            'stored_at': time.time(),
+            'result': result
+        }
+
+        self._atomic_write(self._path(url, '.json'), json.dumps(entry).encode('utf-8'))
+
+    def _path(self, url: str, suffix: str) -> str:
+        key = hashlib.sha256(url.encode('utf-8')).hexdigest()
+        return os.path.join(self.cache_dir, key[:2], key + suffix)
+
+    def _atomic_write(self, path: str, data: bytes):
+        """Write via a temporary file so readers never see a partial entry"""
+        directory = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+
+        fd, tmp_path = tempfile.mkstemp(dir=directory)
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except Exception:
+            os.unlink(tmp_path)
+            raise
@@ -0,0 +1,184 @@
+import json
+import os
+import tempfile
+import threading
+from datetime import datetime
+from typing import Any, Dict, List
+
+from config import METRICS_JSONL_PATH, METRICS_PROMETHEUS_PATH
+
+METRIC_PREFIX = 'docs_assistant'
+
+
+def timing_records(results: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Flatten a run's timings and LLM calls into structured records
+
+    Stage records carry the stage name and its seconds; scraper stages are
+    named scrape_fetch and scrape_parse, and the whole run is total.
+    """
+    timings = results.get('timings') or {}
+    base = {
+        'url': (results.get('input_data') or {}).get('url'),
+        'persona': results.get('persona'),
+        'timestamp': datetime.now().isoformat()
+    }
+
+    stages = {f"scrape_{name}": seconds for name, seconds in (timings.get('scrape') or {}).items()}
+    stages.update(timings.get('stages') or {})
+    if 'total' in timings:
+        stages['total'] = timings['total']
+
+    records = [{'type': 'stage', **base, 'stage': stage, 'seconds': seconds} for stage, seconds in stages.items()]
+    for call in (results.get('token_usage') or {}).get('calls', []):
+        records.append({
+            'type': 'llm_call', **base,
+            'agent': call['agent'],
+            'latency': call.get('latency'),
+            'first_chunk': call.get('first_chunk'),
+            'tokens_in': call['tokens_in'],
+            'tokens_out': call['tokens_out'],
+            'cached': call['cached']
+        })
+    return records
+
+
+class MetricsExporter:
+    """
+    Writes timing and LLM call records as JSON lines and a Prometheus text dump
+
+    Every record is appended to the JSONL file. The Prometheus file is
+    rewritten after each export with totals aggregated in this process, so
+    processes that export at the same time should use "{pid}" in its path.
+    """
+
+    def __init__(self, jsonl_path: str = METRICS_JSONL_PATH, prometheus_path: str = METRICS_PROMETHEUS_PATH):
+        pid = str(os.getpid())
+        self.jsonl_path = jsonl_path.replace('{pid}', pid)
+        self.prometheus_path = prometheus_path.replace('{pid}', pid)
+
+        self._lock = threading.Lock()
+        self._stages: Dict[str, Dict[str, float]] = {}
+        self._llm: Dict[str, Dict[str, float]] = {}
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.jsonl_path or self.prometheus_path)
+
+    def export(self, results: Dict[str, Any]):
+        """Export the timings and LLM calls of a processed document"""
+        self.write(timing_records(results))
+
+    def record_stage(self, stage: str, seconds: float, url: str = None, persona: str = None):
+        """Export a stage timed outside the orchestrator, such as PDF generation"""
+        self.write([{
+            'type': 'stage', 'url': url, 'persona': persona,
+            'timestamp': datetime.now().isoformat(), 'stage': stage, 'seconds': round(seconds, 4)
+        }])
+
+    def write(self, records: List[Dict[str, Any]]):
+        """Append records to the JSONL file and refresh the Prometheus dump"""
+        if not self.enabled or not records:
+            return
+
+        with self._lock:
+            for record in records:
+                self._aggregate(record)
+
+            if self.jsonl_path:
+                self._ensure_directory(self.jsonl_path)
+                with open(self.jsonl_path, 'a', encoding='utf-8') as f:
+                    f.write(''.join(json.dumps(record, default=str) + '\n' for record in records))
+
+            if self.prometheus_path:
+                self._atomic_write(self.prometheus_path, self._prometheus_text())
+
+    def prometheus_text(self) -> str:
+        """Return the aggregated metrics in the Prometheus text exposition format"""
+        with self._lock:
+            return self._prometheus_text()
+
+    def _aggregate(self, record: Dict[str, Any]):
+        if record['type'] == 'stage':
+            totals = self._stages.setdefault(record['stage'], {'count': 0, 'sum': 0.0, 'max': 0.0})
+            totals['count'] += 1
+            totals['sum'] += record['seconds']
+            totals['max'] = max(totals['max'], record['seconds'])
+        else:
+            totals = self._llm.setdefault(record['agent'], {
+                'calls': 0, 'cached': 0, 'latency': 0.0, 'tokens_in': 0, 'tokens_out': 0
+            })
+            totals['calls'] += 1
+            totals['cached'] += int(record['cached'])
+            totals['latency'] += record['latency'] or 0.0
+            if not record['cached']:
+                totals['tokens_in'] += record['tokens_in']
+                totals['tokens_out'] += record['tokens_out']
+
+    def _prometheus_text(self) -> str:
+        lines = []
+
+        def metric(name: str, kind: str, help_text: str, samples: List[tuple]):
+            lines.append(f"# HELP {METRIC_PREFIX}_{name} {help_text}")
+            lines.append(f"# TYPE {METRIC_PREFIX}_{name} {kind}")
+            for suffix, labels, value in samples:
+                label_text = ','.join(f'{key}="{label}"' for key, label in labels.items())
+                lines.append(f"{METRIC_PREFIX}_{name}{suffix}{{{label_text}}} {value}")
+
+        metric('stage_seconds', 'summary', "Wall-clock seconds per processing stage", [
+            sample
+            for stage, totals in sorted(self._stages.items())
+            for sample in (('_sum', {'stage': stage}, round(totals['sum'], 4)),
+                           ('_count', {'stage': stage}, totals['count']))
+        ])
+        metric('stage_seconds_max', 'gauge', "Slowest run of each processing stage", [
+            ('', {'stage': stage}, round(totals['max'], 4)) for stage, totals in sorted(self._stages.items())
+        ])
+        metric('llm_latency_seconds', 'summary', "Seconds spent waiting on the LLM per agent", [
+            sample
+            for agent, totals in sorted(self._llm.items())
+            for sample in (('_sum', {'agent': agent}, round(totals['latency'], 4)),
+                           ('_count', {'agent': agent}, totals['calls'] - totals['cached']))
+        ])
+        metric('llm_cached_calls_total', 'counter', "Agent calls answered from the LLM response cache", [
+            ('', {'agent': agent}, totals['cached']) for agent, totals in sorted(self._llm.items())
+        ])
+        metric('llm_tokens_total', 'counter', "Billed prompt and completion tokens per agent", [
+            sample
+            for agent, totals in sorted(self._llm.items())
+            for sample in (('', {'agent': agent, 'direction': 'in'}, totals['tokens_in']),
+                           ('', {'agent': agent, 'direction': 'out'}, totals['tokens_out']))
+        ])
+
+        return '\n'.join(lines) + '\n'
+
+    def _ensure_directory(self, path: str):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def _atomic_write(self, path: str, text: str):
+        """Write via a temporary file so scrapers never read a partial dump"""
+        self._ensure_directory(path)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or '.', suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(text)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+
+_exporter = None
+_exporter_lock = threading.Lock()
+
+
+def get_metrics_exporter() -> MetricsExporter:
+    """Return the process-wide metrics exporter"""
+    global _exporter
+
+    with _exporter_lock:
+        if _exporter is None:
+            _exporter = MetricsExporter()
+        return _exporter
@@ -0,0 +1,436 @@
+import asyncio
+import os
+import random
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import AsyncIterator, Dict, Iterator, Optional
+
+import openai
+from langchain_openai import ChatOpenAI
+
+from config import (
+    LLM_BACKEND, LLM_MAX_RETRIES, LLM_BACKOFF_BASE_SECONDS, LLM_BACKOFF_MAX_SECONDS,
+    LLM_REQUESTS_PER_MINUTE, LLM_TOKENS_PER_MINUTE, LLM_HEDGE_PERCENTILE
+)
+
+# Errors worth retrying: rate limits, server errors, timeouts and dropped connections
+RETRYABLE_ERRORS = (
+    openai.RateLimitError,
+    openai.InternalServerError,
+    openai.APITimeoutError,
+    openai.APIConnectionError,
+    asyncio.TimeoutError,
+)
+
+# Latency samples an agent needs before requests are hedged
+HEDGE_MIN_SAMPLES = 20
+
+
+class RateLimiter:
+    """
+    Token-bucket limiter for requests per minute and tokens per minute
+
+    Callers reserve capacity up front and sleep for the time the reservation
+    puts them in debt, so concurrent callers queue fairly instead of
+    retrying in a burst. A 429 pauses every caller for its Retry-After.
+    One limiter is shared by all agents and batch workers in the process.
+    """
+
+    def __init__(self, requests_per_minute: float = LLM_REQUESTS_PER_MINUTE,
+                 tokens_per_minute: float = LLM_TOKENS_PER_MINUTE):
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+
+        self._lock = threading.Lock()
+        self._requests = float(requests_per_minute)
+        self._tokens = float(tokens_per_minute)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+
+    def _refill(self, now: float):
+        elapsed = now - self._updated
+        self._updated = now
+        if self.requests_per_minute:
+            self._requests = min(self.requests_per_minute, self._requests + elapsed * self.requests_per_minute / 60)
+        if self.tokens_per_minute:
+            self._tokens = min(self.tokens_per_minute, self._tokens + elapsed * self.tokens_per_minute / 60)
+
+    def reserve(self, tokens: int) -> float:
+        """Reserve one request and tokens; return the seconds to wait before sending"""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+
+            wait = max(self._paused_until - now, 0.0)
+            if self.requests_per_minute:
+                self._requests -= 1
+                if self._requests < 0:
+                    wait = max(wait, -self._requests * 60 / self.requests_per_minute)
+            if self.tokens_per_minute:
+                # A prompt larger than the whole bucket still goes through once it is full
+                self._tokens -= min(tokens, self.tokens_per_minute)
+                if self._tokens < 0:
+                    wait = max(wait, -self._tokens * 60 / self.tokens_per_minute)
+            return wait
+
+    def consume(self, tokens: int):
+        """Charge tokens used after the fact, such as the completion"""
+        if not self.tokens_per_minute:
+            return
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens -= tokens
+
+    def pause(self, seconds: float):
+        """Hold back every caller for seconds, after the API signalled a rate limit"""
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+    def acquire(self, tokens: int):
+        time.sleep(self.reserve(tokens))
+
+    async def aacquire(self, tokens: int):
+        await asyncio.sleep(self.reserve(tokens))
+
+
+_limiter = None
+_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter() -> RateLimiter:
+    """Return the process-wide rate limiter"""
+    global _limiter
+    with _limiter_lock:
+        if _limiter is None:
+            _limiter = RateLimiter()
+        return _limiter
+
+
+def share_rate_limit(processes: int):
+    """
+    Limit this process to its share of the configured rate limits
+
+    For processes that call the API side by side, such as job workers, so
+    that together they stay within LLM_REQUESTS_PER_MINUTE and
+    LLM_TOKENS_PER_MINUTE. Call it before the first agent is built.
+    """
+    global _limiter
+    processes = max(processes, 1)
+    with _limiter_lock:
+        _limiter = RateLimiter(LLM_REQUESTS_PER_MINUTE / processes, LLM_TOKENS_PER_MINUTE / processes)
+
+
+# API key of the work in progress, when it differs from OPENAI_API_KEY (see use_api_key)
+_api_key: ContextVar[Optional[str]] = ContextVar('openai_api_key', default=None)
+
+
+@contextmanager
+def use_api_key(api_key: Optional[str]):
+    """Send the OpenAI calls made inside the block, including tasks it starts, with api_key"""
+    token = _api_key.set(api_key)
+    try:
+        yield
+    finally:
+        _api_key.reset(token)
+
+
+def current_api_key() -> Optional[str]:
+    """The key set by use_api_key, or else OPENAI_API_KEY"""
+    api_key = _api_key.get()
+    return api_key if api_key is not None else os.getenv("OPENAI_API_KEY")
+
+
+_chat_models = {}
+_openai_clients = {}
+_registry_lock = threading.Lock()
+
+
+def get_chat_model(model: str, temperature: float, timeout: float = None) -> ChatOpenAI:
+    """
+    Return the process-wide chat model for a model, temperature and timeout
+
+    Chat models using the same API key share one OpenAI client pair, and so
+    one pooled HTTP transport per sync/async side; a configuration only adds
+    its own timeout on top. The key is current_api_key() at the time of the
+    call. Retries are disabled in the OpenAI client because
+    ResilientLLMClient retries under the shared rate limiter.
+
+    Pooled async connections belong to the event loop that opened them, so
+    async calls should run on one long-lived loop (see AgentOrchestrator).
+    """
+    api_key = current_api_key()
+    key = (api_key, model, temperature, timeout)
+
+    with _registry_lock:
+        if key not in _chat_models:
+            if api_key not in _openai_clients:
+                _openai_clients[api_key] = (
+                    openai.OpenAI(api_key=api_key, max_retries=0),
+                    openai.AsyncOpenAI(api_key=api_key, max_retries=0)
+                )
+            sync_client, async_client = _openai_clients[api_key]
+            if timeout is not None:
+                sync_client = sync_client.with_options(timeout=timeout)
+                async_client = async_client.with_options(timeout=timeout)
+
+            _chat_models[key] = ChatOpenAI(
+                model=model,
+                temperature=temperature,
+                request_timeout=timeout,
+                max_retries=0,
+                client=sync_client.chat.completions,
+                async_client=async_client.chat.completions
+            )
+        return _chat_models[key]
+
+
+class LLMBackend(ABC):
+    """
+    Source of the chat models agents talk to
+
+    A chat model needs invoke, ainvoke, stream and astream taking a prompt
+    string and returning, or yielding, messages with a content attribute,
+    as LangChain chat models do. ResilientLLMClient wraps whatever the
+    backend returns, so rate limiting and retries apply to every backend.
+    """
+
+    name = ''
+
+    @abstractmethod
+    def chat_model(self, agent: str, model: str, temperature: float, timeout: float = None):
+        """Return the chat model for an agent"""
+        pass
+
+
+class KeyedChatModel:
+    """
+    Chat model that looks up the shared model for the current API key on every call
+
+    Agents are built once per process, but the key can change between calls:
+    the app sets it from the sidebar, and job workers run each job with the
+    key it was submitted with.
+    """
+
+    def __init__(self, model: str, temperature: float, timeout: float = None):
+        self.model = model
+        self.temperature = temperature
+        self.timeout = timeout
+
+    def _current(self) -> ChatOpenAI:
+        return get_chat_model(self.model, self.temperature, self.timeout)
+
+    def invoke(self, prompt):
+        return self._current().invoke(prompt)
+
+    async def ainvoke(self, prompt):
+        return await self._current().ainvoke(prompt)
+
+    def stream(self, prompt):
+        return self._current().stream(prompt)
+
+    def astream(self, prompt):
+        return self._current().astream(prompt)
+
+
+class OpenAIBackend(LLMBackend):
+    """The OpenAI API through the shared chat model registry"""
+
+    name = 'openai'
+
+    def chat_model(self, agent: str, model: str, temperature: float, timeout: float = None):
+        return KeyedChatModel(model, temperature, timeout)
+
+
+_backends: Dict[str, LLMBackend] = {'openai': OpenAIBackend()}
+
+
+def register_llm_backend(backend: LLMBackend):
+    """Make a backend selectable by its name through LLM_BACKEND"""
+    _backends[backend.name] = backend
+
+
+def get_llm_backend(name: str = LLM_BACKEND) -> LLMBackend:
+    """Return the backend registered under name"""
+    if name == 'fake' and name not in _backends:
+        # Registers itself; imported lazily so the OpenAI path never loads it
+        import utils.fake_llm  # noqa: F401
+
+    if name not in _backends:
+        raise ValueError(f"Unknown LLM backend: {name} (available: {', '.join(sorted(_backends))})")
+    return _backends[name]
+
+
+def retry_after_seconds(error: Exception) -> Optional[float]:
+    """Read the server's requested delay from an API error, if it sent one"""
+    response = getattr(error, 'response', None)
+    headers = getattr(response, 'headers', None)
+    if not headers:
+        return None
+
+    try:
+        if headers.get('retry-after-ms'):
+            return float(headers['retry-after-ms']) / 1000
+        if headers.get('retry-after'):
+            return float(headers['retry-after'])
+    except ValueError:
+        # Retry-After may also be an HTTP date; fall back to backoff
+        return None
+    return None
+
+
+def quota_exhausted(error: Exception) -> bool:
+    """A 429 for an exhausted billing quota will not clear by waiting"""
+    return getattr(error, 'code', None) == 'insufficient_quota'
+
+
+class ResilientLLMClient:
+    """
+    Wraps an agent's chat model with rate limiting, retries, timeouts and hedging
+
+    - Every attempt first reserves capacity on the shared RateLimiter.
+    - Retryable errors back off exponentially with full jitter; a 429's
+      Retry-After is honoured and pauses the limiter for everyone.
+    - Async calls are bounded by the agent's timeout.
+    - With hedging enabled, an async call still running after the agent's
+      LLM_HEDGE_PERCENTILE latency gets a duplicate request, and the first
+      answer wins.
+
+    The chat model must be built with max_retries=0 so retries happen here,
+    under the limiter, instead of inside the OpenAI client.
+    """
+
+    def __init__(self, llm, token_counter, timeout: float = None, limiter: RateLimiter = None,
+                 max_retries: int = LLM_MAX_RETRIES, hedge_percentile: float = LLM_HEDGE_PERCENTILE):
+        self.llm = llm
+        self.token_counter = token_counter
+        self.timeout = timeout
+        self.limiter = limiter or get_rate_limiter()
+        self.max_retries = max_retries
+        self.hedge_percentile = hedge_percentile
+        self.latencies = deque(maxlen=200)
+
+    def invoke(self, prompt: str, tokens_in: int) -> str:
+        """Send a prompt and return the response text, retrying transient failures"""
+        for attempt in range(self.max_retries + 1):
+            self.limiter.acquire(tokens_in)
+            try:
+                start = time.perf_counter()
+                content = self.llm.invoke(prompt).content
+                self._record_success(start, content)
+                return content
+            except RETRYABLE_ERRORS as e:
+                if attempt == self.max_retries or quota_exhausted(e):
+                    raise
+                time.sleep(self._backoff(attempt, e))
+
+    async def ainvoke(self, prompt: str, tokens_in: int) -> str:
+        """Async invoke with the agent timeout and optional hedging"""
+        for attempt in range(self.max_retries + 1):
+            try:
+                return await self._hedged_call(prompt, tokens_in)
+            except RETRYABLE_ERRORS as e:
+                if attempt == self.max_retries or quota_exhausted(e):
+                    raise
+                await asyncio.sleep(self._backoff(attempt, e))
+
+    def stream(self, prompt: str, tokens_in: int) -> Iterator[str]:
+        """Stream response chunks; failures are retried until the first chunk arrives"""
+        for attempt in range(self.max_retries + 1):
+            self.limiter.acquire(tokens_in)
+            started = False
+            parts = []
+            try:
+                for chunk in self.llm.stream(prompt):
+                    started = True
+                    parts.append(chunk.content)
+                    yield chunk.content
+                self.limiter.consume(self.token_counter.count(''.join(parts)))
+                return
+            except RETRYABLE_ERRORS as e:
+                if started or attempt == self.max_retries or quota_exhausted(e):
+                    raise
+                time.sleep(self._backoff(attempt, e))
+
+    async def astream(self, prompt: str, tokens_in: int) -> AsyncIterator[str]:
+        """Async stream; the timeout applies to the wait for each chunk"""
+        for attempt in range(self.max_retries + 1):
+            await self.limiter.aacquire(tokens_in)
+            started = False
+            parts = []
+            try:
+                chunks = self.llm.astream(prompt).__aiter__()
+                while True:
+                    try:
+                        chunk = await asyncio.wait_for(chunks.__anext__(), self.timeout)
+                    except StopAsyncIteration:
+                        break
+                    started = True
+                    parts.append(chunk.content)
+                    yield chunk.content
+                self.limiter.consume(self.token_counter.count(''.join(parts)))
+                return
+            except RETRYABLE_ERRORS as e:
+                if started or attempt == self.max_retries or quota_exhausted(e):
+                    raise
+                await asyncio.sleep(self._backoff(attempt, e))
+
+    async def _single_call(self, prompt: str, tokens_in: int) -> str:
+        await self.limiter.aacquire(tokens_in)
+        start = time.perf_counter()
+        response = await asyncio.wait_for(self.llm.ainvoke(prompt), self.timeout)
+        self._record_success(start, response.content)
+        return response.content
+
+    async def _hedged_call(self, prompt: str, tokens_in: int) -> str:
+        """Run a call, racing a duplicate against it once it is slower than usual"""
+        hedge_delay = self._hedge_delay()
+        if hedge_delay is None:
+            return await self._single_call(prompt, tokens_in)
+
+        primary = asyncio.ensure_future(self._single_call(prompt, tokens_in))
+        done, _ = await asyncio.wait({primary}, timeout=hedge_delay)
+        if done:
+            return primary.result()
+
+        hedge = asyncio.ensure_future(self._single_call(prompt, tokens_in))
+        pending = {primary, hedge}
+        error = None
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+                    error = error or task.exception()
+            raise error
+        finally:
+            for task in pending:
+                task.cancel()
+
+    def _hedge_delay(self) -> Optional[float]:
+        """Latency at the hedge percentile, once enough calls have been seen"""
+        if not self.hedge_percentile or len(self.latencies) < HEDGE_MIN_SAMPLES:
+            return None
+        ordered = sorted(self.latencies)
+        index = min(int(len(ordered) * self.hedge_percentile / 100), len(ordered) - 1)
+        return ordered[index]
+
+    def _record_success(self, start: float, content: str):
+        self.latencies.append(time.perf_counter() - start)
+        self.limiter.consume(self.token_counter.count(content))
+
+    def _backoff(self, attempt: int, error: Exception) -> float:
+        """Delay before the next attempt; rate limits pause the shared limiter too"""
+        delay = random.uniform(0, min(LLM_BACKOFF_MAX_SECONDS, LLM_BACKOFF_BASE_SECONDS * 2 ** attempt))
+
+        retry_after = retry_after_seconds(error)
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+        if isinstance(error, openai.RateLimitError):
+            self.limiter.pause(delay)
+
+        return delay
@@ -0,0 +1,105 @@
+import json
+from typing import Any, Dict, List
+
+# Longest list of suggestions passed on to another agent
+MAX_LIST_ITEMS = 10
+# Most difficult paragraphs sent to the readability interpretation
+MAX_FLAGGED_PARAGRAPHS = 20
+PREVIEW_CHARS = 60
+
+# Analysis fields the rewriter never reads
+ANALYSIS_DROP_FIELDS = {'sections_processed', 'error', 'agent', 'raw_response'}
+PRIORITY_ORDER = {'high': 0, 'medium': 1, 'low': 2}
+# Scraped page fields left out of stored results; they dominate their size and nothing reads them back
+RAW_PAGE_FIELDS = ('html', 'markdown')
+
+
+def compact_dumps(data: Any) -> str:
+    """Serialize for a prompt: no indentation or spaces after separators"""
+    return json.dumps(data, separators=(',', ':'), ensure_ascii=False, default=str)
+
+
+def analysis_for_rewriter(analysis: Dict[str, Any]) -> str:
+    """
+    Serialize analyzer output as rewrite suggestions
+
+    Scores are dropped since the rewriter acts on the issues and suggestions
+    only. Lists merged from several sections are de-duplicated and capped,
+    and detailed suggestions are ordered by priority before capping.
+    """
+    compacted = _compact_value({
+        key: value for key, value in analysis.items() if key not in ANALYSIS_DROP_FIELDS
+    })
+
+    detailed = (compacted or {}).get('detailed_suggestions')
+    if isinstance(detailed, list):
+        detailed.sort(key=lambda item: PRIORITY_ORDER.get(str(item.get('priority', '')).lower(), 3)
+                      if isinstance(item, dict) else 3)
+
+    return compact_dumps(_cap_lists(compacted or {}))
+
+
+def paragraphs_for_interpretation(paragraph_scores: List[Dict[str, Any]]) -> str:
+    """
+    Serialize paragraph scores for the readability interpretation
+
+    Only yellow and red paragraphs are listed, hardest first, with a short
+    preview; green paragraphs are summarized as a count.
+    """
+    scored = [para for para in paragraph_scores if 'color' in para]
+    flagged = sorted((para for para in scored if para['color'] != 'green'), key=lambda para: para['flesch_score'])
+
+    return compact_dumps({
+        'paragraphs': len(scored),
+        'colors': {color: sum(1 for para in scored if para['color'] == color) for color in ('green', 'yellow', 'red')},
+        'flagged': [
+            {
+                'n': para['paragraph_number'],
+                'color': para['color'],
+                'flesch': para['flesch_score'],
+                'grade': para['grade_level'],
+                'words': para['word_count'],
+                'preview': para['text_preview'][:PREVIEW_CHARS]
+            }
+            for para in flagged[:MAX_FLAGGED_PARAGRAPHS]
+        ]
+    })
+
+
+def results_for_storage(results: Dict[str, Any]) -> Dict[str, Any]:
+    """Drop the raw page HTML and markdown from processing results before they are stored"""
+    input_data = {
+        key: value for key, value in (results.get('input_data') or {}).items()
+        if key not in RAW_PAGE_FIELDS
+    }
+    return {**results, 'input_data': input_data}
+
+
+def _compact_value(value: Any) -> Any:
+    """Drop numbers, booleans and empty values; de-duplicate lists"""
+    if isinstance(value, dict):
+        compacted = {key: _compact_value(item) for key, item in value.items()}
+        return {key: item for key, item in compacted.items() if item not in (None, '', [], {})} or None
+    if isinstance(value, list):
+        items = []
+        seen = set()
+        for item in value:
+            item = _compact_value(item)
+            marker = compact_dumps(item)
+            if item in (None, '', [], {}) or marker in seen:
+                continue
+            seen.add(marker)
+            items.append(item)
+        return items
+    if isinstance(value, (bool, int, float)):
+        return None
+    return value
+
+
+def _cap_lists(value: Any) -> Any:
+    """Keep the first MAX_LIST_ITEMS entries of every list"""
+    if isinstance(value, dict):
+        return {key: _cap_lists(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_cap_lists(item) for item in value[:MAX_LIST_ITEMS]]
+    return value
@@ -3,8 +3,11 @@ from weasyprint import HTML, CSS
 from datetime import datetime
 import tempfile
 import os
+import time
 from typing import Dict, Any
 
+from utils.instrumentation import get_metrics_exporter
+
 class PDFGenerator:
     """Generates PDF reports from processed documentation"""
     
@@ -145,6 +148,7 @@ class PDFGenerator:
     
     def generate_pdf(self, results: Dict[str, Any], output_path: str = None) -> str:
         """Generate PDF report from processing results"""
+        started = time.perf_counter()
         
         # Generate HTML content
         html_content = self._generate_html_report(results)
@@ -161,6 +165,10 @@ class PDFGenerator:
                 stylesheets=[CSS(string=self.css_styles)]
             )
             
+            get_metrics_exporter().record_stage(
+                'pdf', time.perf_counter() - started,
+                url=results.get('input_data', {}).get('url'), persona=results.get('persona')
+            )
             return output_path
             
         except Exception as e:
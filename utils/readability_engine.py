@@ -0,0 +1,258 @@
+import atexit
+import math
+import os
+import re
+import threading
+from collections import Counter
+from typing import Any, Dict
+
+import numpy as np
+import textstat
+from textstat.textstat import get_grade_suffix
+
+from utils.syllable_cache import SyllableCache
+
+PUNCTUATION = re.compile(r'[^\w\s]')
+SENTENCE_PATTERN = re.compile(r'\b[^.!?]+[.!?]*', re.UNICODE)
+DOC_CLEAN_PATTERN = re.compile(r'[^\w\s\.\!\?]')
+
+# Words with at least this many syllables count as complex for the Gunning Fog index
+FOG_SYLLABLE_THRESHOLD = 3
+# Linsear Write only looks at the opening words of a text
+LINSEAR_WORD_LIMIT = 100
+
+
+def _load_easy_words() -> frozenset:
+    """Load the Dale-Chall list of familiar words shipped with textstat"""
+    path = os.path.join(os.path.dirname(textstat.__file__), 'resources', 'en', 'easy_words.txt')
+    with open(path, encoding='utf-8') as f:
+        return frozenset(line.strip() for line in f if line.strip())
+
+
+def _legacy_round(values, points: int = 0):
+    """Round half away from zero, as textstat does, so scores match its output"""
+    scale = 10 ** points
+    values = np.asarray(values, dtype=float)
+    return np.floor(values * scale + np.copysign(0.5, values)) / scale
+
+
+class ReadabilityEngine:
+    """
+    Single-pass readability scoring
+
+    Every paragraph is tokenized once into flat per-word arrays (syllables,
+    letters, familiar-word flags) tagged with their paragraph index. Per
+    paragraph counts are reduced from those arrays with np.bincount, every
+    formula is evaluated over all paragraphs at once, and document metrics are
+    aggregated from the paragraph counts instead of re-scanning the text.
+
+    Formulas and rounding follow textstat, so paragraph Flesch scores and
+    grade levels are unchanged. Difficult words are counted per occurrence,
+    as Dale-Chall and Gunning Fog define them, where textstat counts each
+    distinct word once.
+    """
+
+    def __init__(self, cache: SyllableCache = None):
+        self.easy_words = _load_easy_words()
+        self.cache = cache if cache is not None else SyllableCache()
+        self._pyphen = textstat.textstat.pyphen
+
+    def count_syllables(self, word: str) -> int:
+        """Count syllables of a lowercase word without punctuation"""
+        return len(self._pyphen.positions(word)) + 1
+
+    def _word_stats(self, word: str):
+        """Syllable count and familiar-word flag of a word, as stored in the cache"""
+        return self.count_syllables(word), word in self.easy_words
+
+    def analyze(self, content: str) -> Dict[str, Any]:
+        """
+        Tokenize content and compute per-paragraph counts and scores
+
+        Returns:
+            Dictionary with the paragraph texts and NumPy arrays of counts and
+            scores, one entry per paragraph, plus the word-level arrays the
+            document metrics need
+        """
+        paragraphs = [p.strip() for p in content.split('\n\n') if p.strip()]
+
+        words = []
+        word_paragraph = []
+        chars = np.zeros(len(paragraphs), dtype=np.int64)
+        sentences = np.zeros(len(paragraphs), dtype=np.int64)
+        short_sentences = np.zeros(len(paragraphs), dtype=np.int64)
+        sentence_lengths = []
+
+        for index, paragraph in enumerate(paragraphs):
+            clean = DOC_CLEAN_PATTERN.sub('', paragraph)
+            chars[index] = len(clean) - clean.count(' ') - clean.count('\n') - clean.count('\t')
+
+            paragraph_words = PUNCTUATION.sub('', paragraph.lower()).split()
+            words.extend(paragraph_words)
+            word_paragraph.extend([index] * len(paragraph_words))
+
+            for sentence in SENTENCE_PATTERN.findall(paragraph):
+                length = len(PUNCTUATION.sub('', sentence).split())
+                sentences[index] += 1
+                sentence_lengths.append(length)
+                if length <= 2:
+                    short_sentences[index] += 1
+
+        word_stats = self.cache.lookup(words, self._word_stats)
+
+        word_paragraph = np.asarray(word_paragraph, dtype=np.int64)
+        word_syllables = np.fromiter((syllables for syllables, _ in word_stats), dtype=np.int64, count=len(words))
+        word_letters = np.fromiter((len(word) for word in words), dtype=np.int64, count=len(words))
+        word_easy = np.fromiter((familiar for _, familiar in word_stats), dtype=bool, count=len(words))
+
+        counts = {
+            'words': self._per_paragraph(word_paragraph, None, len(paragraphs)),
+            'syllables': self._per_paragraph(word_paragraph, word_syllables, len(paragraphs)),
+            'letters': self._per_paragraph(word_paragraph, word_letters, len(paragraphs)),
+            'unfamiliar_words': self._per_paragraph(word_paragraph, ~word_easy, len(paragraphs)),
+            'complex_words': self._per_paragraph(
+                word_paragraph, ~word_easy & (word_syllables >= FOG_SYLLABLE_THRESHOLD), len(paragraphs)
+            ),
+            'polysyllables': self._per_paragraph(word_paragraph, word_syllables >= 3, len(paragraphs)),
+            'chars': chars,
+            # Sentences of one or two words are headings or fragments, not prose
+            'sentences': sentences - short_sentences,
+        }
+
+        return {
+            'paragraphs': paragraphs,
+            'counts': counts,
+            'scores': self.scores(counts),
+            'word_syllables': word_syllables,
+            'sentence_lengths': np.asarray(sentence_lengths, dtype=np.int64),
+        }
+
+    def _per_paragraph(self, word_paragraph: np.ndarray, weights, size: int) -> np.ndarray:
+        """Sum word-level values per paragraph"""
+        if weights is not None:
+            weights = np.asarray(weights, dtype=float)
+        return np.bincount(word_paragraph, weights=weights, minlength=size).astype(np.int64)
+
+    def scores(self, counts: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        """Evaluate every readability formula over arrays of counts"""
+        words = counts['words'].astype(float)
+        sentences = np.maximum(counts['sentences'], 1).astype(float)
+        safe_words = np.where(words > 0, words, 1.0)
+        has_words = words > 0
+
+        avg_sentence_length = np.where(has_words, _legacy_round(words / sentences, 1), 0.0)
+        avg_syllables = np.where(has_words, _legacy_round(counts['syllables'] / safe_words, 1), 0.0)
+
+        letters_per_100 = _legacy_round(_legacy_round(counts['letters'] / safe_words, 2) * 100, 2)
+        sentences_per_100 = _legacy_round(_legacy_round(sentences / safe_words, 2) * 100, 2)
+
+        percent_unfamiliar = counts['unfamiliar_words'] / safe_words * 100
+        dale_chall = 0.1579 * percent_unfamiliar + 0.0496 * avg_sentence_length
+        dale_chall = dale_chall + np.where(percent_unfamiliar > 5, 3.6365, 0.0)
+
+        smog = 1.043 * np.sqrt(counts['polysyllables'] * (30 / sentences)) + 3.1291
+
+        return {
+            'avg_sentence_length': avg_sentence_length,
+            'avg_syllables_per_word': avg_syllables,
+            'flesch_reading_ease': _legacy_round(206.835 - 1.015 * avg_sentence_length - 84.6 * avg_syllables, 2),
+            'flesch_kincaid_grade': _legacy_round(0.39 * avg_sentence_length + 11.8 * avg_syllables - 15.59, 1),
+            'gunning_fog': np.where(
+                has_words,
+                _legacy_round(0.4 * (avg_sentence_length + counts['complex_words'] / safe_words * 100), 2),
+                0.0
+            ),
+            'automated_readability_index': np.where(
+                has_words,
+                _legacy_round(
+                    4.71 * _legacy_round(counts['chars'] / safe_words, 2)
+                    + 0.5 * _legacy_round(words / sentences, 2) - 21.43, 1
+                ),
+                0.0
+            ),
+            'coleman_liau_index': _legacy_round(0.058 * letters_per_100 - 0.296 * sentences_per_100 - 15.8, 2),
+            'dale_chall_readability_score': np.where(has_words, _legacy_round(dale_chall, 2), 0.0),
+            'smog_index': np.where(counts['sentences'] >= 3, _legacy_round(smog, 1), 0.0),
+        }
+
+    def document_metrics(self, analysis: Dict[str, Any]) -> Dict[str, Any]:
+        """Aggregate paragraph counts into document-level metrics"""
+        totals = {name: np.asarray([values.sum()]) for name, values in analysis['counts'].items()}
+        scores = {name: float(values[0]) for name, values in self.scores(totals).items()}
+        linsear = self.linsear_write(analysis['word_syllables'], analysis['sentence_lengths'])
+
+        return {
+            'flesch_reading_ease': scores['flesch_reading_ease'],
+            'flesch_kincaid_grade': scores['flesch_kincaid_grade'],
+            'gunning_fog': scores['gunning_fog'],
+            'automated_readability_index': scores['automated_readability_index'],
+            'coleman_liau_index': scores['coleman_liau_index'],
+            'linsear_write_formula': linsear,
+            'dale_chall_readability_score': scores['dale_chall_readability_score'],
+            'text_standard': self.text_standard(scores, linsear),
+            'word_count': int(totals['words'][0]),
+            'sentence_count': max(int(totals['sentences'][0]), 1),
+            'avg_sentence_length': scores['avg_sentence_length'],
+            'syllable_count': int(totals['syllables'][0]),
+            'avg_syllables_per_word': scores['avg_syllables_per_word']
+        }
+
+    def linsear_write(self, word_syllables: np.ndarray, sentence_lengths: np.ndarray) -> float:
+        """Linsear Write over the opening words of the document"""
+        opening = word_syllables[:LINSEAR_WORD_LIMIT]
+        if not len(opening):
+            return 0.0
+
+        points = np.where(opening < 3, 1, 3).sum()
+        sentence_starts = np.concatenate(([0], np.cumsum(sentence_lengths)[:-1]))
+        opening_sentences = sentence_lengths[(sentence_starts < LINSEAR_WORD_LIMIT) & (sentence_lengths > 2)]
+        number = float(points) / max(len(opening_sentences), 1)
+
+        if number <= 20:
+            number -= 2
+        return number / 2
+
+    def text_standard(self, scores: Dict[str, float], linsear: float) -> str:
+        """Consensus grade across the grade-level formulas, as textstat reports it"""
+        grades = []
+        for name in ('flesch_kincaid_grade', 'smog_index', 'coleman_liau_index',
+                     'automated_readability_index', 'dale_chall_readability_score', 'gunning_fog'):
+            grades.extend([int(_legacy_round(scores[name])), math.ceil(scores[name])])
+        grades.extend([int(_legacy_round(linsear)), math.ceil(linsear)])
+
+        flesch = scores['flesch_reading_ease']
+        if 90 <= flesch < 100:
+            grades.append(5)
+        elif 80 <= flesch < 90:
+            grades.append(6)
+        elif 70 <= flesch < 80:
+            grades.append(7)
+        elif 60 <= flesch < 70:
+            grades.extend([8, 9])
+        elif 50 <= flesch < 60:
+            grades.append(10)
+        elif 40 <= flesch < 50:
+            grades.append(11)
+        elif 30 <= flesch < 40:
+            grades.append(12)
+        else:
+            grades.append(13)
+
+        grade = Counter(grades).most_common(1)[0][0]
+        lower, upper = int(grade) - 1, int(grade)
+        return f"{lower}{get_grade_suffix(lower)} and {upper}{get_grade_suffix(upper)} grade"
+
+
+_engine = None
+_engine_lock = threading.Lock()
+
+
+def get_readability_engine() -> ReadabilityEngine:
+    """Return the shared engine; the familiar-word list and syllable cache are loaded once per process"""
+    global _engine
+
+    with _engine_lock:
+        if _engine is None:
+            _engine = ReadabilityEngine()
+            atexit.register(_engine.cache.save)
+        return _engine
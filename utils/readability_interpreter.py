@@ -0,0 +1,136 @@
+from typing import Any, Dict, List
+
+from config import READABILITY_THRESHOLDS
+
+# Worst paragraphs named individually in the problem areas
+MAX_PARAGRAPHS_REPORTED = 3
+
+
+class ReadabilityInterpreter:
+    """
+    Deterministic interpretation of readability metrics
+
+    Produces the same JSON structure the readability agent asks the LLM for
+    (overall_assessment, key_insights, problem_areas, recommendations,
+    strengths), judged against READABILITY_THRESHOLDS.
+    """
+
+    def __init__(self, thresholds: Dict[str, Dict[str, float]] = None):
+        self.thresholds = thresholds or READABILITY_THRESHOLDS
+
+    def interpret(self, metrics: Dict[str, Any], paragraph_scores: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Interpret document metrics and paragraph scores"""
+        if metrics.get('error'):
+            return {"error": metrics['error']}
+
+        flesch = metrics['flesch_reading_ease']
+        grade = metrics['flesch_kincaid_grade']
+        sentence_length = metrics['avg_sentence_length']
+        syllables = metrics['avg_syllables_per_word']
+
+        scored = [para for para in paragraph_scores if 'color' in para]
+        red = sorted((para for para in scored if para['color'] == 'red'), key=lambda para: para['flesch_score'])
+        green = [para for para in scored if para['color'] == 'green']
+
+        insights = {
+            "overall_assessment": {
+                "reading_level": f"{metrics['grade_level']} (grade {grade:.1f}, {metrics['text_standard']})",
+                "accessibility": self._accessibility(flesch),
+                "target_audience": self._target_audience(grade)
+            },
+            "key_insights": [
+                f"Flesch Reading Ease is {flesch:.1f} ({metrics['readability_level']})",
+                f"Sentences average {sentence_length:.1f} words and words average {syllables:.1f} syllables"
+            ],
+            "problem_areas": [],
+            "recommendations": [],
+            "strengths": [],
+            "source": "rules"
+        }
+
+        if scored:
+            insights["key_insights"].append(
+                f"{len(green)} of {len(scored)} paragraphs are easy to read and {len(red)} are difficult"
+            )
+
+        if red:
+            numbers = ', '.join(str(para['paragraph_number']) for para in red[:MAX_PARAGRAPHS_REPORTED])
+            insights["problem_areas"].append({
+                "issue": f"{len(red)} paragraphs score below {self.thresholds['flesch_reading_ease']['yellow']} "
+                         f"on Flesch Reading Ease (hardest: {numbers})",
+                "impact": "Readers skim or abandon dense paragraphs and miss the instructions in them",
+                "solution": "Split these paragraphs into shorter sentences and replace jargon with everyday words"
+            })
+            insights["recommendations"].append(f"Rewrite the most difficult paragraphs first: {numbers}")
+
+        level = self._level('flesch_kincaid_grade', grade, higher_is_better=False)
+        if level != 'green':
+            insights["problem_areas"].append({
+                "issue": f"Grade level {grade:.1f} is above the target of "
+                         f"{self.thresholds['flesch_kincaid_grade']['green']}",
+                "impact": "Content requires more education than a general audience has",
+                "solution": "Use shorter sentences and simpler words to bring the grade level down"
+            })
+
+        level = self._level('avg_sentence_length', sentence_length, higher_is_better=False)
+        if level == 'green':
+            insights["strengths"].append(f"Sentences are concise ({sentence_length:.1f} words on average)")
+        else:
+            target = self.thresholds['avg_sentence_length']['green']
+            insights["problem_areas"].append({
+                "issue": f"Sentences average {sentence_length:.1f} words",
+                "impact": "Long sentences make readers hold several ideas at once",
+                "solution": f"Aim for {target} words or fewer per sentence; split at conjunctions"
+            })
+            insights["recommendations"].append(f"Break long sentences into sentences of about {target} words")
+
+        level = self._level('avg_syllables_per_word', syllables, higher_is_better=False)
+        if level == 'green':
+            insights["strengths"].append("Vocabulary is plain and easy to follow")
+        else:
+            insights["problem_areas"].append({
+                "issue": f"Words average {syllables:.1f} syllables",
+                "impact": "Long words slow reading, especially for non-native speakers",
+                "solution": "Prefer short, common words over long or technical ones where possible"
+            })
+            insights["recommendations"].append("Replace long words with shorter everyday alternatives")
+
+        if self._level('flesch_reading_ease', flesch, higher_is_better=True) == 'green':
+            insights["strengths"].append("Overall reading ease is good")
+        if scored and not red:
+            insights["strengths"].append("No paragraph falls into the difficult range")
+
+        if not insights["recommendations"]:
+            insights["recommendations"].append("Keep the current style; readability is within the targets")
+
+        return insights
+
+    def _level(self, metric: str, value: float, higher_is_better: bool) -> str:
+        """Classify a value as green, yellow or red against its thresholds"""
+        thresholds = self.thresholds[metric]
+        if higher_is_better:
+            if value >= thresholds['green']:
+                return 'green'
+            return 'yellow' if value >= thresholds['yellow'] else 'red'
+
+        if value <= thresholds['green']:
+            return 'green'
+        return 'yellow' if value <= thresholds['yellow'] else 'red'
+
+    def _accessibility(self, flesch: float) -> str:
+        """Describe how accessible the content is"""
+        level = self._level('flesch_reading_ease', flesch, higher_is_better=True)
+        if level == 'green':
+            return "Accessible to most readers"
+        elif level == 'yellow':
+            return "Moderately accessible; some passages take effort"
+        return "Difficult for readers outside the field"
+
+    def _target_audience(self, grade: float) -> str:
+        """Describe who can easily read the content"""
+        level = self._level('flesch_kincaid_grade', grade, higher_is_better=False)
+        if level == 'green':
+            return "General audience, including non-native speakers"
+        elif level == 'yellow':
+            return "Readers with high-school reading skills"
+        return "Specialists and readers with college-level reading skills"
@@ -0,0 +1,165 @@
+import asyncio
+import multiprocessing
+import multiprocessing.util
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterable, List, Tuple
+
+from config import READABILITY_POOL_WORKERS, READABILITY_POOL_CHUNK_SIZE
+
+# How long ascore waits for more documents before sending a partial chunk
+FLUSH_DELAY_SECONDS = 0.02
+
+_scorer = None
+_interpreter = None
+
+
+def _init_worker():
+    """
+    Build the scorer and interpreter once per worker process
+
+    Pool workers exit without running atexit handlers, so the syllable cache
+    is saved by a multiprocessing finalizer, which runs when the worker
+    shuts down cleanly.
+    """
+    global _scorer, _interpreter
+    from utils.readability_interpreter import ReadabilityInterpreter
+    from utils.readability_scorer import ReadabilityScorer
+    _scorer = ReadabilityScorer()
+    _interpreter = ReadabilityInterpreter()
+
+    cache = _scorer.engine.cache
+    multiprocessing.util.Finalize(cache, cache.save, exitpriority=10)
+
+
+def score_chunk(contents: List[str]) -> Tuple[List[Dict[str, Any]], Dict[str, int]]:
+    """
+    Score and interpret a chunk of documents in a worker process
+
+    Returns the scores, with rule-based ai_insights, and the chunk's syllable
+    cache hits and misses.
+    """
+    cache = _scorer.engine.cache
+    hits, misses = cache.hits, cache.misses
+
+    results = []
+    for content in contents:
+        scores = _scorer.score(content)
+        scores['ai_insights'] = _interpreter.interpret(scores['metrics'], scores['paragraph_analysis'])
+        results.append(scores)
+
+    return results, {'hits': cache.hits - hits, 'misses': cache.misses - misses}
+
+
+class ReadabilityPool:
+    """
+    Scores readability across worker processes, without any LLM calls
+
+    Documents travel to workers as plain text in chunks of chunk_size and come
+    back as plain dictionaries, so nothing is shared between processes and
+    throughput scales with the number of cores.
+    """
+
+    def __init__(self, max_workers: int = READABILITY_POOL_WORKERS, chunk_size: int = READABILITY_POOL_CHUNK_SIZE):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.chunk_size = max(chunk_size, 1)
+        self.hits = 0
+        self.misses = 0
+
+        self._executor = None
+        self._pending = []
+        self._flush_handle = None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """Start the worker processes on first use"""
+        if self._executor is None:
+            # Spawned workers do not inherit the parent's threads, sockets or event loop
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context('spawn'),
+                initializer=_init_worker
+            )
+        return self._executor
+
+    def score_many(self, contents: Iterable[str]) -> List[Dict[str, Any]]:
+        """Score documents in order, spreading chunks over the workers"""
+        contents = list(contents)
+        chunks = [contents[i:i + self.chunk_size] for i in range(0, len(contents), self.chunk_size)]
+
+        results = []
+        for chunk_results, cache_stats in self._get_executor().map(score_chunk, chunks):
+            results.extend(chunk_results)
+            self._record_stats(cache_stats)
+        return results
+
+    async def ascore(self, content: str) -> Dict[str, Any]:
+        """
+        Score one document from async code
+
+        Concurrent calls are gathered into chunks, so callers that produce
+        documents one at a time still send workers full work units.
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((content, future))
+
+        if len(self._pending) >= self.chunk_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(FLUSH_DELAY_SECONDS, self._flush)
+
+        return await future
+
+    def _flush(self):
+        """Send the pending documents to a worker as one chunk"""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        pending, self._pending = self._pending, []
+        if not pending:
+            return
+
+        loop = asyncio.get_running_loop()
+        chunk_future = loop.run_in_executor(self._get_executor(), score_chunk, [content for content, _ in pending])
+
+        def deliver(done):
+            if done.exception() is not None:
+                for _, future in pending:
+                    if not future.done():
+                        future.set_exception(done.exception())
+                return
+
+            chunk_results, cache_stats = done.result()
+            self._record_stats(cache_stats)
+            for (_, future), result in zip(pending, chunk_results):
+                if not future.done():
+                    future.set_result(result)
+
+        chunk_future.add_done_callback(deliver)
+
+    def _record_stats(self, cache_stats: Dict[str, int]):
+        self.hits += cache_stats['hits']
+        self.misses += cache_stats['misses']
+
+    def stats(self) -> Dict[str, Any]:
+        """Return syllable cache hits and misses summed over all workers"""
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'workers': self.max_workers
+        }
+
+    def close(self):
+        """Stop the worker processes"""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,130 @@
+from typing import Any, Dict, List
+
+from config import READABILITY_THRESHOLDS
+from utils.readability_engine import get_readability_engine
+
+
+class ReadabilityScorer:
+    """
+    Readability metrics, paragraph scores and visualization data for a text
+
+    Pure local computation with no LLM involved, used by the readability agent
+    and by the metrics-only batch mode.
+    """
+
+    def __init__(self):
+        self.engine = get_readability_engine()
+
+    def score(self, content: str) -> Dict[str, Any]:
+        """Score content, tokenizing it once"""
+        analysis = self.engine.analyze(content)
+        paragraph_scores = self._analyze_paragraphs(analysis)
+
+        return {
+            'metrics': self._calculate_readability_metrics(analysis),
+            'paragraph_analysis': paragraph_scores,
+            'visualization_data': self.prepare_visualization_data(paragraph_scores)
+        }
+
+    def _calculate_readability_metrics(self, analysis: Dict[str, Any]) -> Dict[str, Any]:
+        """Aggregate document-level readability metrics from the paragraph analysis"""
+        if not analysis['counts']['words'].sum():
+            return {"error": "No readable content found"}
+
+        try:
+            metrics = self.engine.document_metrics(analysis)
+
+            # Add interpretations
+            metrics['readability_level'] = self._interpret_flesch_score(metrics['flesch_reading_ease'])
+            metrics['grade_level'] = self._interpret_grade_level(metrics['flesch_kincaid_grade'])
+
+            return metrics
+
+        except Exception as e:
+            return {"error": f"Readability calculation failed: {e}"}
+
+    def _analyze_paragraphs(self, analysis: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Analyze readability of individual paragraphs"""
+        counts = analysis['counts']
+        scores = analysis['scores']
+        paragraph_scores = []
+
+        for i, paragraph in enumerate(analysis['paragraphs']):
+            word_count = int(counts['words'][i])
+            if word_count < 5:  # Skip very short paragraphs
+                continue
+
+            flesch_score = float(scores['flesch_reading_ease'][i])
+
+            paragraph_scores.append({
+                'paragraph_number': i + 1,
+                'text_preview': paragraph[:100] + "..." if len(paragraph) > 100 else paragraph,
+                'flesch_score': flesch_score,
+                'grade_level': float(scores['flesch_kincaid_grade'][i]),
+                'color': self._get_readability_color(flesch_score),
+                'word_count': word_count,
+                'sentence_count': max(int(counts['sentences'][i]), 1),
+                'readability_level': self._interpret_flesch_score(flesch_score)
+            })
+
+        return paragraph_scores
+
+    def _interpret_flesch_score(self, score: float) -> str:
+        """Interpret Flesch Reading Ease score"""
+        if score >= 90:
+            return "Very Easy"
+        elif score >= 80:
+            return "Easy"
+        elif score >= 70:
+            return "Fairly Easy"
+        elif score >= 60:
+            return "Standard"
+        elif score >= 50:
+            return "Fairly Difficult"
+        elif score >= 30:
+            return "Difficult"
+        else:
+            return "Very Difficult"
+
+    def _interpret_grade_level(self, grade: float) -> str:
+        """Interpret grade level score"""
+        if grade <= 6:
+            return "Elementary School"
+        elif grade <= 8:
+            return "Middle School"
+        elif grade <= 12:
+            return "High School"
+        elif grade <= 16:
+            return "College"
+        else:
+            return "Graduate Level"
+
+    def _get_readability_color(self, flesch_score: float) -> str:
+        """Get color coding for readability score"""
+        thresholds = READABILITY_THRESHOLDS['flesch_reading_ease']
+        if flesch_score >= thresholds['green']:
+            return "green"  # Easy to read
+        elif flesch_score >= thresholds['yellow']:
+            return "yellow"  # Moderate difficulty
+        else:
+            return "red"  # Difficult to read
+
+    def prepare_visualization_data(self, paragraph_scores: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Prepare data for visualization"""
+        colors = {'green': 0, 'yellow': 0, 'red': 0}
+        scores = []
+
+        for para in paragraph_scores:
+            if 'color' in para:
+                colors[para['color']] += 1
+                scores.append(para['flesch_score'])
+
+        return {
+            'color_distribution': colors,
+            'score_range': {
+                'min': min(scores) if scores else 0,
+                'max': max(scores) if scores else 0,
+                'avg': sum(scores) / len(scores) if scores else 0
+            },
+            'total_paragraphs': len(paragraph_scores)
+        }
@@ -0,0 +1,47 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional
+
+from config import APP_RESULT_CACHE_MAX_ENTRIES, APP_RESULT_CACHE_TTL_SECONDS
+
+
+class ResultCache:
+    """
+    Thread-safe in-memory cache of processing results with a TTL
+
+    Entries expire ttl_seconds after they were stored; beyond max_entries the
+    least recently used entry is evicted. The Streamlit app keeps one
+    instance per server process so every session shares it.
+    """
+
+    def __init__(self, ttl_seconds: float = APP_RESULT_CACHE_TTL_SECONDS,
+                 max_entries: int = APP_RESULT_CACHE_MAX_ENTRIES):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Dict[str, Any]]:
+        """Return the stored result for key, or None if missing or expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            stored_at, result = entry
+            if time.monotonic() - stored_at > self.ttl_seconds:
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return result
+
+    def put(self, key: Hashable, result: Dict[str, Any]):
+        """Store a result, evicting the least recently used entries beyond max_entries"""
+        with self._lock:
+            self._entries[key] = (time.monotonic(), result)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
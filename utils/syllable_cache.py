@@ -0,0 +1,124 @@
+import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Tuple
+
+from config import SYLLABLE_CACHE_MAX_ENTRIES, SYLLABLE_CACHE_PATH
+
+WordStats = Tuple[int, bool]
+
+
+class SyllableCache:
+    """
+    Bounded LRU of per-word statistics: syllable count and whether the word
+    is on the familiar-word list
+
+    Documentation reuses the same vocabulary on every page, so after a few
+    documents nearly every word is a hit. The most recently used entries can
+    be saved to a JSON file that warm-starts the next process.
+    """
+
+    def __init__(self, max_entries: int = SYLLABLE_CACHE_MAX_ENTRIES, path: str = SYLLABLE_CACHE_PATH):
+        self.max_entries = max_entries
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self.warm_entries = 0
+        self._dirty = False
+
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+        if path:
+            self._load()
+
+    def lookup(self, words: List[str], compute: Callable[[str], WordStats]) -> List[WordStats]:
+        """
+        Return the statistics of every word, computing only the misses
+
+        Hits and misses are counted per word occurrence, so repeats within a
+        document count as hits.
+        """
+        with self._lock:
+            known = {}
+            for word in words:
+                if word in known:
+                    continue
+                stats = self._entries.get(word)
+                if stats is not None:
+                    self._entries.move_to_end(word)
+                    known[word] = stats
+
+        missing = {word for word in words if word not in known}
+        computed = {word: compute(word) for word in missing}
+        known.update(computed)
+
+        with self._lock:
+            self.misses += len(missing)
+            self.hits += len(words) - len(missing)
+            for word, stats in computed.items():
+                self._entries[word] = stats
+            self._dirty = self._dirty or bool(computed)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+        return [known[word] for word in words]
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters and the current number of entries"""
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'entries': len(self._entries),
+            'warm_entries': self.warm_entries
+        }
+
+    def _read_saved(self) -> Dict[str, Any]:
+        """Read the warm-start file, treating a missing or corrupt file as empty"""
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                saved = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return saved if isinstance(saved, dict) else {}
+
+    def _load(self):
+        """Warm-start from the saved dictionary"""
+        saved = self._read_saved()
+        for word, (syllables, familiar) in list(saved.items())[-self.max_entries:]:
+            self._entries[word] = (int(syllables), bool(familiar))
+        self.warm_entries = len(self._entries)
+
+    def save(self):
+        """
+        Write the entries to the warm-start file if new words were added, least recently used first
+
+        Words other processes saved since this one started are kept, ahead of
+        this process's entries, so several workers sharing the file do not
+        drop each other's words.
+        """
+        if not self.path or not self._dirty:
+            return
+
+        saved = self._read_saved()
+        with self._lock:
+            merged = OrderedDict((word, stats) for word, stats in saved.items() if word not in self._entries)
+            merged.update(self._entries)
+            data = json.dumps(OrderedDict(list(merged.items())[-self.max_entries:]), separators=(',', ':'))
+            self._dirty = False
+
+        directory = os.path.dirname(self.path) or '.'
+        os.makedirs(directory, exist_ok=True)
+
+        fd, tmp_path = tempfile.mkstemp(dir=directory)
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(data)
+            os.replace(tmp_path, self.path)
+        except Exception:
+            os.unlink(tmp_path)
+            raise
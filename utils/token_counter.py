@@ -0,0 +1,75 @@
+import json
+import threading
+from typing import Dict
+
+# Rough characters per token for English text, used when no tokenizer is available
+CHARS_PER_TOKEN = 4
+TRUNCATION_MARKER = "\n[... truncated to fit the token budget]"
+
+
+class TokenCounter:
+    """
+    Counts and truncates text in model tokens
+
+    Uses the model's tiktoken encoding. tiktoken downloads its encoding files
+    on first use; where that is impossible, counts fall back to an estimate of
+    one token per four characters.
+    """
+
+    def __init__(self, model: str):
+        self.model = model
+        self.encoding = self._load_encoding(model)
+
+    def _load_encoding(self, model: str):
+        """Return the tiktoken encoding for model, or None if it cannot be loaded"""
+        try:
+            import tiktoken
+        except ImportError:
+            return None
+
+        try:
+            try:
+                return tiktoken.encoding_for_model(model)
+            except KeyError:
+                return tiktoken.get_encoding("cl100k_base")
+        except Exception as e:
+            print(f"⚠️ Token counts are estimated; tiktoken encoding unavailable: {e.__class__.__name__}")
+            return None
+
+    def count(self, text: str) -> int:
+        """Return the number of tokens in text"""
+        if not text:
+            return 0
+        if self.encoding is None:
+            return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+        return len(self.encoding.encode(text, disallowed_special=()))
+
+    def truncate(self, text: str, max_tokens: int) -> str:
+        """Cut text to at most max_tokens tokens, marking the cut"""
+        if self.count(text) <= max_tokens:
+            return text
+
+        keep = max(max_tokens - self.count(TRUNCATION_MARKER), 0)
+        if self.encoding is None:
+            return text[:keep * CHARS_PER_TOKEN] + TRUNCATION_MARKER
+        return self.encoding.decode(self.encoding.encode(text, disallowed_special=())[:keep]) + TRUNCATION_MARKER
+
+
+def compact_json(text: str) -> str:
+    """Re-serialize a JSON string without indentation; other text is returned unchanged"""
+    try:
+        return json.dumps(json.loads(text), separators=(',', ':'), ensure_ascii=False)
+    except (TypeError, ValueError):
+        return text
+
+
+_counters: Dict[str, TokenCounter] = {}
+_counters_lock = threading.Lock()
+
+
+def get_token_counter(model: str) -> TokenCounter:
+    """Return the shared counter for a model; encodings are loaded once per process"""
+    with _counters_lock:
+        if model not in _counters:
+            _counters[model] = TokenCounter(model)
+        return _counters[model]
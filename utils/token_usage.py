@@ -0,0 +1,86 @@
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, List, Optional
+
+
+class UsageCollector:
+    """Records the token usage of every agent call made while it is active"""
+
+    def __init__(self, parent: 'UsageCollector' = None):
+        self.calls: List[Dict[str, Any]] = []
+        self.parent = parent
+        self._lock = threading.Lock()
+
+    def record(self, agent: str, tokens_in: int, tokens_out: int, cached: bool = False,
+               budget: int = None, truncated: List[str] = None, latency: float = None,
+               first_chunk: float = None):
+        """Record one agent call; latency and first_chunk are seconds spent waiting on the LLM"""
+        with self._lock:
+            self.calls.append({
+                'agent': agent,
+                'tokens_in': tokens_in,
+                'tokens_out': tokens_out,
+                'cached': cached,
+                'budget': budget,
+                'truncated': truncated or [],
+                'latency': latency,
+                'first_chunk': first_chunk
+            })
+
+        # Nested collectors, such as one per pipeline step, also count towards the enclosing one
+        if self.parent is not None:
+            self.parent.record(agent, tokens_in, tokens_out, cached, budget, truncated, latency, first_chunk)
+
+    def summary(self) -> Dict[str, Any]:
+        """Return per-call records with totals overall and per agent"""
+        with self._lock:
+            calls = list(self.calls)
+
+        by_agent = {}
+        for call in calls:
+            totals = by_agent.setdefault(call['agent'], {
+                'calls': 0, 'tokens_in': 0, 'tokens_out': 0, 'cached_calls': 0, 'latency': 0.0
+            })
+            totals['calls'] += 1
+            totals['tokens_in'] += call['tokens_in']
+            totals['tokens_out'] += call['tokens_out']
+            totals['cached_calls'] += int(call['cached'])
+            totals['latency'] += call['latency'] or 0.0
+
+        # Cached responses cost nothing; billed totals leave them out
+        return {
+            'calls': calls,
+            'tokens_in': sum(call['tokens_in'] for call in calls if not call['cached']),
+            'tokens_out': sum(call['tokens_out'] for call in calls if not call['cached']),
+            'by_agent': by_agent
+        }
+
+
+_current_collector: ContextVar[Optional[UsageCollector]] = ContextVar('token_usage_collector', default=None)
+
+
+@contextmanager
+def collect_usage():
+    """
+    Collect token usage of the agent calls made inside the block
+
+    The collector travels with the context, so calls made in tasks and threads
+    started inside the block are recorded too. Blocks may nest; calls are
+    recorded on every enclosing collector.
+    """
+    collector = UsageCollector(parent=_current_collector.get())
+    token = _current_collector.set(collector)
+    try:
+        yield collector
+    finally:
+        _current_collector.reset(token)
+
+
+def record_usage(agent: str, tokens_in: int, tokens_out: int, cached: bool = False,
+                 budget: int = None, truncated: List[str] = None, latency: float = None,
+                 first_chunk: float = None):
+    """Record an agent call on the active collector, if any"""
+    collector = _current_collector.get()
+    if collector is not None:
+        collector.record(agent, tokens_in, tokens_out, cached, budget, truncated, latency, first_chunk)
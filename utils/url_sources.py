@@ -0,0 +1,50 @@
+import xml.etree.ElementTree as ET
+from typing import List
+
+import requests
+
+SITEMAP_NAMESPACE = '{http://www.sitemaps.org/schemas/sitemap/0.9}'
+
+
+def load_url_list(path: str) -> List[str]:
+    """Load URLs from a text file, one per line, ignoring blanks and # comments"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return [line.strip() for line in f if line.strip() and not line.strip().startswith('#')]
+
+
+def load_sitemap(location: str, max_depth: int = 3) -> List[str]:
+    """
+    Load page URLs from a sitemap.xml file or URL
+
+    Sitemap indexes are followed recursively up to max_depth levels. Only
+    the <loc> of each <url> or <sitemap> entry is read, so image and video
+    extension URLs (image:loc, video:content_loc) are not treated as pages.
+    """
+    if location.startswith(('http://', 'https://')):
+        response = requests.get(location, timeout=30)
+        response.raise_for_status()
+        xml_content = response.content
+    else:
+        with open(location, 'rb') as f:
+            xml_content = f.read()
+
+    root = ET.fromstring(xml_content)
+    is_index = root.tag == SITEMAP_NAMESPACE + 'sitemapindex'
+    entry_tag = SITEMAP_NAMESPACE + ('sitemap' if is_index else 'url')
+    locations = [
+        loc.text.strip()
+        for entry in root.findall(entry_tag)
+        for loc in entry.findall(SITEMAP_NAMESPACE + 'loc')
+        if loc.text and loc.text.strip()
+    ]
+
+    if not is_index:
+        return locations
+
+    if max_depth <= 0:
+        return []
+
+    urls = []
+    for sitemap_url in locations:
+        urls.extend(load_sitemap(sitemap_url, max_depth - 1))
+    return urls
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Job workers for the AI Documentation Assistant
+
+Runs local worker processes that take documentation jobs submitted by the
+Streamlit app from the shared SQLite queue. Workers serve jobs submitted
+with the same OPENAI_API_KEY they run with, and split the configured rate
+limits between them. Start this instead of the workers embedded in the app
+(JOB_WORKERS=0) to share one pool between several app processes.
+
+Examples:
+    python worker.py
+    python worker.py --workers 4
+"""
+
+import argparse
+import os
+import sys
+
+from config import JOB_QUEUE_PATH, JOB_WORKERS, LLM_BACKEND
+
+
+def parse_args():
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description="Run background workers for documentation jobs")
+    parser.add_argument('--workers', type=int, default=max(JOB_WORKERS, 1), help="Worker processes to run")
+    parser.add_argument('--queue', default=JOB_QUEUE_PATH, help="SQLite job queue file")
+    return parser.parse_args()
+
+
+def main():
+    """Main worker function"""
+    args = parse_args()
+
+    if LLM_BACKEND == 'openai' and not os.getenv("OPENAI_API_KEY"):
+        print("❌ OPENAI_API_KEY is not set.")
+        sys.exit(1)
+
+    from orchestrator.job_worker import WorkerPool
+
+    pool = WorkerPool(workers=args.workers, path=args.queue)
+    print(f"🚀 Starting {args.workers} workers")
+    print(f"Queue: {args.queue}")
+
+    pool.start()
+    pool.register_key(os.getenv("OPENAI_API_KEY", ""))
+    try:
+        pool.join()
+    except KeyboardInterrupt:
+        print("\n👋 Stopping workers")
+        pool.close()
+
+
+if __name__ == "__main__":
+    main()